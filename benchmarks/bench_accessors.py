@@ -0,0 +1,55 @@
+"""Benchmark accessors and setters against get_state and dispatch_state.
+
+Usage: python benchmarks/bench_accessors.py [--number 100000]
+"""
+
+from __future__ import annotations
+
+import argparse
+import timeit
+
+import redux as rd
+
+
+class _BenchCameraSlice(rd.Slice):
+    exposure: float = 0.0
+    gain: float = 0.0
+    name: str = ""
+
+    @rd.reduce
+    def set_exposure(piece: _BenchCameraSlice, exposure: float) -> _BenchCameraSlice:
+        """set exposure"""
+        return piece.update([(_BenchCameraSlice.exposure, exposure)])
+
+
+class _BenchStore(rd.Store):
+    camera: _BenchCameraSlice
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--number", type=int, default=100_000)
+    args = parser.parse_args()
+
+    rd.create_store(
+        _BenchStore(camera=_BenchCameraSlice(exposure=0.0, gain=0.0, name="camera"))
+    )
+    get_exposure = rd.accessor(_BenchCameraSlice.exposure)
+    set_exposure = rd.setter(_BenchCameraSlice.exposure)
+    dispatch_set_exposure = rd.setter(_BenchCameraSlice.set_exposure)
+    cases = {
+        "get_state": lambda: rd.get_state(_BenchCameraSlice.exposure),
+        "accessor": get_exposure,
+        "dispatch_state": lambda: rd.dispatch_state(_BenchCameraSlice.exposure, 1.0),
+        "setter(state)": lambda: set_exposure(1.0),
+        "dispatch": lambda: rd.dispatch(_BenchCameraSlice.set_exposure, 1.0),
+        "setter(reducer)": lambda: dispatch_set_exposure(1.0),
+    }
+    for name, func in cases.items():
+        seconds = min(timeit.repeat(func, number=args.number, repeat=3))
+        print(f"{name:>16}: {seconds / args.number * 1e9:8.0f} ns/call")
+
+
+if __name__ == "__main__":
+    main()
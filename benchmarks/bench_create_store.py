@@ -0,0 +1,89 @@
+"""Benchmark `create_store` on stores with many slices.
+
+Every generated slice inherits from a shared base slice and declares an extra reducer that
+follows the previous slice, so both base resolution and extra reducer registration scale
+with the number of slices.
+
+Usage: python benchmarks/bench_create_store.py [--slices 100 1000 5000] [--repeat 5]
+"""
+
+from __future__ import annotations
+
+import argparse
+import time
+import types
+from typing import Any
+
+from pydantic import create_model
+
+import redux as rd
+
+
+class _BenchBaseSlice(rd.Slice):
+    label: str = ""
+
+
+def _make_slice(name: str, previous: type[rd.Slice] | None) -> type[rd.Slice]:
+    namespace: dict[str, Any] = {
+        "__module__": __name__,
+        "__annotations__": {"value": int, "gain": float},
+        "value": 0,
+        "gain": 1.0,
+    }
+    if previous is not None:
+
+        def follow(piece: Any, value: int) -> Any:
+            return piece.update([(rd.build_path(name, "value"), value)])
+
+        follow.__qualname__ = f"{name}.follow"
+        namespace["follow"] = rd.extra_reduce(getattr(previous, "value"))(follow)
+    return types.new_class(name, (_BenchBaseSlice,), exec_body=lambda ns: ns.update(namespace))
+
+
+def _make_store(count: int) -> rd.Store:
+    slices: list[type[rd.Slice]] = []
+    for index in range(count):
+        slices.append(
+            _make_slice(f"_BenchSlice{count}_{index}", slices[-1] if slices else None)
+        )
+    store_cls = create_model(  # type: ignore[call-overload]
+        f"_BenchStore{count}",
+        __base__=rd.Store,
+        **{f"slice{index}": (one_slice, ...) for index, one_slice in enumerate(slices)},
+    )
+    return store_cls(
+        **{
+            f"slice{index}": one_slice(value=0, gain=1.0, label="")
+            for index, one_slice in enumerate(slices)
+        }
+    )
+
+
+def _best_of(repeat: int, func) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--slices", type=int, nargs="+", default=[100, 1000, 5000])
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    print(f"{'slices':>8} {'notify (ms)':>12} {'no notify (ms)':>15}")
+    for count in args.slices:
+        store = _make_store(count)
+        notify = _best_of(args.repeat, lambda: rd.create_store(store, recreate=True))
+        no_notify = _best_of(
+            args.repeat, lambda: rd.create_store(store, recreate=True, notify=False)
+        )
+        print(f"{count:>8} {notify * 1e3:>12.2f} {no_notify * 1e3:>15.2f}")
+
+
+if __name__ == "__main__":
+    main()
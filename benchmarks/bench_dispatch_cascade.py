@@ -0,0 +1,93 @@
+"""Benchmark long cascades of dispatches with and without run-to-completion mode.
+
+Every generated slice declares an extra reducer that follows the previous slice, so one
+dispatch to the first slice cascades through all of them. Without run-to-completion mode
+each step of the cascade runs inside the previous one and the cascade fails once it
+exceeds the recursion limit; with it, the steps are queued and the stack stays flat.
+
+Usage: python benchmarks/bench_dispatch_cascade.py [--slices 10 100 1000 5000] [--repeat 5]
+"""
+
+from __future__ import annotations
+
+import argparse
+import time
+import types
+from typing import Any
+
+from pydantic import create_model
+
+import redux as rd
+
+
+def _make_slice(name: str, previous: type[rd.Slice] | None) -> type[rd.Slice]:
+    namespace: dict[str, Any] = {
+        "__module__": __name__,
+        "__annotations__": {"value": int},
+        "value": 0,
+    }
+    if previous is not None:
+
+        def follow(piece: Any, value: int) -> Any:
+            return piece.update([(rd.build_path(name, "value"), value)])
+
+        follow.__qualname__ = f"{name}.follow"
+        namespace["follow"] = rd.extra_reduce(getattr(previous, "value"))(follow)
+    return types.new_class(name, (rd.Slice,), exec_body=lambda ns: ns.update(namespace))
+
+
+def _make_store(count: int) -> tuple[rd.Store, type[rd.Slice]]:
+    slices: list[type[rd.Slice]] = []
+    for index in range(count):
+        slices.append(
+            _make_slice(f"_CascadeSlice{count}_{index}", slices[-1] if slices else None)
+        )
+    store_cls = create_model(  # type: ignore[call-overload]
+        f"_CascadeStore{count}",
+        __base__=rd.Store,
+        **{f"slice{index}": (one_slice, ...) for index, one_slice in enumerate(slices)},
+    )
+    store = store_cls(
+        **{f"slice{index}": one_slice(value=0) for index, one_slice in enumerate(slices)}
+    )
+    return store, slices[0]
+
+
+def _time_cascade(
+    store: rd.Store, first: type[rd.Slice], repeat: int, run_to_completion: bool
+) -> float | None:
+    rd.create_store(store, recreate=True, notify=False, run_to_completion=run_to_completion)
+    set_first = rd.setter(getattr(first, "value"))
+    best = float("inf")
+    for value in range(1, repeat + 1):
+        start = time.perf_counter()
+        try:
+            set_first(value)
+        except RecursionError:
+            return None
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--slices", type=int, nargs="+", default=[10, 100, 1000, 5000])
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    print(f"{'slices':>8} {'recursive (ms)':>15} {'run to completion (ms)':>23}")
+    for count in args.slices:
+        store, first = _make_store(count)
+        results = [
+            _time_cascade(store, first, args.repeat, run_to_completion)
+            for run_to_completion in (False, True)
+        ]
+        cells = [
+            "recursion" if result is None else f"{result * 1e3:.2f}" for result in results
+        ]
+        print(f"{count:>8} {cells[0]:>15} {cells[1]:>23}")
+
+
+if __name__ == "__main__":
+    main()
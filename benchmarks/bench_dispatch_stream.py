@@ -0,0 +1,67 @@
+"""Benchmark folding a stream of samples into a slice with subscribers.
+
+Compares one `rd.dispatch` per sample with `rd.dispatch_stream`, which folds the samples
+through the reducer and commits once every `--flush-every` samples.
+
+Usage: python benchmarks/bench_dispatch_stream.py [--samples 10000] [--flush-every 100]
+"""
+
+from __future__ import annotations
+
+import argparse
+import time
+
+import redux as rd
+
+
+class _SensorSlice(rd.Slice):
+    count: int
+    last: float
+    total: float
+
+    @rd.reduce
+    def add_sample(piece: _SensorSlice, sample: float) -> _SensorSlice:
+        """add a sample"""
+        return piece.update(
+            [
+                (_SensorSlice.count, piece.count + 1),
+                (_SensorSlice.last, sample),
+                (_SensorSlice.total, piece.total + sample),
+            ]
+        )
+
+
+class _Store(rd.Store):
+    sensor: _SensorSlice
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--samples", type=int, default=10000)
+    parser.add_argument("--flush-every", type=int, default=100)
+    args = parser.parse_args()
+
+    samples = [float(i % 100) for i in range(args.samples)]
+    times = {}
+    for name in ("dispatch", "dispatch_stream"):
+        rd.create_store(
+            _Store(sensor=_SensorSlice(count=0, last=0.0, total=0.0)), recreate=True
+        )
+        for state in (_SensorSlice.count, _SensorSlice.last, _SensorSlice.total):
+            rd.subscribe(state)(lambda _: None)
+        start = time.perf_counter()
+        if name == "dispatch":
+            for sample in samples:
+                rd.dispatch(_SensorSlice.add_sample, sample)
+        else:
+            rd.dispatch_stream(_SensorSlice.add_sample, samples, flush_every=args.flush_every)
+        times[name] = time.perf_counter() - start
+        assert rd.get_state(_SensorSlice.count) == args.samples
+    for name, elapsed in times.items():
+        print(f"{name:>16} {elapsed / args.samples * 1e6:>10.2f} us/sample")
+    print(f"{'speedup':>16} {times['dispatch'] / times['dispatch_stream']:>10.1f}x")
+
+
+if __name__ == "__main__":
+    main()
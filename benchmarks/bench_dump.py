@@ -0,0 +1,75 @@
+"""Benchmark serializing a store in which one slice changes between dumps.
+
+Compares `get_store().model_dump_json()`, which serializes every slice, with
+`rd.dump_bytes()`, which reuses the serialized form of the slices that did not change.
+
+Usage: python benchmarks/bench_dump.py [--slices 50] [--number 1000] [--repeat 5]
+"""
+
+from __future__ import annotations
+
+import argparse
+import timeit
+import types
+from typing import Any
+
+from pydantic import create_model
+
+import redux as rd
+
+
+def _make_slice(name: str) -> type[rd.Slice]:
+    namespace: dict[str, Any] = {
+        "__module__": __name__,
+        "__annotations__": {"value": int, "samples": list[float], "label": str},
+    }
+    return types.new_class(name, (rd.Slice,), exec_body=lambda ns: ns.update(namespace))
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--slices", type=int, default=50)
+    parser.add_argument("--number", type=int, default=1000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    slices = [_make_slice(f"_BenchDumpSlice{index}") for index in range(args.slices)]
+    store_cls = create_model(  # type: ignore[call-overload]
+        "_BenchDumpStore",
+        __base__=rd.Store,
+        **{f"slice{index}": (one_slice, ...) for index, one_slice in enumerate(slices)},
+    )
+    rd.create_store(
+        store_cls(
+            **{
+                f"slice{index}": one_slice(
+                    value=0, samples=[float(i) for i in range(100)], label=f"slice {index}"
+                )
+                for index, one_slice in enumerate(slices)
+            }
+        ),
+        recreate=True,
+    )
+    set_value = rd.setter(slices[0].value)
+    counter = iter(range(10**9))
+
+    def full() -> None:
+        set_value(next(counter))
+        rd.get_store().model_dump_json()
+
+    def cached() -> None:
+        set_value(next(counter))
+        rd.dump_bytes()
+
+    full_time, cached_time = (
+        min(timeit.repeat(func, number=args.number, repeat=args.repeat)) / args.number
+        for func in (full, cached)
+    )
+    print(f"{'model_dump_json':>16} {full_time * 1e6:>10.1f} us")
+    print(f"{'dump_bytes':>16} {cached_time * 1e6:>10.1f} us")
+    print(f"{'speedup':>16} {full_time / cached_time:>10.1f}x")
+
+
+if __name__ == "__main__":
+    main()
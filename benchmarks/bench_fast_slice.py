@@ -0,0 +1,75 @@
+"""Benchmark updating and dispatching to a `FastSlice` against a `Slice`.
+
+Both slices declare the same counter states. The benchmark measures `update`, reading a
+state from an instance, and `dispatch_state` through a setter in a store holding both.
+
+Usage: python benchmarks/bench_fast_slice.py [--number 100000] [--repeat 5]
+"""
+
+from __future__ import annotations
+
+import argparse
+import timeit
+
+import redux as rd
+
+
+class _BenchCountersSlice(rd.Slice):
+    frames: int = 0
+    dropped: int = 0
+    fps: float = 0.0
+    temperature: float = 0.0
+
+
+class _BenchFastCountersSlice(rd.FastSlice):
+    frames: int = 0
+    dropped: int = 0
+    fps: float = 0.0
+    temperature: float = 0.0
+
+
+class _BenchStore(rd.Store):
+    counters: _BenchCountersSlice
+    fast_counters: _BenchFastCountersSlice
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--number", type=int, default=100_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    slice_ = _BenchCountersSlice(frames=0, dropped=0, fps=0.0, temperature=0.0)
+    fast_slice = _BenchFastCountersSlice()
+    rd.create_store(_BenchStore(counters=slice_, fast_counters=fast_slice), recreate=True)
+    set_frames = rd.setter(_BenchCountersSlice.frames)
+    set_fast_frames = rd.setter(_BenchFastCountersSlice.frames)
+    path = _BenchCountersSlice.frames
+    fast_path = _BenchFastCountersSlice.frames
+
+    cases = {
+        "update": (
+            lambda: slice_.update(((path, 1),)),
+            lambda: fast_slice.update(((fast_path, 1),)),
+        ),
+        "read state": (lambda: slice_.frames, lambda: fast_slice.frames),
+        "dispatch": (
+            lambda counter=iter(range(10**9)): set_frames(next(counter)),
+            lambda counter=iter(range(10**9)): set_fast_frames(next(counter)),
+        ),
+    }
+    print(f"{'operation':>12} {'Slice (us)':>12} {'FastSlice (us)':>15} {'speedup':>8}")
+    for name, (slow, fast) in cases.items():
+        slow_time, fast_time = (
+            min(timeit.repeat(func, number=args.number, repeat=args.repeat)) / args.number
+            for func in (slow, fast)
+        )
+        print(
+            f"{name:>12} {slow_time * 1e6:>12.3f} {fast_time * 1e6:>15.3f}"
+            + f" {slow_time / fast_time:>7.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,95 @@
+"""Benchmark importing a library of many slices, of which only a few are used.
+
+A module declaring the slices is generated in a temporary directory and imported by a new
+interpreter, which then creates a store with 3 of the slices. The slices build their
+schema lazily by default; the eager column builds every schema at definition time, as
+slices did before.
+
+Usage: python benchmarks/bench_import.py [--slices 100 500 2000] [--repeat 5]
+"""
+
+from __future__ import annotations
+
+import argparse
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+_RUN = """
+import time
+import redux as rd
+start = time.perf_counter()
+import slice_library
+imported = time.perf_counter()
+
+class Store(rd.Store):
+    first: slice_library.Slice0
+    second: slice_library.Slice1
+    third: slice_library.Slice2
+
+rd.create_store(Store(first={}, second={}, third={}))
+print(imported - start, time.perf_counter() - imported)
+"""
+
+
+def _write_library(directory: Path, count: int, eager: bool) -> None:
+    config = "    model_config = ConfigDict(defer_build=False)\n" if eager else ""
+    lines = [
+        "from pydantic import ConfigDict",
+        "import redux as rd",
+        "class _LibraryBaseSlice(rd.Slice):",
+        config + "    label: str = ''",
+    ]
+    for index in range(count):
+        lines += [
+            f"class Slice{index}(_LibraryBaseSlice):",
+            "    value: int = 0",
+            "    roi: tuple[int, int, int, int] = (0, 0, 1, 1)",
+            "    @rd.reduce",
+            f"    def set_value(piece: 'Slice{index}', value: int) -> 'Slice{index}':",
+            f"        return piece.update([(Slice{index}.value, value)])",
+        ]
+    (directory / "slice_library.py").write_text("\n".join(lines) + "\n")
+
+
+def _best_of(repeat: int, directory: Path) -> tuple[float, float]:
+    runs = []
+    for _ in range(repeat):
+        output = subprocess.run(
+            [sys.executable, "-c", _RUN],
+            cwd=directory,
+            check=True,
+            capture_output=True,
+            text=True,
+        ).stdout
+        imported, created = (float(value) for value in output.split())
+        runs.append((imported, created))
+    return min(runs)
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--slices", type=int, nargs="+", default=[100, 500, 2000])
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    print(f"{'slices':>8} {'import (ms)':>12} {'eager import (ms)':>18} {'create (ms)':>12}")
+    for count in args.slices:
+        with tempfile.TemporaryDirectory() as directory:
+            # compile the module once, so the runs do not measure it
+            _write_library(Path(directory), count, eager=False)
+            _best_of(1, Path(directory))
+            imported, created = _best_of(args.repeat, Path(directory))
+            _write_library(Path(directory), count, eager=True)
+            _best_of(1, Path(directory))
+            eager_imported, _ = _best_of(args.repeat, Path(directory))
+        print(
+            f"{count:>8} {imported * 1e3:>12.1f} {eager_imported * 1e3:>18.1f} "
+            + f"{created * 1e3:>12.2f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -2,33 +2,88 @@
 
 __all__ = [
     "Slice",
+    "FastSlice",
+    "computed",
+    "produce",
+    "Patch",
+    "EntityAdapter",
+    "EntityState",
     "Store",
     "reduce",
     "extra_reduce",
     "create_store",
+    "inject_slice",
+    "remove_slice",
+    "lazy",
+    "evict_idle",
+    "snapshot",
+    "StoreSnapshot",
     "get_state",
     "get_slice",
     "get_store",
     "dispatch",
     "dispatch_slice",
     "dispatch_state",
+    "dispatch_stream",
+    "set_offload_executor",
     "subscribe",
+    "subscribe_slice",
+    "drain_notifications",
+    "set_idle_scheduler",
+    "listen",
+    "RingBuffer",
+    "dispatch_append",
+    "subscribe_appends",
     "force_notify",
     "build_path",
+    "StateChange",
+    "get_revision",
+    "set_change_log_size",
+    "changes_since",
+    "diff",
+    "dump_json",
+    "dump_bytes",
+    "accessor",
+    "setter",
+    "serve",
+    "connect",
+    "QueryCache",
+    "QueryEndpoint",
+    "QueryResult",
+    "QuerySlice",
+    "QuerySubscription",
+    "trace",
 ]
 
-from .slice import Slice, build_path
+from .accessor import accessor, setter
+from .changes import StateChange, changes_since, diff
+from .draft import Patch, produce
+from .entity import EntityAdapter, EntityState
+from .export import dump_bytes, dump_json
+from .fast_slice import FastSlice
+from .injection import inject_slice, remove_slice
+from .lazy import lazy
+from .listener import listen
+from .offload import set_offload_executor
+from .priority import drain_notifications, set_idle_scheduler
+from .query import QueryCache, QueryEndpoint, QueryResult, QuerySlice, QuerySubscription
+from .reducers import dispatch, extra_reduce, reduce
+from .ring import RingBuffer, dispatch_append, subscribe_appends
+from .slice import Slice, build_path, computed
+from .snapshots import StoreSnapshot, snapshot
 from .store import (
     Store,
     create_store,
-    dispatch,
     dispatch_slice,
     dispatch_state,
-    extra_reduce,
-    force_notify,
+    evict_idle,
+    get_revision,
     get_slice,
     get_state,
     get_store,
-    reduce,
-    subscribe,
+    set_change_log_size,
 )
+from .stream import dispatch_stream
+from .subscriptions import force_notify, subscribe, subscribe_slice
+from .sync import connect, serve
+from .tracing import trace
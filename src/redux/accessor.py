@@ -0,0 +1,185 @@
+"""Precompiled state accessors and setters for hot loops."""
+
+# Access to protected members of the store module
+# pylint: disable=W0212
+
+from __future__ import annotations
+
+import time
+from collections.abc import Callable
+from typing import Any, Generic, TypeVar, cast, overload
+
+from . import store as _store
+from .lazy import _LazyEntry
+from .offload import _OFFLOADED_REDUCERS, _offload
+from .reducers import _dispatch_reducer, _reduce_and_commit
+from .slice import Slice, StatePath
+
+__all__ = ["Accessor", "Setter", "accessor", "setter"]
+
+AnyState = TypeVar("AnyState")
+
+
+class Accessor(Generic[AnyState]):  # pylint: disable=R0903
+    """Read one state of the store, resolving its slice only when the store changes.
+
+    Use `redux.accessor` to create one.
+    """
+
+    __slots__ = ("path", "_generation", "_root_slice_name", "_lazy_entry")
+
+    def __init__(self, path: StatePath) -> None:
+        if not isinstance(path, StatePath):
+            raise TypeError(f"Expected a StatePath, got {type(path)}")
+        self.path = path
+        self._generation = -1
+        self._root_slice_name = ""
+        # reads of a lazy slice keep it from being evicted, like `get_state`
+        self._lazy_entry: _LazyEntry | None = None
+
+    def _resolve(self) -> None:
+        _store._check_store_init()
+        assert _store.STORE is not None, "Store not initialized"
+        root_slice_name = _store._get_root_slice_name(self.path.slice_name)
+        if not _store.STORE[root_slice_name].has_state(self.path.state):
+            raise KeyError(
+                f"State '{self.path.state}' not found in slice '{self.path.slice_name}'"
+            )
+        self._root_slice_name = root_slice_name
+        self._lazy_entry = _store._LAZY_SLICES.get(root_slice_name)
+        self._generation = _store._STORE_GENERATION
+
+    def __call__(self) -> AnyState:
+        if self._generation != _store._STORE_GENERATION:
+            self._resolve()
+        if self._lazy_entry is not None:
+            self._lazy_entry.last_used = time.monotonic()
+        return getattr(_store.STORE[self._root_slice_name], self.path.state)  # type: ignore
+
+
+class Setter(Generic[AnyState]):  # pylint: disable=R0903
+    """Dispatch to one state or reducer, resolving its slice only when the store changes.
+
+    Use `redux.setter` to create one.
+    """
+
+    __slots__ = ("target", "_generation", "_root_slice_name")
+
+    def __init__(self, target: StatePath | Callable[..., Slice]) -> None:
+        if not isinstance(target, StatePath) and not callable(target):
+            raise TypeError(f"Expected a StatePath or a reducer, got {type(target)}")
+        self.target = target
+        self._generation = -1
+        self._root_slice_name = ""
+
+    def _resolve(self) -> None:
+        _store._check_store_init()
+        assert _store.STORE is not None, "Store not initialized"
+        if isinstance(self.target, StatePath):
+            slice_name = self.target.slice_name
+        else:
+            slice_name = _store._get_slice_name_fm_reducer(self.target)
+        root_slice_name = _store._get_root_slice_name(slice_name)
+        if isinstance(self.target, StatePath) and not _store.STORE[root_slice_name].has_state(
+            self.target.state
+        ):
+            raise KeyError(f"State '{self.target.state}' not found in slice '{slice_name}'")
+        self._root_slice_name = root_slice_name
+        self._generation = _store._STORE_GENERATION
+
+    def __call__(self, payload: AnyState | None = None) -> None:
+        if self._generation != _store._STORE_GENERATION:
+            self._resolve()
+        if self.target in _OFFLOADED_REDUCERS:
+            _offload(self._root_slice_name, self.target, payload)
+        elif _store._TRACER is not None:
+            if isinstance(self.target, StatePath):
+                _store._run_to_completion(
+                    _store._dispatch_state, self._root_slice_name, self.target, payload
+                )
+            else:
+                _store._run_to_completion(
+                    _dispatch_reducer, self._root_slice_name, self.target, payload
+                )
+        elif _store._RUN_TO_COMPLETION:
+            _store._run_to_completion(_store._transaction, self._apply, payload)
+        else:
+            _store._transaction(self._apply, payload)
+
+    def _apply(self, payload: AnyState | None) -> None:
+        root_slice_name = self._root_slice_name
+        old_slice = cast(dict[str, Slice], _store.STORE)[root_slice_name]
+        if isinstance(self.target, StatePath):
+            new_slice = old_slice.update(((self.target, payload),))
+        elif self.target in _store._REDUCER_MEMOS:
+            _reduce_and_commit(root_slice_name, self.target, payload)
+            return
+        elif payload is None:
+            new_slice = self.target(old_slice)
+        else:
+            new_slice = self.target(old_slice, payload)
+        _store._commit(root_slice_name, new_slice)
+
+
+@overload
+def accessor(path: StatePath) -> Accessor[Any]: ...
+
+
+@overload
+def accessor(path: AnyState) -> Accessor[AnyState]: ...
+
+
+def accessor(path) -> Accessor:
+    """Create a function that reads a state of the store.
+
+    The slice holding the state is resolved on the first call and again only after the
+    store is recreated or slices are injected or removed, so each call costs a dictionary
+    lookup and an attribute access.
+
+    Args:
+        path: The state to read. Can be represented as `SliceName.state_name` or
+            `redux.build_path("SliceName", "state_name")`.
+
+    Example:
+
+    ```python
+    import redux as rd
+
+    get_exposure = rd.accessor(CameraSlice.exposure)
+    set_exposure = rd.setter(CameraSlice.exposure)
+
+    for _ in range(1000):
+        set_exposure(get_exposure() * 1.01)
+    ```
+    """
+    return Accessor(path)
+
+
+@overload
+def setter(target: StatePath) -> Setter[Any]: ...
+
+
+@overload
+def setter(target: Callable[[Any, AnyState], Any]) -> Setter[AnyState]: ...
+
+
+@overload
+def setter(target: Callable[[Any], Any]) -> Setter[None]: ...
+
+
+@overload
+def setter(target: AnyState) -> Setter[AnyState]: ...
+
+
+def setter(target) -> Setter:
+    """Create a function that dispatches to a state or a reducer.
+
+    Calling the setter of a state with a payload is equivalent to `dispatch_state`, and
+    calling the setter of a reducer is equivalent to `dispatch`. Like `accessor`, the
+    slice is only resolved again after the store is recreated or slices are injected or
+    removed.
+
+    Args:
+        target: The state to change, or a reducer declared with `redux.reduce`.
+    """
+    return Setter(target)
@@ -0,0 +1,157 @@
+"""State changes between revisions of the store, and between two stores."""
+
+from __future__ import annotations
+
+from collections import deque
+from typing import TYPE_CHECKING, Any, NamedTuple
+
+if TYPE_CHECKING:
+    from .slice import Slice
+    from .store import Store
+
+__all__ = ["StateChange", "changes_since", "diff"]
+
+
+class StateChange(NamedTuple):
+    """A state that changed between two versions of the store."""
+
+    slice_name: str
+    state: str
+    old: Any
+    new: Any
+
+
+# recent changes as (revision, change), used by `changes_since`
+_CHANGE_LOG: deque[tuple[int, StateChange]] = deque(maxlen=1024)
+# `changes_since` needs every change made after the revision it is given
+_CHANGE_LOG_COMPLETE_SINCE: int = 0
+
+
+def _clear_change_log(revision: int) -> None:
+    global _CHANGE_LOG_COMPLETE_SINCE  # pylint: disable=W0603
+    _CHANGE_LOG.clear()
+    _CHANGE_LOG_COMPLETE_SINCE = revision
+
+
+def _resize_change_log(size: int, revision: int) -> None:
+    global _CHANGE_LOG  # pylint: disable=W0603
+    if size < 0:
+        raise ValueError(f"Expected a non-negative size, got {size}")
+    _CHANGE_LOG = deque(maxlen=size)
+    _clear_change_log(revision)
+
+
+def _log_changes(
+    revision: int,
+    root_slice_name: str,
+    old_slice: Slice,
+    new_slice: Slice,
+    changed_states: list[str],
+) -> None:
+    global _CHANGE_LOG_COMPLETE_SINCE  # pylint: disable=W0603
+    if _CHANGE_LOG.maxlen == 0:
+        _CHANGE_LOG_COMPLETE_SINCE = revision
+        return
+    for state_name in changed_states:
+        if len(_CHANGE_LOG) == _CHANGE_LOG.maxlen:
+            _CHANGE_LOG_COMPLETE_SINCE = _CHANGE_LOG[0][0]
+        _CHANGE_LOG.append(
+            (
+                revision,
+                StateChange(
+                    root_slice_name,
+                    state_name,
+                    getattr(old_slice, state_name),
+                    getattr(new_slice, state_name),
+                ),
+            )
+        )
+
+
+def changes_since(revision: int) -> list[StateChange]:
+    """Get the states changed since `revision` of the store.
+
+    Several changes of the same state are merged into one, from the value it had at
+    `revision` to its current value. States that changed back to their value at
+    `revision` are not included.
+
+    Args:
+        revision: A revision returned by `get_revision`.
+
+    Raises:
+        ValueError: If changes made after `revision` are no longer kept. See
+            `set_change_log_size`.
+
+    Example:
+
+    ```python
+    import redux as rd
+
+    revision = rd.get_revision()
+    rd.dispatch_state(CameraSlice.exposure, 0.5)
+    rd.dispatch_state(CameraSlice.exposure, 0.7)
+    assert rd.changes_since(revision) == [
+        rd.StateChange("CameraSlice", "exposure", 0.1, 0.7)
+    ]
+    ```
+    """
+    if revision < _CHANGE_LOG_COMPLETE_SINCE:
+        raise ValueError(
+            f"Changes since revision {revision} are no longer available, "
+            + f"the oldest available revision is {_CHANGE_LOG_COMPLETE_SINCE}"
+        )
+    merged: dict[tuple[str, str], StateChange] = {}
+    for change_revision, change in reversed(_CHANGE_LOG):
+        if change_revision <= revision:
+            break
+        key = (change.slice_name, change.state)
+        if key in merged:
+            merged[key] = merged[key]._replace(old=change.old)
+        else:
+            merged[key] = change
+    return [
+        change
+        for change in reversed(merged.values())
+        if change.old is not change.new and change.old != change.new
+    ]
+
+
+def diff(old_store: Store, new_store: Store) -> list[StateChange]:
+    """Get the states that differ between two snapshots of the store.
+
+    Slices are frozen, so slices that are the same object in both snapshots are skipped
+    without comparing their states.
+
+    Args:
+        old_store: A snapshot returned by `get_store`.
+        new_store: A later snapshot returned by `get_store`.
+
+    Example:
+
+    ```python
+    import redux as rd
+
+    old_store = rd.get_store()
+    rd.dispatch_state(CameraSlice.exposure, 0.5)
+    assert rd.diff(old_store, rd.get_store()) == [
+        rd.StateChange("CameraSlice", "exposure", 0.1, 0.5)
+    ]
+    ```
+    """
+    changes: list[StateChange] = []
+    for name in type(new_store).model_fields:
+        old_slice: Slice | None = getattr(old_store, name, None)
+        new_slice: Slice = getattr(new_store, name)
+        if old_slice is new_slice:
+            continue
+        for state_name in new_slice.model_fields_set:
+            new_state = new_slice.get_state(state_name)
+            if old_slice is None or state_name not in old_slice.model_fields_set:
+                changes.append(StateChange(new_slice.slice_name, state_name, None, new_state))
+                continue
+            old_state = old_slice.get_state(state_name)
+            if old_state is not new_state and old_state != new_state:
+                changes.append(
+                    StateChange(new_slice.slice_name, state_name, old_state, new_state)
+                )
+    return changes
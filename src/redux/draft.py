@@ -0,0 +1,404 @@
+"""Draft proxies to write reducers as mutations of a slice, in the style of Immer."""
+
+# Access to protected members of other drafts
+# pylint: disable=W0212
+
+from __future__ import annotations
+
+from collections.abc import Callable, Iterator, MutableMapping, MutableSequence
+from typing import Any, Literal, NamedTuple, TypeVar
+
+from .slice import StatePath
+
+__all__ = ["Patch", "produce"]
+
+AnySlice = TypeVar("AnySlice")
+
+
+class Patch(NamedTuple):
+    """A change made to a draft, as an operation on the path from the slice to the value.
+
+    The first element of the path is the name of the state, the next ones are the keys and
+    indices of the containers holding the value.
+    """
+
+    op: Literal["add", "remove", "replace"]
+    path: tuple[str | int, ...]
+    value: Any = None
+
+
+# last slice made by `produce`, as (base slice, new slice, changed states), used by the
+# store to only compare the states that changed
+_CHANGE_HINT: tuple[Any, Any, frozenset[str]] | None = None
+
+
+def produce(piece: AnySlice, recipe: Callable[[Any], object]) -> tuple[AnySlice, list[Patch]]:
+    """Make a new slice by mutating a draft of it.
+
+    The recipe receives a draft of the slice. States are assigned as attributes, and lists
+    and dicts held by the states, at any depth, are changed in place. Nothing is copied
+    until it is changed: the new slice shares every state and container the recipe did not
+    change with `piece`, and `piece` itself is returned if nothing changed. Drafts cannot
+    be used once `produce` returns.
+
+    When the new slice is committed to the store, only the states the recipe changed are
+    compared to find the states to notify.
+
+    Args:
+        piece: The slice to start from.
+        recipe: A function changing the draft it receives. Its return value is ignored.
+
+    Returns:
+        The new slice and the patches describing each change, in the order they were made.
+
+    Example:
+
+    ```python
+    import redux as rd
+
+    class PlaylistSlice(rd.Slice):
+        tracks: list[dict[str, str]] = []
+        position: int = 0
+
+        @rd.reduce
+        def rename_track(piece: PlaylistSlice, index: int, title: str) -> PlaylistSlice:
+            def recipe(draft) -> None:
+                draft.tracks[index]["title"] = title
+                draft.position = index
+
+            new_piece, _ = rd.produce(piece, recipe)
+            return new_piece
+    ```
+    """
+    scope: list[_Draft] = []
+    patches: list[Patch] = []
+    draft = _SliceDraft(piece, scope, patches)
+    try:
+        recipe(draft)
+        updates = draft._finalize()
+    finally:
+        for one_draft in scope:
+            object.__setattr__(one_draft, "_revoked", True)
+    if not updates:
+        return piece, patches
+    slice_name = type(piece).__name__
+    new_piece = piece.update(  # type: ignore[attr-defined]
+        [(StatePath(slice_name, state), value) for state, value in updates.items()]
+    )
+    _set_change_hint(piece, new_piece, frozenset(updates))
+    return new_piece, patches
+
+
+def _set_change_hint(base: Any, new: Any, changed: frozenset[str]) -> None:
+    global _CHANGE_HINT  # pylint: disable=W0603
+    # successive calls to `produce` in one reducer add up
+    if _CHANGE_HINT is not None and _CHANGE_HINT[1] is base:
+        base, changed = _CHANGE_HINT[0], _CHANGE_HINT[2] | changed
+    _CHANGE_HINT = (base, new, changed)
+
+
+def _take_change_hint(old_slice: Any, new_slice: Any) -> frozenset[str] | None:
+    """Get the states changed from `old_slice` to `new_slice`, if made by `produce`."""
+    global _CHANGE_HINT  # pylint: disable=W0603
+    hint, _CHANGE_HINT = _CHANGE_HINT, None
+    if hint is None:
+        return None
+    base, new, changed = hint
+    if base is old_slice and new is new_slice:
+        return changed
+    return None
+
+
+def _unwrap(value: Any) -> Any:
+    """Replace the drafts in a value assigned to a draft by what they hold."""
+    if isinstance(value, _Draft):
+        result = value._finalize()
+        value._revoke()
+        return result
+    if isinstance(value, list) and any(isinstance(item, _Draft) for item in value):
+        return [_unwrap(item) for item in value]
+    if isinstance(value, dict) and any(isinstance(item, _Draft) for item in value.values()):
+        return {key: _unwrap(item) for key, item in value.items()}
+    return value
+
+
+class _Draft:
+    """Copy-on-write proxy of a container held by a slice."""
+
+    __slots__ = ("_base", "_copy", "_children", "_parent", "_path", "_scope", "_revoked")
+
+    def __init__(
+        self,
+        base: Any,
+        parent: _Draft | _SliceDraft,
+        path: tuple[str | int, ...],
+        scope: list[_Draft],
+    ) -> None:
+        self._base = base
+        # shallow copy of the base, made on the first change
+        self._copy: Any = None
+        # drafts of the containers held by this one, by key
+        self._children: dict[Any, _Draft] = {}
+        self._parent = parent
+        self._path = path
+        self._scope = scope
+        self._revoked = False
+        scope.append(self)
+
+    def _current(self) -> Any:
+        if self._revoked:
+            raise RuntimeError("Draft used after `produce` returned or after it was replaced")
+        return self._base if self._copy is None else self._copy
+
+    def _child(self, key: Any, value: Any) -> Any:
+        if key in self._children:
+            return self._children[key]
+        draft_type = _DRAFT_TYPES.get(type(value))
+        if draft_type is None:
+            return value
+        child = draft_type(value, self, self._path + (key,), self._scope)
+        self._children[key] = child
+        return child
+
+    def _mark_changed(self) -> None:
+        if self._copy is None:
+            self._copy = self._base.copy()
+            self._parent._mark_changed()
+
+    def _record(self, op: Literal["add", "remove", "replace"], key: Any, value: Any) -> None:
+        self._parent._record_patch(Patch(op, self._path + (key,), value))
+
+    def _record_patch(self, patch: Patch) -> None:
+        self._parent._record_patch(patch)
+
+    def _drop_child(self, key: Any) -> None:
+        child = self._children.pop(key, None)
+        if child is not None:
+            child._revoke()
+
+    def _revoke(self) -> None:
+        self._revoked = True
+        for child in self._children.values():
+            child._revoke()
+
+    def _finalize(self) -> Any:
+        if self._copy is None:
+            return self._base
+        for key, child in self._children.items():
+            self._copy[key] = child._finalize()
+        return self._copy
+
+    def __eq__(self, other: object) -> bool:
+        self._current()
+        if isinstance(other, _Draft):
+            other = other._finalize()
+        return bool(self._finalize() == other)
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        self._current()
+        return f"{type(self).__name__}({self._finalize()!r})"
+
+
+class _ListDraft(_Draft, MutableSequence[Any]):
+    """Copy-on-write proxy of a list held by a slice."""
+
+    __slots__ = ()
+
+    def __len__(self) -> int:
+        return len(self._current())
+
+    def __iter__(self) -> Iterator[Any]:
+        for index in range(len(self)):
+            yield self[index]
+
+    def __getitem__(self, index: Any) -> Any:
+        current = self._current()
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(current)))]
+        index = range(len(current))[index]
+        return self._child(index, current[index])
+
+    def __setitem__(self, index: Any, value: Any) -> None:
+        current = self._current()
+        if isinstance(index, slice):
+            indices = range(*index.indices(len(current)))
+            values = list(value)
+            if indices.step == 1:
+                del self[index]
+                for offset, item in enumerate(values):
+                    self.insert(indices.start + offset, item)
+                return
+            if len(values) != len(indices):
+                raise ValueError(
+                    f"attempt to assign sequence of size {len(values)} "
+                    + f"to extended slice of size {len(indices)}"
+                )
+            for i, item in zip(indices, values):
+                self[i] = item
+            return
+        index = range(len(current))[index]
+        if value is self._children.get(index) or (
+            index not in self._children and value is current[index]
+        ):
+            return
+        value = _unwrap(value)
+        self._mark_changed()
+        self._drop_child(index)
+        self._copy[index] = value
+        self._record("replace", index, value)
+
+    def __delitem__(self, index: Any) -> None:
+        current = self._current()
+        if isinstance(index, slice):
+            for i in sorted(range(*index.indices(len(current))), reverse=True):
+                del self[i]
+            return
+        index = range(len(current))[index]
+        self._shift_children(index)
+        del self._copy[index]
+        self._record("remove", index, None)
+
+    def insert(self, index: int, value: Any) -> None:
+        """Insert `value` before `index`."""
+        index = min(max(index + len(self) if index < 0 else index, 0), len(self))
+        value = _unwrap(value)
+        self._shift_children(index)
+        self._copy.insert(index, value)
+        self._record("add", index, value)
+
+    def sort(self, *, key: Callable[[Any], Any] | None = None, reverse: bool = False) -> None:
+        """Sort the list in place."""
+        values = sorted(self._finalize_items(), key=key, reverse=reverse)  # type: ignore
+        self._replace_all(values)
+
+    def _finalize_items(self) -> list[Any]:
+        self._current()
+        return list(self._finalize())
+
+    def _shift_children(self, index: int) -> None:
+        """Prepare the copy for items to be inserted or deleted at `index`."""
+        self._mark_changed()
+        # the drafts after the index would change path, they are folded into the copy
+        for key in [key for key in self._children if key >= index]:
+            self._copy[key] = self._children[key]._finalize()
+            self._drop_child(key)
+
+    def _replace_all(self, values: list[Any]) -> None:
+        self._mark_changed()
+        for key in list(self._children):
+            self._drop_child(key)
+        self._copy[:] = values
+        self._record_patch(Patch("replace", self._path, list(values)))
+
+
+class _DictDraft(_Draft, MutableMapping[Any, Any]):
+    """Copy-on-write proxy of a dict held by a slice."""
+
+    __slots__ = ()
+
+    def __len__(self) -> int:
+        return len(self._current())
+
+    def __iter__(self) -> Iterator[Any]:
+        return iter(self._current())
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._current()
+
+    def __getitem__(self, key: Any) -> Any:
+        return self._child(key, self._current()[key])
+
+    def __setitem__(self, key: Any, value: Any) -> None:
+        current = self._current()
+        exists = key in current
+        if exists and (
+            value is self._children.get(key)
+            or (key not in self._children and value is current[key])
+        ):
+            return
+        value = _unwrap(value)
+        self._mark_changed()
+        self._drop_child(key)
+        self._copy[key] = value
+        self._record("replace" if exists else "add", key, value)
+
+    def __delitem__(self, key: Any) -> None:
+        if key not in self._current():
+            raise KeyError(key)
+        self._mark_changed()
+        self._drop_child(key)
+        del self._copy[key]
+        self._record("remove", key, None)
+
+
+_DRAFT_TYPES: dict[type, type[_Draft]] = {list: _ListDraft, dict: _DictDraft}
+
+
+class _SliceDraft:
+    """Proxy of a slice recording the states assigned to it."""
+
+    __slots__ = ("_base", "_states", "_updates", "_children", "_scope", "_patches", "_revoked")
+
+    def __init__(self, base: Any, scope: list[Any], patches: list[Patch]) -> None:
+        object.__setattr__(self, "_base", base)
+        object.__setattr__(self, "_states", type(base).model_fields)
+        object.__setattr__(self, "_updates", {})
+        object.__setattr__(self, "_children", {})
+        object.__setattr__(self, "_scope", scope)
+        object.__setattr__(self, "_patches", patches)
+        object.__setattr__(self, "_revoked", False)
+        scope.append(self)
+
+    def _check_state(self, name: str) -> None:
+        if self._revoked:
+            raise RuntimeError("Draft used after `produce` returned")
+        if name not in self._states:
+            raise AttributeError(
+                f"State '{name}' not found in slice '{type(self._base).__name__}'"
+            )
+
+    def __getattr__(self, name: str) -> Any:
+        if name.startswith("__"):
+            raise AttributeError(name)
+        self._check_state(name)
+        if name in self._children:
+            return self._children[name]
+        value = self._updates[name] if name in self._updates else getattr(self._base, name)
+        draft_type = _DRAFT_TYPES.get(type(value))
+        if draft_type is None:
+            return value
+        child = draft_type(value, self, (name,), self._scope)
+        self._children[name] = child
+        return child
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        self._check_state(name)
+        if name in self._children:
+            if value is self._children[name]:
+                return
+        elif value is (
+            self._updates[name] if name in self._updates else getattr(self._base, name)
+        ):
+            return
+        value = _unwrap(value)
+        child = self._children.pop(name, None)
+        if child is not None:
+            child._revoke()
+        self._updates[name] = value
+        self._record_patch(Patch("replace", (name,), value))
+
+    def _mark_changed(self) -> None:
+        pass
+
+    def _record_patch(self, patch: Patch) -> None:
+        self._patches.append(patch)
+
+    def _finalize(self) -> dict[str, Any]:
+        """Get the new value of each state that changed."""
+        updates = dict(self._updates)
+        for name, child in self._children.items():
+            if child._copy is not None:
+                updates[name] = child._finalize()
+        return updates
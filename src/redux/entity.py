@@ -0,0 +1,518 @@
+"""Normalized collections of entities, in the style of Redux Toolkit's entity adapter."""
+
+# Access to protected members of entity states
+# pylint: disable=W0212
+
+from __future__ import annotations
+
+import dataclasses
+from bisect import bisect_right
+from collections.abc import Callable, Hashable, Iterable, Iterator, Mapping
+from operator import itemgetter
+from typing import Any, Generic, TypeVar, get_args
+
+from pydantic import BaseModel
+from pydantic_core import core_schema
+
+from .slice import _data_schema
+
+__all__ = ["EntityAdapter", "EntityState"]
+
+EntityT = TypeVar("EntityT")
+
+# entities are spread over buckets by the hash of their id, a change copies the buckets
+# holding the changed entities instead of the whole collection
+_BUCKET_COUNT = 32
+_EMPTY_BUCKETS: tuple[dict[Any, Any], ...] = ({},) * _BUCKET_COUNT
+
+# above this many entities to move in a sorted collection, they are merged in one sort
+# instead of being inserted one by one
+_INSERT_LIMIT = 8
+
+# above this many replaced entities, the cached result of `select_all` is rebuilt on the
+# next call instead of being patched
+_PATCH_LIMIT = 8
+
+_MISSING: Any = object()
+
+
+def _select_id(entity: Any) -> Hashable:
+    if isinstance(entity, Mapping):
+        return entity["id"]
+    return entity.id
+
+
+def _apply_changes(entity: Any, changes: Mapping[str, Any]) -> Any:
+    """Make a copy of `entity` with some of its fields changed."""
+    if isinstance(entity, BaseModel):
+        return entity.model_copy(update=changes)
+    if isinstance(entity, Mapping):
+        return {**entity, **changes}
+    if dataclasses.is_dataclass(entity) and not isinstance(entity, type):
+        return dataclasses.replace(entity, **changes)
+    if isinstance(entity, tuple) and hasattr(entity, "_replace"):
+        return entity._replace(**changes)
+    raise TypeError(f"Cannot update entities of type '{type(entity).__name__}'")
+
+
+def _insert_sorted(
+    keys: list[Any], ids: list[Hashable], incoming: list[tuple[Any, Hashable]]
+) -> tuple[tuple[Hashable, ...], tuple[Any, ...]]:
+    """Insert ids in sorted ids, after the ids with an equal key."""
+    if len(incoming) > _INSERT_LIMIT:
+        # the sorted pairs are one run, merged with the incoming ones
+        pairs = sorted([*zip(keys, ids), *incoming], key=itemgetter(0))
+        return tuple(entity_id for _, entity_id in pairs), tuple(key for key, _ in pairs)
+    for key, entity_id in incoming:
+        position = bisect_right(keys, key)
+        keys.insert(position, key)
+        ids.insert(position, entity_id)
+    return tuple(ids), tuple(keys)
+
+
+def _moved_keys(
+    sort_key: Callable[[Any], Any], replaced: Mapping[Hashable, tuple[Any, Any]]
+) -> dict[Hashable, Any]:
+    """Get the new sort keys of the replaced entities whose key changed."""
+    moved = {}
+    for entity_id, (old, new) in replaced.items():
+        new_key = sort_key(new)
+        if new_key != sort_key(old):
+            moved[entity_id] = new_key
+    return moved
+
+
+class EntityState(Generic[EntityT]):
+    """Immutable collection of entities, stored by id.
+
+    Entity states are made and changed by an `EntityAdapter` and can be held by a state of
+    a slice, annotated as `EntityState[EntityType]`. They are serialized as the list of
+    ids and the list of entities in the same order.
+    """
+
+    __slots__ = ("_ids", "_buckets", "_sort_keys", "_indexes", "_adapter", "_all")
+
+    def __init__(self) -> None:
+        self._ids: tuple[Hashable, ...] = ()
+        self._buckets = _EMPTY_BUCKETS
+        # sort key of each entity, in the order of the ids, for sorted adapters
+        self._sort_keys: tuple[Any, ...] | None = None
+        # ids of the entities by index name then by indexed value
+        self._indexes: dict[str, dict[Hashable, tuple[Hashable, ...]]] = {}
+        # adapter the sort keys and indexes were made by
+        self._adapter: EntityAdapter | None = None
+        # entities in the order of the ids, made by `EntityAdapter.select_all`
+        self._all: tuple[EntityT, ...] | None = None
+
+    @classmethod
+    def _from_pairs(cls, pairs: Iterable[tuple[Hashable, EntityT]]) -> EntityState[EntityT]:
+        state: EntityState[EntityT] = cls()
+        buckets: list[dict[Any, Any]] = [{} for _ in range(_BUCKET_COUNT)]
+        ids = []
+        for entity_id, entity in pairs:
+            bucket = buckets[hash(entity_id) % _BUCKET_COUNT]
+            if entity_id not in bucket:
+                ids.append(entity_id)
+            bucket[entity_id] = entity
+        state._ids = tuple(ids)
+        state._buckets = tuple(buckets)
+        return state
+
+    @classmethod
+    def _from_data(cls, data: dict[str, list[Any]]) -> EntityState[Any]:
+        if len(data["ids"]) != len(data["entities"]):
+            raise ValueError("Entity states need as many ids as entities")
+        return cls._from_pairs(zip(data["ids"], data["entities"]))
+
+    def _to_data(self) -> dict[str, list[Any]]:
+        return {"ids": list(self._ids), "entities": [self._get(i) for i in self._ids]}
+
+    def _find(self, entity_id: Hashable) -> Any:
+        """Get an entity, or `_MISSING` if it is not in the state."""
+        return self._buckets[hash(entity_id) % _BUCKET_COUNT].get(entity_id, _MISSING)
+
+    def _get(self, entity_id: Hashable, default: Any = _MISSING) -> Any:
+        entity = self._buckets[hash(entity_id) % _BUCKET_COUNT].get(entity_id, _MISSING)
+        if entity is _MISSING:
+            if default is _MISSING:
+                raise KeyError(entity_id)
+            return default
+        return entity
+
+    @property
+    def ids(self) -> tuple[Hashable, ...]:
+        """Ids of the entities, sorted if the adapter has a sort key."""
+        return self._ids
+
+    @property
+    def entities(self) -> Mapping[Hashable, EntityT]:
+        """Read-only mapping of the entities by id."""
+        return _EntitiesView(self)
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    def __contains__(self, entity_id: object) -> bool:
+        try:
+            return entity_id in self._buckets[hash(entity_id) % _BUCKET_COUNT]
+        except TypeError:
+            return False
+
+    def __eq__(self, other: object) -> bool:
+        if self is other:
+            return True
+        if not isinstance(other, EntityState):
+            return NotImplemented
+        if self._ids is not other._ids and self._ids != other._ids:
+            return False
+        # changes copy only the buckets they touch, the others are shared
+        return all(
+            bucket is other_bucket or bucket == other_bucket
+            for bucket, other_bucket in zip(self._buckets, other._buckets)
+        )
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({dict(self.entities)!r})"
+
+    @classmethod
+    def __get_pydantic_core_schema__(cls, source: Any, handler: Any) -> core_schema.CoreSchema:
+        args = get_args(source)
+        entity_schema = handler.generate_schema(args[0]) if args else core_schema.any_schema()
+        data_schema = core_schema.typed_dict_schema(
+            {
+                "ids": core_schema.typed_dict_field(
+                    core_schema.list_schema(core_schema.any_schema())
+                ),
+                "entities": core_schema.typed_dict_field(
+                    core_schema.list_schema(entity_schema)
+                ),
+            }
+        )
+        return _data_schema(cls, data_schema, cls._from_data, cls._to_data)
+
+
+class _EntitiesView(Mapping[Hashable, Any]):
+    """Read-only mapping of the entities of an entity state, in the order of its ids."""
+
+    __slots__ = ("_state",)
+
+    def __init__(self, state: EntityState[Any]) -> None:
+        self._state = state
+
+    def __getitem__(self, entity_id: Hashable) -> Any:
+        return self._state._get(entity_id)
+
+    def __iter__(self) -> Iterator[Hashable]:
+        return iter(self._state._ids)
+
+    def __len__(self) -> int:
+        return len(self._state._ids)
+
+    def __contains__(self, entity_id: object) -> bool:
+        return entity_id in self._state
+
+
+class EntityAdapter(Generic[EntityT]):
+    """Reducers and selectors for an `EntityState`, in the style of `createEntityAdapter`.
+
+    The reducers return a new entity state and leave the one they receive unchanged. Only
+    the changed entries are copied: entities are stored in buckets by id and a change
+    copies the buckets it touches. The sort order and the secondary indexes are updated for
+    the changed entities instead of being rebuilt.
+
+    Args:
+        select_id: Get the id of an entity. Defaults to its `id` attribute or key.
+        sort_key: Sort the ids and `select_all` by this key. Defaults to insertion order.
+        indexes: Functions getting the indexed value of an entity, by index name. Index
+            lookups with `select_by_index` return the entities in the order they were added
+            to the index.
+
+    Example:
+
+    ```python
+    from __future__ import annotations
+    import redux as rd
+
+    detections = rd.EntityAdapter[Detection](
+        sort_key=lambda detection: -detection.score,
+        indexes={"label": lambda detection: detection.label},
+    )
+
+    class DetectionsSlice(rd.Slice):
+        objects: rd.EntityState[Detection]
+
+        @rd.reduce
+        def add_detections(piece: DetectionsSlice, found: list[Detection]) -> DetectionsSlice:
+            objects = detections.upsert_many(piece.objects, found)
+            return piece.update([(DetectionsSlice.objects, objects)])
+
+    rd.create_store(Store(detections=DetectionsSlice(objects=detections.get_initial_state())))
+    rd.dispatch(DetectionsSlice.add_detections, found)
+    objects = rd.get_state(DetectionsSlice.objects)
+    people = detections.select_by_index(objects, "label", "person")
+    ```
+    """
+
+    def __init__(
+        self,
+        *,
+        select_id: Callable[[EntityT], Hashable] = _select_id,
+        sort_key: Callable[[EntityT], Any] | None = None,
+        indexes: Mapping[str, Callable[[EntityT], Hashable]] | None = None,
+    ) -> None:
+        self.select_id = select_id
+        self.sort_key = sort_key
+        self.indexes = dict(indexes or {})
+
+    def get_initial_state(self, entities: Iterable[EntityT] = ()) -> EntityState[EntityT]:
+        """Make an entity state holding `entities`. Later entities replace earlier ones."""
+        state: EntityState[EntityT] = EntityState._from_pairs(
+            (self.select_id(entity), entity) for entity in entities
+        )
+        state._adapter = self
+        if self.sort_key is not None:
+            sort_key = self.sort_key
+            pairs = sorted(
+                ((sort_key(state._get(i)), i) for i in state._ids), key=itemgetter(0)
+            )
+            state._ids = tuple(entity_id for _, entity_id in pairs)
+            state._sort_keys = tuple(key for key, _ in pairs)
+        for name, index_key in self.indexes.items():
+            groups: dict[Hashable, list[Hashable]] = {}
+            for entity_id in state._ids:
+                groups.setdefault(index_key(state._get(entity_id)), []).append(entity_id)
+            state._indexes[name] = {key: tuple(ids) for key, ids in groups.items()}
+        return state
+
+    def add_one(self, state: EntityState[EntityT], entity: EntityT) -> EntityState[EntityT]:
+        """Add an entity, unless an entity with the same id is already in `state`."""
+        return self.add_many(state, (entity,))
+
+    def add_many(
+        self, state: EntityState[EntityT], entities: Iterable[EntityT]
+    ) -> EntityState[EntityT]:
+        """Add the entities whose id is not already in `state`."""
+        state = self._own(state)
+        added: dict[Hashable, EntityT] = {}
+        for entity in entities:
+            entity_id = self.select_id(entity)
+            if entity_id not in added and state._find(entity_id) is _MISSING:
+                added[entity_id] = entity
+        return self._apply(state, added, {}, {})
+
+    def upsert_many(
+        self, state: EntityState[EntityT], entities: Iterable[EntityT]
+    ) -> EntityState[EntityT]:
+        """Add the entities, replacing the entities with the same id."""
+        state = self._own(state)
+        added: dict[Hashable, EntityT] = {}
+        replaced: dict[Hashable, tuple[EntityT, EntityT]] = {}
+        for entity in entities:
+            entity_id = self.select_id(entity)
+            if entity_id in added:
+                added[entity_id] = entity
+            elif entity_id in replaced:
+                replaced[entity_id] = (replaced[entity_id][0], entity)
+            else:
+                old = state._find(entity_id)
+                if old is _MISSING:
+                    added[entity_id] = entity
+                elif old is not entity:
+                    replaced[entity_id] = (old, entity)
+        return self._apply(state, added, replaced, {})
+
+    def remove_many(
+        self, state: EntityState[EntityT], entity_ids: Iterable[Hashable]
+    ) -> EntityState[EntityT]:
+        """Remove the entities with these ids. Unknown ids are ignored."""
+        state = self._own(state)
+        removed: dict[Hashable, EntityT] = {}
+        for entity_id in entity_ids:
+            old = state._find(entity_id)
+            if old is not _MISSING:
+                removed[entity_id] = old
+        return self._apply(state, {}, {}, removed)
+
+    def update_one(
+        self, state: EntityState[EntityT], entity_id: Hashable, changes: Mapping[str, Any]
+    ) -> EntityState[EntityT]:
+        """Change some fields of an entity. Unknown ids are ignored.
+
+        Entities can be pydantic models, mappings, dataclasses or named tuples.
+        """
+        state = self._own(state)
+        old = state._find(entity_id)
+        if old is _MISSING:
+            return state
+        new = _apply_changes(old, changes)
+        if self.select_id(new) != entity_id:
+            raise ValueError(f"Updating entity '{entity_id}' cannot change its id")
+        return self._apply(state, {}, {entity_id: (old, new)}, {})
+
+    def select_by_id(self, state: EntityState[EntityT], entity_id: Hashable) -> EntityT | None:
+        """Get an entity by id, or `None` if it is not in `state`."""
+        return state._get(entity_id, None)
+
+    def select_ids(self, state: EntityState[EntityT]) -> tuple[Hashable, ...]:
+        """Get the ids of the entities, sorted if the adapter has a sort key."""
+        return self._own(state)._ids
+
+    def select_total(self, state: EntityState[EntityT]) -> int:
+        """Get the number of entities."""
+        return len(state._ids)
+
+    def select_all(self, state: EntityState[EntityT]) -> tuple[EntityT, ...]:
+        """Get the entities, sorted if the adapter has a sort key.
+
+        The result is kept with the entity state, and the reducers carry it over to the
+        state they make when the order of the entities did not change.
+        """
+        state = self._own(state)
+        if state._all is None:
+            state._all = tuple(state._get(entity_id) for entity_id in state._ids)
+        return state._all
+
+    def select_by_index(
+        self, state: EntityState[EntityT], name: str, key: Hashable
+    ) -> tuple[EntityT, ...]:
+        """Get the entities whose value for the index `name` is `key`."""
+        if name not in self.indexes:
+            raise KeyError(f"Index '{name}' not found in entity adapter")
+        state = self._own(state)
+        return tuple(state._get(entity_id) for entity_id in state._indexes[name].get(key, ()))
+
+    def _own(self, state: EntityState[EntityT]) -> EntityState[EntityT]:
+        """Get `state` with the sort keys and indexes of this adapter."""
+        if state._adapter is self:
+            return state
+        # made by another adapter or validated from data
+        return self.get_initial_state(state._get(entity_id) for entity_id in state._ids)
+
+    def _apply(
+        self,
+        state: EntityState[EntityT],
+        added: dict[Hashable, EntityT],
+        replaced: dict[Hashable, tuple[EntityT, EntityT]],
+        removed: dict[Hashable, EntityT],
+    ) -> EntityState[EntityT]:
+        if not added and not replaced and not removed:
+            return state
+        buckets = list(state._buckets)
+        copied: set[int] = set()
+        for entity_id, entity in (
+            *((entity_id, _MISSING) for entity_id in removed),
+            *((entity_id, new) for entity_id, (_, new) in replaced.items()),
+            *added.items(),
+        ):
+            index = hash(entity_id) % _BUCKET_COUNT
+            if index not in copied:
+                buckets[index] = dict(buckets[index])
+                copied.add(index)
+            if entity is _MISSING:
+                del buckets[index][entity_id]
+            else:
+                buckets[index][entity_id] = entity
+
+        new_state: EntityState[EntityT] = EntityState()
+        new_state._buckets = tuple(buckets)
+        new_state._adapter = self
+        new_state._ids, new_state._sort_keys = self._order(state, added, replaced, removed)
+        new_state._indexes = {
+            name: self._reindex(state._indexes[name], index_key, added, replaced, removed)
+            for name, index_key in self.indexes.items()
+        }
+        new_state._all = self._carry_all(state, new_state, added, replaced, removed)
+        return new_state
+
+    def _order(
+        self,
+        state: EntityState[EntityT],
+        added: dict[Hashable, EntityT],
+        replaced: dict[Hashable, tuple[EntityT, EntityT]],
+        removed: dict[Hashable, EntityT],
+    ) -> tuple[tuple[Hashable, ...], tuple[Any, ...] | None]:
+        """Get the ids and sort keys after a change, keeping the same tuples if possible."""
+        ids = state._ids
+        if self.sort_key is None:
+            if removed:
+                ids = tuple(entity_id for entity_id in ids if entity_id not in removed)
+            return ids + tuple(added), None
+        sort_key = self.sort_key
+        assert state._sort_keys is not None
+        moved = _moved_keys(sort_key, replaced)
+        incoming = [(sort_key(entity), entity_id) for entity_id, entity in added.items()]
+        incoming.extend((key, entity_id) for entity_id, key in moved.items())
+        if not removed and not incoming:
+            return ids, state._sort_keys
+        keys, new_ids = list(state._sort_keys), list(ids)
+        if removed or moved:
+            kept = [
+                (key, entity_id)
+                for key, entity_id in zip(keys, new_ids)
+                if entity_id not in removed and entity_id not in moved
+            ]
+            keys = [key for key, _ in kept]
+            new_ids = [entity_id for _, entity_id in kept]
+        return _insert_sorted(keys, new_ids, incoming)
+
+    @staticmethod
+    def _reindex(
+        groups: dict[Hashable, tuple[Hashable, ...]],
+        index_key: Callable[[EntityT], Hashable],
+        added: dict[Hashable, EntityT],
+        replaced: dict[Hashable, tuple[EntityT, EntityT]],
+        removed: dict[Hashable, EntityT],
+    ) -> dict[Hashable, tuple[Hashable, ...]]:
+        """Get the groups of an index after a change, copying the changed groups only."""
+        leaving: dict[Hashable, set[Hashable]] = {}
+        joining: dict[Hashable, list[Hashable]] = {}
+        for entity_id, old in removed.items():
+            leaving.setdefault(index_key(old), set()).add(entity_id)
+        for entity_id, (old, new) in replaced.items():
+            old_key, new_key = index_key(old), index_key(new)
+            if old_key != new_key:
+                leaving.setdefault(old_key, set()).add(entity_id)
+                joining.setdefault(new_key, []).append(entity_id)
+        for entity_id, entity in added.items():
+            joining.setdefault(index_key(entity), []).append(entity_id)
+        if not leaving and not joining:
+            return groups
+        groups = dict(groups)
+        for key in leaving.keys() | joining.keys():
+            members = groups.get(key, ())
+            if key in leaving:
+                members = tuple(i for i in members if i not in leaving[key])
+            members += tuple(joining.get(key, ()))
+            if members:
+                groups[key] = members
+            else:
+                del groups[key]
+        return groups
+
+    def _carry_all(
+        self,
+        state: EntityState[EntityT],
+        new_state: EntityState[EntityT],
+        added: dict[Hashable, EntityT],
+        replaced: dict[Hashable, tuple[EntityT, EntityT]],
+        removed: dict[Hashable, EntityT],
+    ) -> tuple[EntityT, ...] | None:
+        """Patch the cached result of `select_all` for the new state, if it is cheap."""
+        cached = state._all
+        if cached is None or len(replaced) > _PATCH_LIMIT:
+            return None
+        if self.sort_key is not None and new_state._ids is not state._ids:
+            return None
+        entities = list(cached)
+        for entity_id, (_, new) in replaced.items():
+            entities[state._ids.index(entity_id)] = new
+        if removed:
+            entities = [
+                entity
+                for entity_id, entity in zip(state._ids, entities)
+                if entity_id not in removed
+            ]
+        entities.extend(added.values())
+        return tuple(entities)
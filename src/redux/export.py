@@ -0,0 +1,64 @@
+"""Serialize the whole store to JSON, reusing the serialized form of unchanged slices."""
+
+# Access to protected members of the store module
+# pylint: disable=W0212
+
+from __future__ import annotations
+
+import json
+from typing import Any
+
+from pydantic_core import to_json
+
+from . import store as _store
+from .slice import Slice
+
+__all__ = ["dump_bytes", "dump_json"]
+
+# serialized slices by root slice name, as (slice, name, `"name":{...}` JSON member)
+_FRAGMENTS: dict[str, tuple[Any, str, bytes]] = {}
+
+
+def dump_bytes() -> bytes:
+    """Serialize the store to a JSON document, encoded in UTF-8.
+
+    The document maps the name of each slice in the store, as declared on the store class
+    or given to `inject_slice`, to its states. Each slice is serialized once and reused
+    until it is replaced by a dispatch, so dumping a store in which one slice changed only
+    serializes that slice.
+
+    Example:
+
+    ```python
+    import redux as rd
+
+    rd.create_store(Store(camera=CameraSlice(exposure=0.1)))
+    assert rd.dump_bytes() == b'{"camera":{"exposure":0.1}}'
+    ```
+    """
+    global _FRAGMENTS  # pylint: disable=W0603
+    _store._check_store_init()
+    assert _store.STORE is not None, "Store not initialized"
+    fragments: dict[str, tuple[Any, str, bytes]] = {}
+    for root_slice_name, name in tuple(_store.SLICE_NAME_CACHE.items()):
+        one_slice = _store.STORE[root_slice_name]
+        cached = _FRAGMENTS.get(root_slice_name)
+        if cached is not None and cached[0] is one_slice and cached[1] == name:
+            fragments[root_slice_name] = cached
+        else:
+            member = json.dumps(name).encode() + b":" + _serialize(one_slice)
+            fragments[root_slice_name] = (one_slice, name, member)
+    # slices removed since the last call are dropped
+    _FRAGMENTS = fragments
+    return b"{" + b",".join(member for _, _, member in fragments.values()) + b"}"
+
+
+def dump_json() -> str:
+    """Serialize the store to a JSON string, see `dump_bytes`."""
+    return dump_bytes().decode("utf-8")
+
+
+def _serialize(one_slice: Any) -> bytes:
+    if isinstance(one_slice, Slice):
+        return one_slice.__pydantic_serializer__.to_json(one_slice)
+    return to_json(one_slice.model_dump(mode="json"))
@@ -0,0 +1,219 @@
+"""Tuple-backed slices for states that change at a high rate."""
+
+from __future__ import annotations
+
+import inspect
+from functools import cache
+from operator import itemgetter
+from typing import Any, Sequence, TypeVar, dataclass_transform, get_type_hints, overload
+
+from pydantic import BaseModel, create_model
+from pydantic_core import core_schema
+
+from .slice import _SLICE_REDUX_ANNOTATIONS, StatePath, _ComputedState
+
+try:
+    from _collections import _tuplegetter  # type: ignore[attr-defined]
+except ImportError:  # pragma: no cover
+
+    def _tuplegetter(index: int, doc: str) -> Any:  # type: ignore[misc]
+        return property(itemgetter(index), doc=doc)
+
+
+__all__ = ["FastSlice"]
+
+AnyState = TypeVar("AnyState")
+AnyFastSlice = TypeVar("AnyFastSlice", bound="FastSlice")
+
+# position of each state in the tuple of a fast slice class
+_FAST_SLICE_INDEX: dict[type, dict[str, int]] = {}
+# default value of each state declared by a fast slice class (not by its bases)
+_FAST_SLICE_DEFAULTS: dict[type, dict[str, Any]] = {}
+
+
+class _FastSliceMeta(type):
+    """Metaclass returning `StatePath` for the states of a fast slice class."""
+
+    def __new__(mcs, name: str, bases: tuple[type, ...], namespace: dict[str, Any], **kwargs):
+        namespace.setdefault("__slots__", ())
+        for attr_name, attr in namespace.items():
+            if isinstance(attr, _ComputedState):
+                raise TypeError(
+                    f"Computed state '{attr_name}' is not supported by FastSlice '{name}'"
+                )
+        cls = super().__new__(mcs, name, bases, namespace, **kwargs)
+        if not any(isinstance(base, _FastSliceMeta) for base in bases):
+            return cls
+
+        if (cls.__module__, name) in _SLICE_REDUX_ANNOTATIONS:
+            raise TypeError(f"Slice name '{name}' already exists.")
+        own_states = inspect.get_annotations(cls)
+        _FAST_SLICE_DEFAULTS[cls] = {
+            state: namespace[state] for state in own_states if state in namespace
+        }
+        states: dict[str, None] = {}
+        for base in reversed(cls.__mro__):
+            if isinstance(base, _FastSliceMeta) and base in _FAST_SLICE_DEFAULTS:
+                states.update(dict.fromkeys(inspect.get_annotations(base)))
+        index = {state: position for position, state in enumerate(states)}
+        for state, position in index.items():
+            type.__setattr__(cls, state, _tuplegetter(position, f"Alias for state '{state}'"))
+        _FAST_SLICE_INDEX[cls] = index
+        _SLICE_REDUX_ANNOTATIONS[(cls.__module__, name)] = set(index)
+        return cls
+
+    def __getattribute__(cls, attr_name: str) -> Any:
+        if attr_name == "slice_name":
+            return type.__getattribute__(cls, "__name__")
+        if attr_name in _FAST_SLICE_INDEX.get(cls, ()):  # type: ignore[call-overload]
+            return StatePath(
+                slice_name=type.__getattribute__(cls, "__name__"), state=attr_name
+            )
+        return type.__getattribute__(cls, attr_name)
+
+    @property
+    def model_fields(cls) -> dict[str, Any]:
+        """Pydantic fields of the states, used to validate them."""
+        return _get_model(cls).model_fields
+
+
+@cache
+def _get_model(fast_slice_cls: type) -> type[BaseModel]:
+    """Build the pydantic model validating the states of a fast slice class."""
+    hints = get_type_hints(fast_slice_cls, include_extras=True)
+    defaults: dict[str, Any] = {}
+    for base in reversed(fast_slice_cls.__mro__):
+        defaults.update(_FAST_SLICE_DEFAULTS.get(base, {}))
+    return create_model(  # type: ignore[call-overload]
+        fast_slice_cls.__name__,
+        **{
+            state: (hints[state], defaults.get(state, ...))
+            for state in _FAST_SLICE_INDEX[fast_slice_cls]
+        },
+    )
+
+
+def _rebuild(fast_slice_cls: type[AnyFastSlice], values: tuple[Any, ...]) -> AnyFastSlice:
+    return tuple.__new__(fast_slice_cls, values)
+
+
+@dataclass_transform(kw_only_default=True)
+class FastSlice(tuple, metaclass=_FastSliceMeta):
+    """Slice stored as a tuple, for states that change many times a second.
+
+    A fast slice is declared like a `Slice` and can be used alongside them in a `Store`.
+    Its states are validated when the slice is created; `update` skips validation and
+    only copies a tuple, which makes dispatching to it and reading its states cheaper.
+    Computed states are not supported.
+
+    Example:
+
+    ```python
+    from __future__ import annotations
+    import redux as rd
+
+    class CountersSlice(rd.FastSlice):
+        frames: int = 0
+        dropped: int = 0
+
+        @rd.reduce
+        def add_frame(piece: CountersSlice) -> CountersSlice:
+            return piece.update([(CountersSlice.frames, piece.frames + 1)])
+
+    class Store(rd.Store):
+        counters: CountersSlice
+
+    rd.create_store(Store(counters=CountersSlice()))
+    rd.dispatch(CountersSlice.add_frame)
+    assert rd.get_state(CountersSlice.frames) == 1
+    ```
+    """
+
+    __slots__ = ()
+
+    def __new__(cls, **states: Any) -> FastSlice:
+        validated = _get_model(cls).model_validate(states)
+        return tuple.__new__(
+            cls, [getattr(validated, state) for state in _FAST_SLICE_INDEX[cls]]
+        )
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise AttributeError(f"Slice '{self.__class__.__name__}' is frozen")
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        return _rebuild, (self.__class__, tuple(self))
+
+    def __eq__(self, other: object) -> bool:
+        return self.__class__ is other.__class__ and tuple.__eq__(self, other)  # type: ignore
+
+    def __ne__(self, other: object) -> bool:
+        return not self == other
+
+    __hash__ = tuple.__hash__
+
+    def __repr__(self) -> str:
+        states = ", ".join(
+            f"{state}={value!r}" for state, value in zip(_FAST_SLICE_INDEX[type(self)], self)
+        )
+        return f"{self.__class__.__name__}({states})"
+
+    @classmethod
+    def __get_pydantic_core_schema__(
+        cls, source: Any, _handler: Any
+    ) -> core_schema.CoreSchema:
+        return core_schema.is_instance_schema(
+            source,
+            serialization=core_schema.plain_serializer_function_ser_schema(
+                lambda value, info: value.model_dump(mode=info.mode), info_arg=True
+            ),
+        )
+
+    @property
+    def slice_name(self) -> str:
+        """Return the name of the slice."""
+        return self.__class__.__name__
+
+    @property
+    def model_fields_set(self) -> frozenset[str]:
+        """Names of the states of the slice."""
+        return frozenset(_FAST_SLICE_INDEX[type(self)])
+
+    def has_state(self, key: str) -> bool:
+        """Check if the slice has a state named `key`."""
+        return key in _FAST_SLICE_INDEX[type(self)]
+
+    def get_state(self, key: str) -> Any:
+        """Get the state of a specific key."""
+        index = _FAST_SLICE_INDEX[type(self)]
+        if key not in index:
+            raise KeyError(f"State '{key}' not found in slice '{self.__class__.__name__}'")
+        return self[index[key]]
+
+    def model_dump(self, *, mode: str = "python", include: set[str] | None = None) -> dict:
+        """Dump the states of the slice like `pydantic.BaseModel.model_dump`."""
+        model = _get_model(type(self))
+        return model.model_construct(
+            **dict(zip(_FAST_SLICE_INDEX[type(self)], self))
+        ).model_dump(mode=mode, include=include)
+
+    @overload
+    def update(self, update_states: Sequence[tuple[StatePath, Any]]) -> FastSlice: ...
+
+    @overload
+    def update(self, update_states: Sequence[tuple[AnyState, AnyState]]) -> FastSlice: ...
+
+    def update(self, update_states):
+        """Update the slice state with new values by creating a new instance.
+
+        The new values are not validated.
+        """
+        index = _FAST_SLICE_INDEX[type(self)]
+        values = list(self)
+        for update_path, new_state in update_states:
+            if update_path.state not in index:
+                raise KeyError(
+                    f"State '{update_path.state}' not found in slice "
+                    + f"'{self.__class__.__name__}'"
+                )
+            values[index[update_path.state]] = new_state
+        return tuple.__new__(type(self), values)
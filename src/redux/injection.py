@@ -0,0 +1,179 @@
+"""Slices added to and removed from a store after it was created."""
+
+# Access to protected members of the store module
+# pylint: disable=W0212
+
+from __future__ import annotations
+
+from typing import Any
+
+from . import store as _store
+from .fast_slice import FastSlice
+from .priority import _forget_entry
+from .slice import Slice
+from .snapshots import _publish_snapshot
+from .store import (
+    _EXTRA_REDUCER_KEYS,
+    _EXTRA_REDUCER_KEYS_BY_NOTIFIER,
+    _REGISTERED_EXTRA_REDUCERS,
+    SLICE_SUBSCRIPTIONS,
+    SLICE_TREE,
+    SUBSCRIPTIONS,
+    SliceSubscriptionEntry,
+    SubscriptionEntry,
+    _check_store_init,
+    _dispatch,
+    _get_slice_bases,
+    _get_slice_type,
+    _register_extra_reducers,
+    _run_to_completion,
+    get_state,
+)
+
+__all__ = ["inject_slice", "remove_slice"]
+
+
+def inject_slice(new_slice: Slice, name: str | None = None, notify: bool = True) -> None:
+    """Add a slice to the existing store.
+
+    Only the new slice is registered: its bases, the extra reducers it declares and the
+    extra reducers of other slices that listen to it. Injected slices are not part of
+    `get_store()`, which only returns the slices declared on the store class.
+
+    Args:
+        new_slice: The slice to add. No slice of the same class may be in the store.
+        name: The name of the slice in the store. Defaults to the slice name.
+        notify: If True, notify subscribers of the new slice and run its extra reducers
+            with the current state of the store, like `create_store` does.
+
+    Example:
+
+    ```python
+    import redux as rd
+
+    class PluginSlice(rd.Slice):
+        enabled: bool = False
+
+    rd.inject_slice(PluginSlice(enabled=True))
+    assert rd.get_state(PluginSlice.enabled)
+
+    rd.remove_slice(PluginSlice)
+    ```
+    """
+    _check_store_init()
+    assert _store.STORE is not None, "Store not initialized"
+    if not isinstance(new_slice, (Slice, FastSlice)):
+        raise TypeError(f"Expected a Slice, got {type(new_slice)}")
+    root_slice_name = new_slice.slice_name
+    if root_slice_name in _store.STORE:
+        raise ValueError(f"Slice '{root_slice_name}' already in store")
+    _store._STORE_GENERATION += 1
+
+    _store.STORE[root_slice_name] = new_slice
+    _store.SLICE_NAME_CACHE[root_slice_name] = name if name is not None else root_slice_name
+    # bases shared with other slices keep resolving to the slice they resolved to before
+    SLICE_TREE[root_slice_name] = root_slice_name
+    for slice_name in _get_slice_bases(new_slice.__class__):
+        SLICE_TREE.setdefault(slice_name, root_slice_name)
+    owned = frozenset(
+        slice_name for slice_name, root in SLICE_TREE.items() if root == root_slice_name
+    )
+
+    keys = [key for slice_name in owned for key in _EXTRA_REDUCER_KEYS.get(slice_name, ())]
+    for slice_name in owned:
+        for key in _EXTRA_REDUCER_KEYS_BY_NOTIFIER.get(slice_name, ()):
+            keys.extend(_EXTRA_REDUCER_KEYS.get(key.subscriber_slice_name, ()))
+    registered = _register_extra_reducers(keys, involving=owned)
+
+    if notify:
+        _run_to_completion(_dispatch, root_slice_name, new_slice, True)
+        for extra_reducer in registered:
+            if (
+                extra_reducer.subscriber_root_slice_name == root_slice_name
+                and extra_reducer.notifier_root_slice_name != root_slice_name
+            ):
+                callback, paths = extra_reducer.entry
+                callback(*tuple(get_state(path) for path in paths))
+    _publish_snapshot(_store.STORE, SLICE_TREE, _store.REVISION, _store._STORE_GENERATION)
+
+
+def remove_slice(slice_type: type[Slice]) -> None:
+    """Remove a slice added by `inject_slice` from the store.
+
+    Subscriptions to the slice and extra reducers declared by or listening to it are
+    removed as well.
+
+    Args:
+        slice_type: The class of the slice to remove.
+    """
+    _check_store_init()
+    assert _store.STORE is not None and _store.STORE_CLS is not None, "Store not initialized"
+    root_slice_name: str = slice_type.__name__
+    if root_slice_name not in _store.STORE:
+        raise KeyError(f"Slice '{root_slice_name}' not found in store")
+    if _store.SLICE_NAME_CACHE[root_slice_name] in _store.STORE_CLS.model_fields:
+        raise ValueError(
+            f"Slice '{root_slice_name}' is declared on {_store.STORE_CLS.__name__} "
+            + "and cannot be removed"
+        )
+
+    _remove_subscriptions(root_slice_name)
+
+    _store._STORE_GENERATION += 1
+    del _store.STORE[root_slice_name]
+    del _store.SLICE_NAME_CACHE[root_slice_name]
+    removed = [name for name, root in SLICE_TREE.items() if root == root_slice_name]
+    for slice_name in removed:
+        del SLICE_TREE[slice_name]
+    # bases shared with the removed slice resolve to another slice inheriting from them
+    for other_root_slice_name in _store.SLICE_NAME_CACHE:
+        for slice_name in _get_slice_bases(_get_slice_type(other_root_slice_name)):
+            if slice_name in removed:
+                SLICE_TREE.setdefault(slice_name, other_root_slice_name)
+    _publish_snapshot(_store.STORE, SLICE_TREE, _store.REVISION, _store._STORE_GENERATION)
+
+
+def _remove_subscriptions(root_slice_name: str) -> None:
+    """Remove the subscriptions and extra reducers of a slice, or that read from it."""
+    for extra_reducer in tuple(_REGISTERED_EXTRA_REDUCERS):
+        if root_slice_name in (
+            extra_reducer.notifier_root_slice_name,
+            extra_reducer.subscriber_root_slice_name,
+        ) or any(path.slice_name == root_slice_name for path in extra_reducer.entry[1]):
+            _REGISTERED_EXTRA_REDUCERS.remove(extra_reducer)
+            SUBSCRIPTIONS[extra_reducer.notifier_root_slice_name][
+                extra_reducer.notifier_state_name
+            ].remove(extra_reducer.entry)
+    removed: list[SubscriptionEntry | SliceSubscriptionEntry] = []
+    for states in SUBSCRIPTIONS.pop(root_slice_name, {}).values():
+        removed += states
+    for notifier_root_slice_name, states in tuple(SUBSCRIPTIONS.items()):
+        for state_name, entries in tuple(states.items()):
+            kept = _drop_entries_reading(root_slice_name, entries, removed)
+            if kept:
+                states[state_name] = kept
+            else:
+                del states[state_name]
+        if not states:
+            del SUBSCRIPTIONS[notifier_root_slice_name]
+    removed += SLICE_SUBSCRIPTIONS.pop(root_slice_name, [])
+    for notifier_root_slice_name, slice_entries in tuple(SLICE_SUBSCRIPTIONS.items()):
+        slice_entries[:] = _drop_entries_reading(root_slice_name, slice_entries, removed)
+        if not slice_entries:
+            del SLICE_SUBSCRIPTIONS[notifier_root_slice_name]
+    for entry in removed:
+        _forget_entry(entry)
+
+
+def _drop_entries_reading(
+    root_slice_name: str, entries: list[Any], removed: list[Any]
+) -> list[Any]:
+    """Get the entries whose paths do not read from a slice, adding the others to `removed`."""
+    kept = []
+    for entry in entries:
+        paths = entry[-1]
+        if paths is not None and any(path.slice_name == root_slice_name for path in paths):
+            removed.append(entry)
+        else:
+            kept.append(entry)
+    return kept
@@ -0,0 +1,111 @@
+"""Slices loaded from a loader or a file the first time they are used."""
+
+from __future__ import annotations
+
+import json
+import os
+import time
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any, NamedTuple
+
+from .fast_slice import FastSlice
+from .slice import Slice
+
+__all__ = ["LazySlice", "lazy"]
+
+LazySource = Callable[[], Any] | str | os.PathLike[str]
+
+
+class LazySlice(NamedTuple):
+    """Placeholder for a slice of the store that is loaded on first use.
+
+    Use `redux.lazy` to create one.
+    """
+
+    source: LazySource
+    evict_after: float | None = None
+
+
+def lazy(source: LazySource, evict_after: float | None = None) -> Any:
+    """Declare a slice of the store that is only loaded when it is first used.
+
+    Use the returned placeholder as the default of a field of the store. `create_store`
+    registers the slice without loading it; the first `get_state`, `get_slice`, dispatch or
+    subscription to it loads it. Extra reducers listening to a lazy slice are not run by
+    `create_store`, as if it was created with `notify=False`.
+
+    Args:
+        source: A function returning the slice, or the path of a JSON file holding its
+            states.
+        evict_after: If set, `redux.evict_idle` unloads the slice once it has not been read
+            for this many seconds, unless it was changed since it was loaded.
+
+    Example:
+
+    ```python
+    import redux as rd
+
+    class CalibrationSlice(rd.Slice):
+        offsets: list[float] = []
+
+    class Store(rd.Store):
+        camera: CameraSlice
+        calibration: CalibrationSlice = rd.lazy("calibration.json", evict_after=60)
+
+    rd.create_store(Store(camera=CameraSlice()))
+    offsets = rd.get_state(CalibrationSlice.offsets)  # loads calibration.json
+    ```
+    """
+    if not callable(source) and not isinstance(source, (str, os.PathLike)):
+        raise TypeError(f"Expected a callable or a path, got {type(source)}")
+    if evict_after is not None and evict_after < 0:
+        raise ValueError(f"evict_after must be positive, got {evict_after}")
+    return LazySlice(source, evict_after)
+
+
+class _LazyEntry:  # pylint: disable=R0903
+    """A lazy slice registered in the store."""
+
+    __slots__ = ("slice_type", "lazy_slice", "loaded", "last_used")
+
+    def __init__(self, slice_type: type[Slice], lazy_slice: LazySlice) -> None:
+        self.slice_type = slice_type
+        self.lazy_slice = lazy_slice
+        # the slice as loaded, the slice is clean while the store holds this instance
+        self.loaded: Slice | None = None
+        self.last_used = 0.0
+
+    def load(self) -> Slice:
+        """Load the slice from its source and remember it as clean."""
+        source = self.lazy_slice.source
+        if callable(source):
+            loaded = source()
+        else:
+            states = json.loads(Path(source).read_text(encoding="utf-8"))
+            loaded = self.slice_type(**states)
+        if not isinstance(loaded, self.slice_type):
+            raise TypeError(f"Expected a {self.slice_type.__name__}, got {type(loaded)}")
+        self.loaded = loaded
+        self.last_used = time.monotonic()
+        return loaded
+
+
+class _LazyStore(dict[str, Slice | FastSlice]):
+    """Slices of the store, loading lazy slices when they are first looked up."""
+
+    def __init__(self, entries: dict[str, _LazyEntry], on_load: Callable[[str], None]) -> None:
+        super().__init__()
+        self.entries = entries
+        self.on_load = on_load
+
+    def __missing__(self, root_slice_name: str) -> Slice:
+        if root_slice_name not in self.entries:
+            raise KeyError(root_slice_name)
+        loaded = self.entries[root_slice_name].load()
+        self[root_slice_name] = loaded
+        self.on_load(root_slice_name)
+        return loaded
+
+    def __contains__(self, root_slice_name: object) -> bool:
+        return dict.__contains__(self, root_slice_name) or root_slice_name in self.entries
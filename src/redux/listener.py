@@ -0,0 +1,175 @@
+"""Async effects run when states change, in the style of RTK listener middleware."""
+
+# Access to protected members of the store module
+# pylint: disable=W0212
+
+from __future__ import annotations
+
+import asyncio
+import inspect
+from collections.abc import Callable, Coroutine
+from typing import Any, Literal
+
+from . import store as _store
+from .slice import Slice, StatePath
+from .subscriptions import subscribe
+
+__all__ = ["listen"]
+
+Effect = Callable[[Any], Coroutine[Any, Any, None]]
+Policy = Literal["take_latest", "take_every", "debounce"]
+_POLICIES = ("take_latest", "take_every", "debounce")
+
+
+class _Listener:
+    """Run an effect as a task of an event loop each time it is triggered."""
+
+    def __init__(
+        self, effect: Effect, policy: Policy, wait: float, loop: asyncio.AbstractEventLoop
+    ) -> None:
+        self._effect = effect
+        self._policy = policy
+        self._wait = wait
+        self._loop = loop
+        self._tasks: set[asyncio.Task[None]] = set()
+
+    def trigger(self, value: Any) -> None:
+        """Start the effect with `value` from any thread."""
+        try:
+            self._loop.call_soon_threadsafe(self._start, value)
+        except RuntimeError:  # the loop is closed, nobody is left to run the effect
+            pass
+
+    def _start(self, value: Any) -> None:
+        if self._policy != "take_every":
+            for task in self._tasks:
+                task.cancel()
+        task = self._loop.create_task(self._run(value))
+        self._tasks.add(task)
+        task.add_done_callback(self._on_done)
+
+    async def _run(self, value: Any) -> None:
+        if self._policy == "debounce":
+            await asyncio.sleep(self._wait)
+        await self._effect(value)
+
+    def _on_done(self, task: asyncio.Task[None]) -> None:
+        self._tasks.discard(task)
+        if not task.cancelled() and task.exception() is not None:
+            self._loop.call_exception_handler(
+                {
+                    "message": f"Exception in listener effect {self._effect!r}",
+                    "exception": task.exception(),
+                    "task": task,
+                }
+            )
+
+    def cancel(self) -> None:
+        """Cancel the effects in flight from any thread."""
+        try:
+            self._loop.call_soon_threadsafe(self._cancel_all)
+        except RuntimeError:
+            pass
+
+    def _cancel_all(self) -> None:
+        for task in self._tasks:
+            task.cancel()
+
+
+def listen(
+    trigger: StatePath | Any | Callable[[Slice, frozenset[str]], bool],
+    *,
+    policy: Policy = "take_latest",
+    wait: float = 0.0,
+    loop: asyncio.AbstractEventLoop | None = None,
+) -> Callable[[Effect], Callable[[], None]]:
+    """Run an async effect each time a state changes, cancelling effects made stale.
+
+    Effects run as tasks of an event loop, whichever thread dispatches. With the
+    `take_latest` policy, an effect still running when the state changes again is
+    cancelled before the new one starts. With `debounce`, effects also wait `wait` seconds
+    before they start, so only the last of a burst of changes runs. With `take_every`,
+    every effect runs to completion. Exceptions raised by effects are passed to the
+    exception handler of the loop.
+
+    Args:
+        trigger: A state, as `SliceName.state_name`, whose new value is passed to the
+            effect. Or a predicate called with each root slice committed by a dispatch and
+            its changed states; the effect receives the slice when it returns True.
+        policy: What to do with the effects in flight when the trigger fires again.
+        wait: Seconds a `debounce` effect waits before it starts.
+        loop: The event loop running the effects. Defaults to the running loop. Changes
+            made once it is closed are ignored.
+
+    Returns:
+        A decorator that takes an async effect and returns a function to stop listening,
+        which also cancels the effects in flight.
+
+    Raises:
+        ValueError: If the policy is unknown or `wait` is negative.
+
+    Example:
+
+    ```python
+    import redux as rd
+
+    async def main() -> None:
+        @rd.listen(CameraSlice.roi, policy="debounce", wait=0.2)
+        async def reprocess(roi: Roi) -> None:
+            histogram = await asyncio.to_thread(compute_histogram, roi)
+            rd.dispatch(StatsSlice.set_histogram, histogram)
+    ```
+    """
+    if policy not in _POLICIES:
+        raise ValueError(f"Unknown policy '{policy}', expected one of {_POLICIES}")
+    if wait < 0:
+        raise ValueError(f"Debounce wait must not be negative, got {wait}")
+    event_loop = loop if loop is not None else asyncio.get_running_loop()
+
+    def register_effect(effect: Effect, /) -> Callable[[], None]:
+        if not inspect.iscoroutinefunction(effect):
+            raise TypeError(f"Expected an async effect, got {effect!r}")
+        listener = _Listener(effect, policy, wait, event_loop)
+        if isinstance(trigger, StatePath):
+            stop_listening = _listen_state(trigger, listener)
+        else:
+            stop_listening = _listen_predicate(trigger, listener)
+
+        def unsubscribe() -> None:
+            stop_listening()
+            listener.cancel()
+
+        return unsubscribe
+
+    return register_effect
+
+
+def _listen_state(path: StatePath, listener: _Listener) -> Callable[[], None]:
+    # `subscribe` calls back once with the current value, which is not a change
+    subscribed = False
+
+    def on_change(value: Any) -> None:
+        if subscribed:
+            listener.trigger(value)
+
+    unsubscribe = subscribe(path)(on_change)
+    subscribed = True
+    return unsubscribe
+
+
+def _listen_predicate(
+    predicate: Callable[[Slice, frozenset[str]], bool], listener: _Listener
+) -> Callable[[], None]:
+    def on_change(
+        _root_slice_name: str, new_slice: Slice, changed: tuple[str, ...], _revision: int
+    ) -> None:
+        if predicate(new_slice, frozenset(changed)):
+            listener.trigger(new_slice)
+
+    _store._CHANGE_LISTENERS.append(on_change)
+
+    def unsubscribe() -> None:
+        if on_change in _store._CHANGE_LISTENERS:
+            _store._CHANGE_LISTENERS.remove(on_change)
+
+    return unsubscribe
@@ -0,0 +1,117 @@
+"""Reducers run in a process pool, declared with `reduce(offload="process")`."""
+
+# Access to protected members of the store module
+# pylint: disable=W0212
+
+from __future__ import annotations
+
+import threading
+from collections import defaultdict, deque
+from collections.abc import Callable
+from concurrent.futures import Executor, Future, ProcessPoolExecutor
+from functools import partial
+from typing import Any
+
+from . import store as _store
+from .slice import Slice
+
+__all__ = ["set_offload_executor"]
+
+# reducers declared with `offload="process"`
+_OFFLOADED_REDUCERS: set[Callable[..., Any]] = set()
+_OFFLOAD_EXECUTOR: Executor | None = None
+_OFFLOAD_CALL: Callable[[Callable[[], None]], None] | None = None
+# offloaded dispatches by root slice name, the first one is running
+_OFFLOAD_QUEUES: defaultdict[str, deque[tuple[Callable[..., Any], Any, Future[bool]]]] = (
+    defaultdict(deque)
+)
+_OFFLOAD_LOCK = threading.Lock()
+
+
+def set_offload_executor(
+    executor: Executor | None = None,
+    call: Callable[[Callable[[], None]], None] | None = None,
+) -> None:
+    """Set where reducers declared with `offload="process"` run and commit.
+
+    Args:
+        executor: The executor running the reducers. Defaults to a `ProcessPoolExecutor`
+            created on the first offloaded dispatch. The previous executor is not shut down.
+        call: Run the commit of each result. Defaults to committing from the thread of the
+            executor that finished the reducer, once the dispatch in progress on another
+            thread is done, see `dispatch`. Subscribers are then called on that thread:
+            pass e.g. `loop.call_soon_threadsafe` to commit on the thread of an event loop.
+    """
+    global _OFFLOAD_EXECUTOR, _OFFLOAD_CALL  # pylint: disable=W0603
+    _OFFLOAD_EXECUTOR = executor
+    _OFFLOAD_CALL = call
+
+
+def _offload(root_slice_name: str, reducer: Callable, payload: Any) -> Future[bool]:
+    """Queue an offloaded dispatch, it runs once those before it on the slice are done."""
+    done: Future[bool] = Future()
+    with _OFFLOAD_LOCK:
+        queue = _OFFLOAD_QUEUES[root_slice_name]
+        queue.append((reducer, payload, done))
+        if len(queue) > 1:
+            return done
+    _start_offloaded(root_slice_name)
+    return done
+
+
+def _start_offloaded(root_slice_name: str) -> None:
+    global _OFFLOAD_EXECUTOR  # pylint: disable=W0603
+    reducer, payload, _ = _OFFLOAD_QUEUES[root_slice_name][0]
+    try:
+        base = _store._get_slice_from_name(root_slice_name)
+        if _OFFLOAD_EXECUTOR is None:
+            _OFFLOAD_EXECUTOR = ProcessPoolExecutor()
+        future = _OFFLOAD_EXECUTOR.submit(_store._apply_reducer, reducer, base, payload)
+    except Exception as e:  # pylint: disable=W0718
+        _finish_offloaded(root_slice_name, None, e)
+        return
+    call = _OFFLOAD_CALL if _OFFLOAD_CALL is not None else _store._call_directly
+    future.add_done_callback(
+        lambda future: call(partial(_finish_offloaded, root_slice_name, base, future))
+    )
+
+
+def _finish_offloaded(
+    root_slice_name: str, base: Slice | None, result: Future[Slice] | Exception
+) -> None:
+    """Commit the result of an offloaded reducer and start the next one on the slice."""
+    with _OFFLOAD_LOCK:
+        _, _, done = _OFFLOAD_QUEUES[root_slice_name].popleft()
+    try:
+        if isinstance(result, Exception):
+            raise result
+        new_slice = result.result()
+        _store._run_to_completion(_commit_offloaded, root_slice_name, base, new_slice, done)
+    except Exception as e:  # pylint: disable=W0718
+        if not done.done():
+            done.set_exception(e)
+    with _OFFLOAD_LOCK:
+        if not _OFFLOAD_QUEUES[root_slice_name]:
+            del _OFFLOAD_QUEUES[root_slice_name]
+            return
+    _start_offloaded(root_slice_name)
+
+
+def _commit_offloaded(
+    root_slice_name: str, base: Slice, new_slice: Slice, done: Future[bool]
+) -> None:
+    # stale if another dispatch changed the slice while the reducer ran
+    store = _store.STORE
+    if store is None or root_slice_name not in store or store[root_slice_name] is not base:
+        done.set_result(False)
+        return
+    try:
+        if _store._TRACER is None:
+            _store._transaction(_store._commit, root_slice_name, new_slice)
+        else:
+            with _store._TRACER.span(f"commit offloaded {root_slice_name}", "dispatch"):
+                _store._transaction(_store._commit, root_slice_name, new_slice)
+    except Exception as e:
+        done.set_exception(e)
+        raise
+    done.set_result(True)
@@ -0,0 +1,112 @@
+"""Priority lanes of the subscribers: critical ones first, idle ones when drained."""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from typing import TYPE_CHECKING, Any, Literal
+
+if TYPE_CHECKING:
+    from .store import SliceSubscriptionEntry, SubscriptionEntry
+
+__all__ = ["drain_notifications", "set_idle_scheduler"]
+
+# lane of a subscription: critical ones are called first, idle ones by `drain_notifications`
+Priority = Literal["critical", "normal", "idle"]
+# entries of critical subscriptions by id, they lead the lists of entries
+_CRITICAL_ENTRIES: dict[int, SubscriptionEntry | SliceSubscriptionEntry] = {}
+# idle subscriptions notified since the last drain, in order of notification, as the
+# function notified in place of the callback -> (callback, latest arguments)
+_IDLE_NOTIFICATIONS: dict[
+    Callable[..., None], tuple[Callable[..., None], tuple[Any, ...]]
+] = {}
+_IDLE_SCHEDULER: Callable[[Callable[[], int]], None] | None = None
+
+
+def _clear_lanes() -> None:
+    _CRITICAL_ENTRIES.clear()
+    _IDLE_NOTIFICATIONS.clear()
+
+
+def _check_priority(priority: str) -> None:
+    if priority not in ("critical", "normal", "idle"):
+        raise ValueError(f"Unknown priority '{priority}', expected critical, normal or idle")
+
+
+def _add_entry(entries: list[Any], entry: Any, priority: Priority) -> None:
+    """Add a subscription entry after the critical entries, or last if it is not critical."""
+    if priority != "critical":
+        entries.append(entry)
+        return
+    index = 0
+    while index < len(entries) and id(entries[index]) in _CRITICAL_ENTRIES:
+        index += 1
+    entries.insert(index, entry)
+    _CRITICAL_ENTRIES[id(entry)] = entry
+
+
+def _forget_entry(entry: SubscriptionEntry | SliceSubscriptionEntry) -> None:
+    if _CRITICAL_ENTRIES.get(id(entry)) is entry:
+        del _CRITICAL_ENTRIES[id(entry)]
+    _IDLE_NOTIFICATIONS.pop(entry[0], None)
+
+
+def _merge_changed_states(
+    pending: tuple[Any, ...], latest: tuple[Any, ...]
+) -> tuple[Any, ...]:
+    return latest[0], pending[1] | latest[1]
+
+
+def _defer_to_idle(
+    callback: Callable[..., None],
+    merge: Callable[[tuple[Any, ...], tuple[Any, ...]], tuple[Any, ...]] | None = None,
+) -> Callable[..., None]:
+    """Wrap a callback so that notifying it only keeps its arguments until drained."""
+
+    def notify_when_idle(*args: Any) -> None:
+        pending = _IDLE_NOTIFICATIONS.get(notify_when_idle)
+        if pending is not None and merge is not None:
+            args = merge(pending[1], args)
+        if not _IDLE_NOTIFICATIONS and _IDLE_SCHEDULER is not None:
+            _IDLE_SCHEDULER(drain_notifications)
+        _IDLE_NOTIFICATIONS[notify_when_idle] = (callback, args)
+
+    notify_when_idle.__qualname__ = getattr(callback, "__qualname__", repr(callback))
+    return notify_when_idle
+
+
+def drain_notifications() -> int:
+    """Call the idle subscribers notified since they were last called.
+
+    Each subscriber is called once, with the latest values it was notified of, in the
+    order they were first notified. Subscribers notified while draining are called by the
+    next drain. Call it when the application is idle, e.g. from a timer of the GUI, or
+    let `set_idle_scheduler` call it.
+
+    Returns:
+        The number of subscribers called.
+    """
+    global _IDLE_NOTIFICATIONS  # pylint: disable=W0603
+    pending, _IDLE_NOTIFICATIONS = _IDLE_NOTIFICATIONS, {}
+    called = 0
+    try:
+        while pending:
+            callback, args = pending.pop(next(iter(pending)))
+            callback(*args)
+            called += 1
+    finally:
+        # a subscriber failed, the next ones are called by the next drain
+        if pending:
+            _IDLE_NOTIFICATIONS = {**pending, **_IDLE_NOTIFICATIONS}
+    return called
+
+
+def set_idle_scheduler(schedule: Callable[[Callable[[], int]], None] | None) -> None:
+    """Set how idle subscribers are called.
+
+    Args:
+        schedule: Called with `drain_notifications` when an idle subscriber is notified
+            and none was waiting, e.g. `loop.call_soon_threadsafe` or a function starting
+            a zero-delay timer of the GUI. None to only drain with `drain_notifications`.
+    """
+    global _IDLE_SCHEDULER  # pylint: disable=W0603
+    _IDLE_SCHEDULER = schedule
@@ -0,0 +1,439 @@
+"""Cached data fetching on top of the store, in the style of RTK Query."""
+
+# Access to protected members of the store module
+# pylint: disable=W0212
+# Reducers take the slice as first argument
+# pylint: disable=E0213
+
+from __future__ import annotations
+
+import asyncio
+import inspect
+import threading
+import time
+from collections.abc import Callable, Coroutine
+from concurrent.futures import Future
+from typing import Any, Literal, NamedTuple
+
+from . import store as _store
+from .injection import inject_slice
+from .reducers import dispatch, reduce
+from .slice import Slice
+
+__all__ = ["QueryCache", "QueryEndpoint", "QueryResult", "QuerySlice", "QuerySubscription"]
+
+
+class QueryResult(NamedTuple):
+    """State of one query in the store.
+
+    `data` and `fetched_at` are kept while the query is fetched again, and when fetching it
+    again fails, so widgets can show the last data.
+    """
+
+    status: Literal["pending", "fulfilled", "rejected"]
+    data: Any = None
+    error: str | None = None
+    # `time.monotonic()` when `data` was fetched
+    fetched_at: float | None = None
+
+
+class QuerySlice(Slice):
+    """Results of the queries of every `QueryCache`, by query key.
+
+    Query caches add this slice to the store when they are first used, unless the store
+    already has it.
+    """
+
+    results: dict[str, QueryResult]
+
+    @reduce
+    def set_result(piece: QuerySlice, update: tuple[str, QueryResult]) -> QuerySlice:
+        """Set the result of a query."""
+        key, result = update
+        return piece.update([(QuerySlice.results, {**piece.results, key: result})])
+
+    @reduce
+    def remove_results(piece: QuerySlice, keys: tuple[str, ...]) -> QuerySlice:
+        """Remove the results of queries."""
+        results = {key: result for key, result in piece.results.items() if key not in keys}
+        return piece.update([(QuerySlice.results, results)])
+
+
+# query caches of every thread add `QuerySlice` to the store once
+_INJECT_LOCK = threading.Lock()
+
+
+class QueryCache:  # pylint: disable=R0902
+    """Fetch data once for every widget asking for it, and keep it in the store.
+
+    Queries are keyed by endpoint and arguments. Their results are stored in `QuerySlice`
+    and reused until their time to live expires. Asking for a query being fetched waits for
+    that fetch instead of starting another one. Asking for an expired query returns the
+    expired data and fetches it again in the background.
+
+    Endpoints are sync or async functions. Sync endpoints are fetched in the calling thread
+    by `QueryEndpoint.query` and in a background thread otherwise. Async endpoints are
+    fetched as tasks of an event loop, whichever thread asks for them.
+
+    Args:
+        ttl: Seconds during which fetched data is used without fetching it again, for
+            endpoints that do not set their own.
+        keep_unused_for: Seconds after which `evict` removes queries nobody subscribes to.
+        call: Run the dispatches committing results. Defaults to dispatching from the
+            thread that fetched, which waits for a dispatch in progress on another thread,
+            see `redux.dispatch`. Pass e.g. `loop.call_soon_threadsafe` to have subscribers
+            of the results called on the thread of an event loop instead.
+        loop: The event loop fetching async endpoints. Defaults to the loop running when
+            the endpoint is registered, or else when it is first fetched.
+
+    Example:
+
+    ```python
+    import redux as rd
+
+    queries = rd.QueryCache(ttl=30)
+
+    @queries.endpoint
+    def device_metadata(serial: str) -> dict[str, str]:
+        return backend.get(f"/devices/{serial}")
+
+    # every widget asking at once shares one fetch
+    metadata = device_metadata.query("SN-1")
+    with device_metadata.subscribe("SN-1") as subscription:
+        print(subscription.result)
+    ```
+    """
+
+    def __init__(
+        self,
+        *,
+        ttl: float = 60.0,
+        keep_unused_for: float = 60.0,
+        call: Callable[[Callable[[], None]], None] | None = None,
+        loop: asyncio.AbstractEventLoop | None = None,
+    ) -> None:
+        self.ttl = ttl
+        self.keep_unused_for = keep_unused_for
+        self.loop = loop
+        self._call = call if call is not None else _store._call_directly
+        self._lock = threading.Lock()
+        self._in_flight: dict[str, Future[Any]] = {}
+        # tasks fetching async endpoints, referenced until they are done
+        self._tasks: set[asyncio.Task[None]] = set()
+        # endpoint and arguments of each query, to fetch it again
+        self._queries: dict[str, tuple[QueryEndpoint, tuple[Any, ...]]] = {}
+        self._refs: dict[str, int] = {}
+        self._last_used: dict[str, float] = {}
+        self._invalid: set[str] = set()
+
+    def endpoint(
+        self,
+        fetch: Callable[..., Any] | None = None,
+        *,
+        name: str | None = None,
+        ttl: float | None = None,
+    ) -> Any:
+        """Register a function fetching data as an endpoint of the cache.
+
+        Use as `@cache.endpoint` or `@cache.endpoint(ttl=...)`.
+
+        Args:
+            fetch: A sync or async function fetching the data for its arguments, which
+                must have a stable `repr`.
+            name: Name of the endpoint in query keys. Defaults to the qualified name of
+                `fetch`.
+            ttl: Time to live of the data of this endpoint. Defaults to the cache's.
+        """
+
+        def register(fetch: Callable[..., Any]) -> QueryEndpoint:
+            return QueryEndpoint(self, fetch, name or fetch.__qualname__, ttl)
+
+        return register if fetch is None else register(fetch)
+
+    def refetch_stale(self) -> list[str]:
+        """Fetch again the subscribed queries whose data expired, in the background.
+
+        Call it from a timer to keep subscribed data fresh. Returns the keys of the queries
+        being fetched.
+        """
+        with self._lock:
+            subscribed = [self._queries[key] for key, refs in self._refs.items() if refs]
+        started = []
+        for endpoint, args in subscribed:
+            key = endpoint.key(*args)
+            if key not in self._in_flight and self._is_stale(endpoint, key):
+                self._start(endpoint, args, background=True)
+                started.append(key)
+        return started
+
+    def evict(self) -> list[str]:
+        """Remove the queries nobody subscribed to for `keep_unused_for` seconds.
+
+        Returns the keys of the removed queries.
+        """
+        now = time.monotonic()
+        with self._lock:
+            evicted = tuple(
+                key
+                for key, last_used in self._last_used.items()
+                if not self._refs.get(key)
+                and key not in self._in_flight
+                and now - last_used >= self.keep_unused_for
+            )
+            for key in evicted:
+                del self._queries[key], self._last_used[key]
+                self._refs.pop(key, None)
+                self._invalid.discard(key)
+        if evicted and "QuerySlice" in _store.SLICE_TREE:
+            self._call(lambda: dispatch(QuerySlice.remove_results, evicted))
+        return list(evicted)
+
+    def _result(self, key: str) -> QueryResult | None:
+        if "QuerySlice" not in _store.SLICE_TREE:
+            with _INJECT_LOCK:
+                if "QuerySlice" not in _store.SLICE_TREE:
+                    _store._check_store_init()
+                    inject_slice(QuerySlice(results={}), name="queries", notify=False)
+        return _store.get_state(QuerySlice.results).get(key)
+
+    def _is_stale(self, endpoint: QueryEndpoint, key: str) -> bool:
+        result = self._result(key)
+        if result is None or result.fetched_at is None or key in self._invalid:
+            return True
+        ttl = self.ttl if endpoint.ttl is None else endpoint.ttl
+        return time.monotonic() - result.fetched_at >= ttl
+
+    def _use(self, endpoint: QueryEndpoint, args: tuple[Any, ...], refs: int = 0) -> str:
+        key = endpoint.key(*args)
+        with self._lock:
+            self._queries.setdefault(key, (endpoint, args))
+            self._last_used[key] = time.monotonic()
+            if refs:
+                self._refs[key] = self._refs.get(key, 0) + refs
+        return key
+
+    def _commit(self, key: str, result: QueryResult) -> None:
+        self._call(lambda: dispatch(QuerySlice.set_result, (key, result)))
+
+    def _start(
+        self, endpoint: QueryEndpoint, args: tuple[Any, ...], background: bool
+    ) -> Future[Any]:
+        """Fetch a query, or get the fetch of it in progress."""
+        key = endpoint.key(*args)
+        loop = endpoint._get_loop() if endpoint.is_async else None
+        with self._lock:
+            future = self._in_flight.get(key)
+            if future is not None:
+                return future
+            future = Future()
+            self._in_flight[key] = future
+        previous = self._result(key)
+        self._commit(
+            key,
+            QueryResult("pending")
+            if previous is None
+            else previous._replace(status="pending", error=None),
+        )
+        if loop is not None:
+            fetch = self._fetch_async(endpoint, args, key, future)
+            try:
+                loop.call_soon_threadsafe(self._create_task, fetch, key, future, previous)
+            except RuntimeError as e:  # the loop is closed
+                fetch.close()
+                self._settle(key, future, error=e)
+        elif background:
+            threading.Thread(
+                target=self._fetch, args=(endpoint, args, key, future), daemon=True
+            ).start()
+        else:
+            self._fetch(endpoint, args, key, future)
+        return future
+
+    def _fetch(
+        self, endpoint: QueryEndpoint, args: tuple[Any, ...], key: str, future: Future[Any]
+    ) -> None:
+        try:
+            data = endpoint.fetch(*args)
+        except Exception as e:  # pylint: disable=W0718
+            self._settle(key, future, error=e)
+        else:
+            self._settle(key, future, data=data)
+
+    def _create_task(
+        self,
+        fetch: Coroutine[Any, Any, None],
+        key: str,
+        future: Future[Any],
+        previous: QueryResult | None,
+    ) -> None:
+        task = asyncio.get_running_loop().create_task(fetch)
+        self._tasks.add(task)
+
+        def on_done(task: asyncio.Task[None]) -> None:
+            self._tasks.discard(task)
+            if task.cancelled():
+                self._cancel(key, future, previous)
+
+        task.add_done_callback(on_done)
+
+    def _cancel(self, key: str, future: Future[Any], previous: QueryResult | None) -> None:
+        """Put back the result a cancelled fetch replaced by a pending one."""
+        with self._lock:
+            if self._in_flight.get(key) is future:
+                del self._in_flight[key]
+        if previous is None:
+            self._call(lambda: dispatch(QuerySlice.remove_results, (key,)))
+        else:
+            self._commit(key, previous)
+        future.cancel()
+
+    async def _fetch_async(
+        self, endpoint: QueryEndpoint, args: tuple[Any, ...], key: str, future: Future[Any]
+    ) -> None:
+        try:
+            data = await endpoint.fetch(*args)
+        except Exception as e:  # pylint: disable=W0718
+            self._settle(key, future, error=e)
+        else:
+            self._settle(key, future, data=data)
+
+    def _settle(
+        self, key: str, future: Future[Any], data: Any = None, error: Exception | None = None
+    ) -> None:
+        previous = self._result(key)
+        if error is None:
+            self._invalid.discard(key)
+            self._commit(key, QueryResult("fulfilled", data, None, time.monotonic()))
+        else:
+            self._commit(
+                key,
+                QueryResult("rejected", error=str(error))
+                if previous is None
+                else previous._replace(status="rejected", error=str(error)),
+            )
+        with self._lock:
+            self._in_flight.pop(key, None)
+        if error is None:
+            future.set_result(data)
+        else:
+            future.set_exception(error)
+
+
+class QueryEndpoint:
+    """A function fetching data, registered in a `QueryCache` with `QueryCache.endpoint`."""
+
+    def __init__(
+        self, cache: QueryCache, fetch: Callable[..., Any], name: str, ttl: float | None
+    ) -> None:
+        self.cache = cache
+        self.fetch = fetch
+        self.name = name
+        self.ttl = ttl
+        self.is_async = inspect.iscoroutinefunction(fetch)
+        self.loop = cache.loop
+        if self.loop is None and self.is_async:
+            try:
+                self.loop = asyncio.get_running_loop()
+            except RuntimeError:  # taken from the first fetch instead
+                pass
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self.name!r})"
+
+    def _get_loop(self) -> asyncio.AbstractEventLoop:
+        if self.loop is None:
+            try:
+                self.loop = asyncio.get_running_loop()
+            except RuntimeError:
+                raise RuntimeError(
+                    f"Endpoint '{self.name}' is async and has no event loop, pass `loop` "
+                    + "to its cache or fetch it from the loop first"
+                ) from None
+        return self.loop
+
+    def key(self, *args: Any) -> str:
+        """Get the key of the query for these arguments in `QuerySlice.results`."""
+        return f"{self.name}({', '.join(map(repr, args))})"
+
+    def result(self, *args: Any) -> QueryResult | None:
+        """Get the result of the query in the store, without fetching it."""
+        return self.cache._result(self.key(*args))
+
+    def query(self, *args: Any) -> Any:
+        """Get the data for these arguments, fetching it in this thread if needed.
+
+        Raises:
+            TypeError: If the endpoint is async, use `query_async`.
+            Exception: The exception raised by the fetch, if it failed.
+        """
+        if self.is_async:
+            raise TypeError(f"Endpoint '{self.name}' is async, use `query_async`")
+        key = self.cache._use(self, args)
+        result = self.cache._result(key)
+        if result is not None and result.fetched_at is not None:
+            if self.cache._is_stale(self, key):
+                self.cache._start(self, args, background=True)
+            return result.data
+        return self.cache._start(self, args, background=False).result()
+
+    async def query_async(self, *args: Any) -> Any:
+        """Get the data for these arguments, fetching it without blocking the event loop.
+
+        Raises:
+            Exception: The exception raised by the fetch, if it failed.
+        """
+        key = self.cache._use(self, args)
+        result = self.cache._result(key)
+        if result is not None and result.fetched_at is not None:
+            if self.cache._is_stale(self, key):
+                self.cache._start(self, args, background=True)
+            return result.data
+        return await asyncio.wrap_future(self.cache._start(self, args, background=True))
+
+    def subscribe(self, *args: Any) -> QuerySubscription:
+        """Keep the query in the cache and fetch it in the background if needed.
+
+        Subscribed queries are not evicted and are fetched again by `refetch_stale`. Release
+        the subscription, or use it as a context manager, once the data is not needed.
+        """
+        key = self.cache._use(self, args, refs=1)
+        if key not in self.cache._in_flight and self.cache._is_stale(self, key):
+            self.cache._start(self, args, background=True)
+        return QuerySubscription(self, key)
+
+    def invalidate(self, *args: Any) -> None:
+        """Mark the data of the query as expired, fetching it again if it is subscribed."""
+        key = self.key(*args)
+        self.cache._invalid.add(key)
+        if self.cache._refs.get(key):
+            self.cache._start(self, args, background=True)
+
+
+class QuerySubscription:
+    """Subscription of a widget to a query, see `QueryEndpoint.subscribe`."""
+
+    def __init__(self, endpoint: QueryEndpoint, key: str) -> None:
+        self.endpoint = endpoint
+        self.key = key
+        self._released = False
+
+    def __enter__(self) -> QuerySubscription:
+        return self
+
+    def __exit__(self, *_: object) -> None:
+        self.release()
+
+    @property
+    def result(self) -> QueryResult | None:
+        """Result of the query in the store."""
+        return self.endpoint.cache._result(self.key)
+
+    def release(self) -> None:
+        """Release the query so it can be evicted. Releasing twice does nothing."""
+        if self._released:
+            return
+        self._released = True
+        cache = self.endpoint.cache
+        with cache._lock:
+            cache._refs[self.key] -= 1
+            cache._last_used[self.key] = time.monotonic()
@@ -0,0 +1,305 @@
+"""Reducers declared on slices, and their dispatch."""
+
+# Access to protected members of the store module
+# pylint: disable=W0212
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from concurrent.futures import Future
+from typing import Any, Literal, cast, overload
+
+from . import store as _store
+from .offload import _OFFLOADED_REDUCERS, _offload
+from .slice import Slice, StatePath
+from .store import (
+    _EXTRA_REDUCER_CACHE,
+    _EXTRA_REDUCER_KEYS,
+    _EXTRA_REDUCER_KEYS_BY_NOTIFIER,
+    _EXTRA_REDUCER_ORDER,
+    _REDUCER_MEMOS,
+    AnySlice,
+    AnyState,
+    ArgT,
+    SubscriptionEntry,
+    _apply_memoized_reducer,
+    _apply_reducer,
+    _commit,
+    _dispatch,
+    _ExtraReducerCacheKey,
+    _get_root_slice_name,
+    _get_slice_from_name,
+    _get_slice_name_fm_reducer,
+    _run_reducer,
+    _run_to_completion,
+    _transaction,
+)
+
+__all__ = ["dispatch", "reduce", "extra_reduce"]
+
+
+# For callables that take only one argument (no payload)
+@overload
+def dispatch(reducer: Callable[[AnySlice], AnySlice]) -> Future[bool] | None: ...
+
+
+# For callables that take two arguments (with payload)
+@overload
+def dispatch(
+    reducer: Callable[[AnySlice, AnyState], AnySlice],
+    payload: AnyState,
+) -> Future[bool] | None: ...
+
+
+def dispatch(reducer, payload=None):
+    """Dispatch a reducer function to change the state of the store.
+
+    Dispatches made from several threads run one at a time: a dispatch waits for the
+    dispatch in progress on another thread, including the dispatches it caused, to finish.
+    Do not wait from a subscriber for a dispatch made on another thread.
+
+    Args:
+        reducer: A function that takes a slice and optionally a payload, and
+            returns a new slice.
+        payload: The new value for the state. The data type of payload must match the type
+            annotation of the state in the slice.
+
+    Returns:
+        None, or for a reducer declared with `offload="process"`, a future resolving to
+        True once its result is committed, or to False if the result was discarded.
+
+    ```python
+    from __future__ import annotations
+    import redux as rd
+
+    class CameraSlice(rd.Slice):
+        exposure: float = 0.0
+        gain: float = 0.0
+
+        # reducer can take in a payload
+        @rd.reduce
+        def set_exposure_s(piece: CameraSlice, exposure: float) -> CameraSlice:
+            return piece.update([(CameraSlice.exposure, exposure)])
+
+        # reducer can take no payload
+        @rd.reduce
+        def reset_exposure_s(piece: CameraSlice) -> CameraSlice:
+            return piece.update([(CameraSlice.exposure, 0.0)])
+
+    class Store(rd.Store):
+        camera: CameraSlice
+
+    rd.create_store(Store(camera=CameraSlice(exposure=0.1, gain=0.2)))
+
+    rd.dispatch(CameraSlice.set_exposure_s, 0.5)
+    assert rd.get_state(CameraSlice.exposure) == 0.5
+
+    rd.dispatch(CameraSlice.reset_exposure_s)
+    assert rd.get_state(CameraSlice.exposure) == 0.0
+    ```
+    """
+    if not callable(reducer):
+        raise TypeError(f"Expected a callable, got {type(reducer)}")
+    root_slice_name: str = _get_root_slice_name(_get_slice_name_fm_reducer(reducer))
+    if reducer in _OFFLOADED_REDUCERS:
+        return _offload(root_slice_name, reducer, payload)
+    _run_to_completion(_dispatch_reducer, root_slice_name, reducer, payload)
+    return None
+
+
+def _dispatch_reducer(root_slice_name: str, reducer: Callable, payload: Any) -> None:
+    tracer = _store._TRACER
+    if tracer is None:
+        _transaction(_reduce_and_commit, root_slice_name, reducer, payload)
+    else:
+        with tracer.span(f"dispatch {reducer.__qualname__}", "dispatch", payload=payload):
+            _transaction(_reduce_and_commit, root_slice_name, reducer, payload)
+
+
+def _reduce_and_commit(root_slice_name: str, reducer: Callable, payload: Any) -> None:
+    assert _store.STORE is not None, "Store not initialized"
+    old_slice = _store.STORE[root_slice_name]
+    if reducer in _REDUCER_MEMOS:
+        new_slice = _apply_memoized_reducer(
+            reducer, old_slice, () if payload is None else (payload,)
+        )
+        if new_slice is not old_slice:
+            _commit(root_slice_name, new_slice)
+        return
+    if _store._TRACER is None:
+        new_slice = _apply_reducer(reducer, old_slice, payload)
+    else:
+        with _store._TRACER.span(reducer.__qualname__, "reducer"):
+            new_slice = _apply_reducer(reducer, old_slice, payload)
+    _commit(root_slice_name, new_slice)
+
+
+@overload
+def reduce(
+    reducer: Callable[[AnySlice, AnyState], AnySlice],
+) -> staticmethod[[AnySlice, AnyState], AnySlice]: ...
+
+
+@overload
+def reduce(reducer: Callable[[AnySlice], AnySlice]) -> staticmethod[[AnySlice], AnySlice]: ...
+
+
+@overload
+def reduce(
+    *, memo: bool = False, offload: Literal["process"] | None = None
+) -> Callable[[Callable[..., AnySlice]], staticmethod]: ...
+
+
+def reduce(reducer=None, *, memo=False, offload=None):
+    """Decorator to register a reducer function for a slice.
+
+    Args:
+        reducer: A function that takes a slice and optionally a payload, and
+            returns a new slice.
+        memo: If True, the reducer must be pure. Its recent results are reused when it is
+            dispatched again with the same slice and an equal hashable payload, and a
+            dispatch whose result is equal to the slice in the store does nothing, without
+            committing or comparing states.
+        offload: If "process", the reducer runs in a process pool on a pickled copy of the
+            slice and payload, so it does not hold the GIL of this process, see
+            `set_offload_executor`. `dispatch` returns before it runs. The dispatches of
+            offloaded reducers to one slice run one at a time, in the order they were made,
+            each on the slice in the store when it starts. Its result is committed like a
+            dispatch, unless another dispatch changed the slice while it ran: the result
+            is then stale and discarded. The reducer and slice must be picklable.
+
+    Example:
+
+    ```python
+    from __future__ import annotations
+    import redux as rd
+
+    class CameraSlice(rd.Slice):
+        exposure: float = 0.0
+        gain: float = 0.0
+
+        # reducer can take in a payload
+        @rd.reduce
+        def set_exposure_s(piece: CameraSlice, exposure: float) -> CameraSlice:
+            return piece.update([(CameraSlice.exposure, exposure)])
+
+        # reducer can take no payload
+        @rd.reduce
+        def reset_exposure_s(piece: CameraSlice) -> CameraSlice:
+            return piece.update([(CameraSlice.exposure, 0.0)])
+
+        # dispatched many times with the same payload
+        @rd.reduce(memo=True)
+        def set_gain(piece: CameraSlice, gain: float) -> CameraSlice:
+            return piece.update([(CameraSlice.gain, gain)])
+    ```
+    """
+    if offload not in (None, "process"):
+        raise ValueError(f"Unknown offload '{offload}', expected 'process'")
+    if memo and offload is not None:
+        raise ValueError("Offloaded reducers cannot be memoized")
+    if reducer is None:
+        return lambda reducer: reduce(reducer, memo=memo, offload=offload)
+    if memo:
+        _REDUCER_MEMOS.setdefault(reducer, {})
+    if offload is not None:
+        _OFFLOADED_REDUCERS.add(reducer)
+    return staticmethod(reducer)
+
+
+ReducerNoArgs = Callable[[AnySlice], AnySlice]
+ReducerWithArgs = Callable[[AnySlice, *ArgT], AnySlice]
+StaticReducerNoArgs = staticmethod  # [[AnySlice], AnySlice]
+# staticmethod[[AnySlice, *ArgT], AnySlice] is not supported yet
+StaticReducerWithArgs = staticmethod  # [..., AnySlice]
+
+
+def extra_reduce(
+    *args: *ArgT,
+    memo: bool = False,
+) -> Callable[
+    [ReducerNoArgs[AnySlice] | ReducerWithArgs[AnySlice, *ArgT]],
+    StaticReducerNoArgs | StaticReducerWithArgs,
+]:
+    """Decorator to register an extra reducer function for a slice.
+
+    With `memo=True`, results are reused as with `reduce(memo=True)`, keyed by the slice and
+    the values of the states the extra reducer listens to.
+    """
+
+    @overload
+    def wrap_reducer(reducer: ReducerWithArgs[AnySlice, *ArgT]) -> StaticReducerWithArgs: ...
+
+    @overload
+    def wrap_reducer(reducer: ReducerNoArgs[AnySlice]) -> StaticReducerNoArgs: ...
+
+    def wrap_reducer(reducer, _args=args) -> staticmethod:
+        args_count: int = reducer.__code__.co_argcount
+        if args_count == 0:
+            raise ValueError("Reducer function must accept at least one argument (slice).")
+
+        subscriber_slice_name: str = _get_slice_name_fm_reducer(reducer)
+        if memo:
+            _REDUCER_MEMOS.setdefault(reducer, {})
+        for notifier_state in args:
+            assert isinstance(notifier_state, StatePath)
+            notifier_slice_name = notifier_state.slice_name
+            notifier_state_name = notifier_state.state
+
+            def reducer_in_dispatch_with_args(
+                *states: *ArgT,
+                _reducer: Callable[[Slice, *ArgT], Slice] = reducer,
+                _subscriber_slice_name: str = subscriber_slice_name,
+            ) -> None:
+                _run_to_completion(
+                    _transaction,
+                    _apply_extra_reducer,
+                    _subscriber_slice_name,
+                    _reducer,
+                    states,
+                )
+
+            def reducer_in_dispatch_no_args(
+                *_: *ArgT,
+                _reducer: Callable[[Slice], Slice] = reducer,
+                _subscriber_slice_name: str = subscriber_slice_name,
+            ) -> None:
+                _run_to_completion(
+                    _transaction, _apply_extra_reducer, _subscriber_slice_name, _reducer, ()
+                )
+
+            reducer_in_dispatch_with_args.__qualname__ = reducer.__qualname__
+            reducer_in_dispatch_no_args.__qualname__ = reducer.__qualname__
+            if args_count >= 2:
+                entry: SubscriptionEntry = (
+                    reducer_in_dispatch_with_args,
+                    cast(list[StatePath], list(args)),
+                )
+            else:
+                assert args_count == 1
+                entry = (reducer_in_dispatch_no_args, cast(list[StatePath], list(args)))
+            key = _ExtraReducerCacheKey(
+                subscriber_slice_name, notifier_slice_name, notifier_state_name
+            )
+            if key not in _EXTRA_REDUCER_ORDER:
+                _EXTRA_REDUCER_ORDER[key] = len(_EXTRA_REDUCER_ORDER)
+                _EXTRA_REDUCER_KEYS[subscriber_slice_name].append(key)
+                _EXTRA_REDUCER_KEYS_BY_NOTIFIER[notifier_slice_name].append(key)
+            _EXTRA_REDUCER_CACHE[key].append(entry)
+
+        return staticmethod(reducer)
+
+    return wrap_reducer  # type: ignore[return-value]
+
+
+def _apply_extra_reducer(
+    slice_name: str, reducer: Callable[..., Slice], states: tuple[Any, ...]
+) -> None:
+    old_slice = _get_slice_from_name(slice_name)
+    if reducer in _REDUCER_MEMOS:
+        new_slice = _apply_memoized_reducer(reducer, old_slice, states)
+        if new_slice is old_slice:
+            return
+    else:
+        new_slice = _run_reducer(reducer, old_slice, states)
+    _dispatch(slice_name, new_slice)
@@ -0,0 +1,298 @@
+"""Fixed-capacity ring buffers of samples, for states appended to many times a second."""
+
+# Access to protected members of the store module
+# pylint: disable=W0212
+
+from __future__ import annotations
+
+from array import array
+from collections.abc import Callable, Iterable, Iterator, Sequence
+from typing import Any, overload
+
+from pydantic_core import core_schema
+
+from . import store as _store
+from .slice import StatePath, _data_schema
+from .subscriptions import subscribe
+
+__all__ = ["RingBuffer", "dispatch_append", "subscribe_appends"]
+
+
+class _Storage:  # pylint: disable=R0903
+    """Array shared by the successive versions of a ring buffer."""
+
+    __slots__ = ("array", "filled")
+
+    def __init__(self, data: array[Any], filled: int) -> None:
+        self.array = data
+        # samples after this position are not part of any version
+        self.filled = filled
+
+
+class RingBuffer(Sequence[Any]):
+    """Immutable buffer of the last `capacity` samples appended to it.
+
+    Samples are stored in an `array.array` of `typecode`. `extend` returns a new version of
+    the buffer and leaves this one unchanged, but both share the same array: the new
+    samples are written after the samples of this version, where no version reads. The
+    array holds twice the capacity, and once it is full the samples kept are moved to a
+    new array, so appending a sample costs O(1) on average. Appending to a version that is
+    not the latest one, e.g. after a dispatch failed, moves its samples to a new array.
+
+    Two ring buffers are equal if they have the same capacity, had the same number of
+    samples appended and hold the same samples. Comparing successive versions of a buffer
+    is O(1), so the store can detect an append without comparing the samples.
+
+    Args:
+        capacity: The maximum number of samples kept.
+        samples: The initial samples. Only the last `capacity` ones are kept.
+        typecode: The `array` type code of the samples.
+
+    Example:
+
+    ```python
+    import redux as rd
+
+    class SensorSlice(rd.Slice):
+        temperatures: rd.RingBuffer
+
+    rd.create_store(Store(sensor=SensorSlice(temperatures=rd.RingBuffer(10_000))))
+    rd.subscribe_appends(SensorSlice.temperatures)(plot_new_samples)
+    rd.dispatch_append(SensorSlice.temperatures, [21.5, 21.6])
+    ```
+    """
+
+    __slots__ = ("capacity", "_storage", "_start", "_stop", "_total")
+
+    def __init__(
+        self, capacity: int, samples: Iterable[Any] = (), typecode: str = "d"
+    ) -> None:
+        if capacity <= 0:
+            raise ValueError(f"Ring buffer capacity must be positive, got {capacity}")
+        values = array(typecode, samples)
+        self._init(capacity, values[-capacity:], len(values))
+
+    def _init(self, capacity: int, values: array[Any], total: int) -> None:
+        data = array(values.typecode, bytes(values.itemsize * 2 * capacity))
+        data[: len(values)] = values
+        self.capacity = capacity
+        self._storage = _Storage(data, len(values))
+        self._start = 0
+        self._stop = len(values)
+        # number of samples appended since the buffer was created
+        self._total = total
+
+    @classmethod
+    def _from_values(cls, capacity: int, values: array[Any], total: int) -> RingBuffer:
+        buffer = cls.__new__(cls)
+        buffer._init(capacity, values, total)
+        return buffer
+
+    @property
+    def typecode(self) -> str:
+        """The `array` type code of the samples."""
+        return self._storage.array.typecode
+
+    @property
+    def total(self) -> int:
+        """Number of samples appended since the buffer was created, including dropped ones."""
+        return self._total
+
+    def append(self, sample: Any) -> RingBuffer:
+        """Get a new version of the buffer with `sample` appended."""
+        return self.extend((sample,))
+
+    def extend(self, samples: Iterable[Any]) -> RingBuffer:
+        """Get a new version of the buffer with `samples` appended, dropping the oldest."""
+        storage = self._storage
+        data = storage.array
+        values = (
+            samples
+            if isinstance(samples, array) and samples.typecode == data.typecode
+            else array(data.typecode, samples)
+        )
+        count = len(values)
+        if not count:
+            return self
+        capacity = self.capacity
+        total = self._total + count
+        if count >= capacity:
+            return self._from_values(capacity, values[-capacity:], total)
+        old_stop = self._stop
+        stop = old_stop + count
+        start = max(self._start, stop - capacity)
+        if storage.filled != old_stop or stop > len(data):
+            return self._from_values(capacity, data[start:old_stop] + values, total)
+        data[old_stop:stop] = values
+        storage.filled = stop
+        buffer = RingBuffer.__new__(RingBuffer)
+        buffer.capacity = capacity
+        buffer._storage = storage
+        buffer._start = start
+        buffer._stop = stop
+        buffer._total = total
+        return buffer
+
+    def since(self, previous: RingBuffer | None) -> array[Any]:
+        """Get the samples appended after `previous`, an earlier version of this buffer.
+
+        All the samples are returned if `previous` is None or is not an earlier version.
+        """
+        stop = self._stop
+        start = self._start
+        if previous is not None and previous._total <= self._total:
+            start = max(start, stop - (self._total - previous._total))
+        return self._storage.array[start:stop]
+
+    def view(self) -> memoryview:
+        """Get a read-only view of the samples, without copying them.
+
+        The view can be passed to `numpy.asarray`, which does not copy it either.
+        """
+        start, stop = self._start, self._stop
+        return memoryview(self._storage.array)[start:stop].toreadonly()
+
+    def __len__(self) -> int:
+        return self._stop - self._start
+
+    @overload
+    def __getitem__(self, index: int) -> Any: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> array[Any]: ...
+
+    def __getitem__(self, index):
+        indices = range(self._start, self._stop)[index]
+        if isinstance(indices, int):
+            return self._storage.array[indices]
+        data = self._storage.array
+        if indices.step == 1:
+            start, stop = indices.start, indices.stop
+            return data[start:stop]
+        return array(data.typecode, (data[i] for i in indices))
+
+    def __iter__(self) -> Iterator[Any]:
+        return iter(self.view())
+
+    def __eq__(self, other: object) -> bool:
+        if self is other:
+            return True
+        if not isinstance(other, RingBuffer):
+            return NotImplemented
+        if (
+            self.capacity != other.capacity
+            or self._total != other._total
+            or len(self) != len(other)
+        ):
+            return False
+        if self._storage is other._storage and self._stop == other._stop:
+            return True
+        return self.view() == other.view()
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        return (
+            f"{type(self).__name__}(capacity={self.capacity}, "
+            + f"typecode={self.typecode!r}, samples={len(self)})"
+        )
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        return self._from_values, (self.capacity, self[:], self._total)
+
+    def _to_data(self) -> dict[str, Any]:
+        return {
+            "capacity": self.capacity,
+            "typecode": self.typecode,
+            "samples": self[:].tolist(),
+        }
+
+    @classmethod
+    def _from_data(cls, data: dict[str, Any]) -> RingBuffer:
+        return cls(data["capacity"], data["samples"], data["typecode"])
+
+    @classmethod
+    def __get_pydantic_core_schema__(
+        cls, _source: Any, _handler: Any
+    ) -> core_schema.CoreSchema:
+        data_schema = core_schema.typed_dict_schema(
+            {
+                "capacity": core_schema.typed_dict_field(core_schema.int_schema(gt=0)),
+                "typecode": core_schema.typed_dict_field(core_schema.str_schema()),
+                "samples": core_schema.typed_dict_field(
+                    core_schema.list_schema(core_schema.any_schema())
+                ),
+            }
+        )
+        return _data_schema(cls, data_schema, cls._from_data, cls._to_data)
+
+
+def dispatch_append(state: Any, samples: Iterable[Any]) -> None:
+    """Append samples to a ring buffer state of the store.
+
+    The buffer is extended when the dispatch runs, so appends queued by subscribers are
+    applied to the buffer as it is then. Unlike a list state, the buffer is not copied and
+    detecting the change does not compare the samples.
+
+    Args:
+        state: The ring buffer state, as `SliceName.state_name`.
+        samples: The samples to append.
+
+    Raises:
+        TypeError: If the state is not a `RingBuffer`.
+    """
+    _store._check_store_init()
+    path: StatePath = state
+    root_slice_name = _store._get_root_slice_name(path.slice_name)
+    if not isinstance(samples, (array, list, tuple)):
+        samples = list(samples)
+    _store._run_to_completion(_dispatch_append, root_slice_name, path, samples)
+
+
+def _dispatch_append(root_slice_name: str, state: StatePath, samples: Sequence[Any]) -> None:
+    if _store._TRACER is None:
+        _store._transaction(_append_and_commit, root_slice_name, state, samples)
+    else:
+        with _store._TRACER.span(
+            f"dispatch_append {state.slice_name}.{state.state}", "dispatch", payload=samples
+        ):
+            _store._transaction(_append_and_commit, root_slice_name, state, samples)
+
+
+def _append_and_commit(root_slice_name: str, state: StatePath, samples: Sequence[Any]) -> None:
+    assert _store.STORE is not None, "Store not initialized"
+    old_slice = _store.STORE[root_slice_name]
+    buffer = getattr(old_slice, state.state)
+    if not isinstance(buffer, RingBuffer):
+        raise TypeError(f"State '{state.slice_name}.{state.state}' is not a ring buffer")
+    new_buffer = buffer.extend(samples)
+    if new_buffer is not buffer:
+        _store._commit(root_slice_name, old_slice.update([(state, new_buffer)]))
+
+
+def subscribe_appends(
+    state: Any,
+) -> Callable[[Callable[[array[Any]], None]], Callable[[], None]]:
+    """Subscribe to the samples appended to a ring buffer state.
+
+    The callback receives an `array` of the samples appended by each dispatch, instead of
+    the whole buffer. It is called once with all the samples when it subscribes.
+
+    Args:
+        state: The ring buffer state, as `SliceName.state_name`.
+
+    Returns:
+        A decorator that takes a callback function and returns a function to unsubscribe.
+    """
+
+    def register_callback(callback: Callable[[array[Any]], None], /) -> Callable[[], None]:
+        previous: list[RingBuffer | None] = [None]
+
+        def on_change(buffer: RingBuffer) -> None:
+            samples = buffer.since(previous[0])
+            previous[0] = buffer
+            callback(samples)
+
+        return subscribe(state)(on_change)
+
+    return register_callback
@@ -2,8 +2,10 @@
 
 from __future__ import annotations
 
+from functools import cached_property
 from typing import (
     Any,
+    Callable,
     NamedTuple,
     Self,
     Sequence,
@@ -13,6 +15,7 @@ from typing import (
 )
 
 from pydantic import BaseModel, ConfigDict
+from pydantic_core import core_schema
 
 AnyState = TypeVar("AnyState")
 
@@ -30,62 +33,138 @@ def build_path(slice_name: str, state: str) -> StatePath:
 
 
 _SLICE_REDUX_ANNOTATIONS: dict[tuple[str, str], set[str]] = {}
+# states of each slice class, looked up on every attribute access of a pydantic class
+_SLICE_STATES: dict[type, set[str]] = {}
+# computed states of each slice, mapped to the states they depend on (None for all states)
+_SLICE_COMPUTED: dict[type, dict[str, frozenset[str] | None]] = {}
+
+
+class _ComputedState(cached_property):  # pylint: disable=R0903
+    """Cached property of a slice, computed from other states of the same slice."""
+
+    def __init__(self, func: Callable[[Any], Any], depends_on: frozenset[str] | None) -> None:
+        super().__init__(func)
+        self.depends_on = depends_on
+
+
+@overload
+def computed(func: Callable[[Any], AnyState], /) -> cached_property[AnyState]: ...
+
+
+@overload
+def computed(
+    *depends_on: str,
+) -> Callable[[Callable[[Any], AnyState]], cached_property[AnyState]]: ...
+
+
+def computed(*args):
+    """Decorator to declare a state computed from other states of the same slice.
+
+    The value is computed on first access and cached on the slice. `Slice.update` keeps
+    the cached value unless one of the states it depends on changed. Computed states can be
+    read with `get_state` and subscribed to like any other state.
+
+    Args:
+        *args: Names of the states the computed state depends on. Without them, the
+            computed state depends on every state of the slice.
+
+    Example:
+
+    ```python
+    import redux as rd
+
+    class ImgConfigSlice(rd.Slice):
+        black_level: float = 0.0
+        white_level: float = 1.0
+        bit_depth: int = 8
+
+        @rd.computed("black_level", "white_level", "bit_depth")
+        def display_range(self) -> tuple[int, int]:
+            max_value = 2**self.bit_depth - 1
+            return round(self.black_level * max_value), round(self.white_level * max_value)
+
+    rd.subscribe(ImgConfigSlice.display_range)(print)
+    ```
+    """
+    if len(args) == 1 and callable(args[0]):
+        return _ComputedState(args[0], None)
+    for arg in args:
+        if not isinstance(arg, str):
+            raise TypeError(f"Expected a state name, got {type(arg)}")
+    depends_on = frozenset(args)
+    return lambda func: _ComputedState(func, depends_on)
+
+
+def _get_computed_states(slice_cls: type) -> dict[str, frozenset[str] | None]:
+    """Get the computed states of a slice class."""
+    return _SLICE_COMPUTED.get(slice_cls, {})
+
+
+def _get_slice_attr(cls, attr_name: str) -> StatePath | Any:
+    """Get a class attribute, or the path of the state if the class is a slice."""
+    if attr_name == "slice_name":
+        return type.__getattribute__(cls, "__name__")
+    # classes are hashed by identity, without getting any of their attributes
+    if not attr_name.startswith("_") and attr_name in _SLICE_STATES.get(cls, ()):
+        return StatePath(slice_name=type.__getattribute__(cls, "__name__"), state=attr_name)
+    return type.__getattribute__(cls, attr_name)
 
 
 @dataclass_transform(kw_only_default=True)
 class Slice(BaseModel):
-    """Slice class for managing state in a Redux-like store."""
+    """Slice class for managing state in a Redux-like store.
+
+    The validation schema of a slice class is built when it is first instantiated or
+    validated, or by `create_store`, so that defining many slices is fast.
+    """
 
-    model_config = ConfigDict(frozen=True)
+    model_config = ConfigDict(frozen=True, ignored_types=(_ComputedState,), defer_build=True)
 
     def __init_subclass__(cls, **kwargs):
         super().__init_subclass__(**kwargs)
 
-        def rec_get_annotations(cls: type, cache: set[str]) -> set[str]:
-            if len(cls.__bases__) == 1 and cls.__bases__[0].__name__ == "Slice":
-                return cache
-            for base in cls.__bases__:
-                for base_attr in base.__annotations__.keys():
-                    cache.add(base_attr)
-                cache = rec_get_annotations(base, cache)
-            return cache
-
         module_name: str = cls.__module__
         slice_name: str = cls.__name__
         if (module_name, slice_name) in _SLICE_REDUX_ANNOTATIONS:
             raise TypeError(f"Slice name '{slice_name}' already exists.")
 
-        _SLICE_REDUX_ANNOTATIONS[(module_name, slice_name)] = rec_get_annotations(
-            cls, set(cls.__annotations__.keys())
-        )
-
-        def get_attr_as_internal(cls, attr_name: str) -> StatePath | Any:
-            if attr_name == "slice_name":
-                return cls.__name__
-            if attr_name.startswith("_"):
-                return super(type(cls), cls).__getattribute__(attr_name)  # pylint: disable=E1003
-
-            if (
-                (cls.__module__, cls.__name__) in _SLICE_REDUX_ANNOTATIONS  # is a slice
-                and attr_name
-                in _SLICE_REDUX_ANNOTATIONS[(cls.__module__, cls.__name__)]  # is a state
-            ):
-                return StatePath(
-                    slice_name=cls.__name__,
-                    state=attr_name,
+        # the classes declaring states, up to Slice itself
+        bases = [base for base in cls.__mro__ if base not in _SLICE_MRO]
+        annotations = {
+            name for base in bases for name in vars(base).get("__annotations__", ())
+        }
+        computed_states = {
+            name: attr.depends_on
+            for base in reversed(bases)
+            for name, attr in vars(base).items()
+            if isinstance(attr, _ComputedState)
+        }
+        for name, depends_on in computed_states.items():
+            if depends_on is not None and not depends_on <= annotations:
+                raise TypeError(
+                    f"Computed state '{name}' depends on unknown states "
+                    + f"{sorted(depends_on - annotations)} of slice '{slice_name}'"
                 )
-            return super(type(cls), cls).__getattribute__(attr_name)  # pylint: disable=E1003
+        states = annotations | set(computed_states)
+        _SLICE_REDUX_ANNOTATIONS[(module_name, slice_name)] = states
+        _SLICE_STATES[cls] = states
+        if computed_states:
+            _SLICE_COMPUTED[cls] = computed_states
 
-        cls.__class__.__getattribute__ = get_attr_as_internal
+        cls.__class__.__getattribute__ = _get_slice_attr
 
     @property
     def slice_name(self) -> str:
         """Return the name of the slice."""
         return self.__class__.__name__
 
+    def has_state(self, key: str) -> bool:
+        """Check if the slice has a state or a computed state named `key`."""
+        return key in self.model_fields_set or key in _get_computed_states(self.__class__)
+
     def get_state(self, key: str) -> Any:
         """Get the state of a specific key."""
-        if key not in self.model_fields_set:
+        if not self.has_state(key):
             raise KeyError(f"State '{key}' not found in slice '{self.__class__.__name__}'")
         return getattr(self, key)
 
@@ -96,7 +175,62 @@ class Slice(BaseModel):
     def update(self, update_states: Sequence[tuple[AnyState, AnyState]]) -> Self: ...
 
     def update(self, update_states):
-        """Update the slice state with new values by creating a new instance."""
-        return self.model_copy(
-            update={update_path.state: new_state for update_path, new_state in update_states}
-        )
+        """Update the slice state with new values by creating a new instance.
+
+        Cached computed states are carried over unless a state they depend on changed.
+
+        Raises:
+            TypeError: If one of the states is a computed state.
+        """
+        updates = {update_path.state: new_state for update_path, new_state in update_states}
+        computed_states = _get_computed_states(self.__class__)
+        if computed_states and not computed_states.keys().isdisjoint(updates):
+            name = next(name for name in updates if name in computed_states)
+            raise TypeError(
+                f"Computed state '{name}' of slice '{self.__class__.__name__}' "
+                + "cannot be updated"
+            )
+        new_slice = self.model_copy(update=updates)
+        if computed_states:
+            changed = {
+                name
+                for name, value in updates.items()
+                if name not in self.__dict__ or self.__dict__[name] != value
+            }
+            for name, depends_on in computed_states.items():
+                if name in new_slice.__dict__ and not changed.isdisjoint(
+                    updates if depends_on is None else depends_on
+                ):
+                    del new_slice.__dict__[name]
+        return new_slice
+
+
+_SLICE_MRO = frozenset(Slice.__mro__)
+
+
+def _complete_slice(slice_type: type[Slice]) -> None:
+    """Build the validation schema of a slice class if it is not built yet."""
+    if not slice_type.__pydantic_complete__:
+        slice_type.model_rebuild()
+
+
+def _data_schema(
+    cls: type,
+    data_schema: core_schema.CoreSchema,
+    from_data: Callable[[Any], Any],
+    to_data: Callable[[Any], Any],
+) -> core_schema.CoreSchema:
+    """Get the schema of a state type stored in its data form, validated by `data_schema`.
+
+    Instances of `cls` are accepted as they are, the data form is passed to `from_data`.
+    """
+    validated = core_schema.no_info_after_validator_function(from_data, data_schema)
+    return core_schema.json_or_python_schema(
+        json_schema=validated,
+        python_schema=core_schema.union_schema(
+            [core_schema.is_instance_schema(cls), validated]
+        ),
+        serialization=core_schema.plain_serializer_function_ser_schema(
+            to_data, return_schema=data_schema
+        ),
+    )
@@ -0,0 +1,131 @@
+"""Read-only snapshots of the store, published at the end of each dispatch."""
+
+from __future__ import annotations
+
+from typing import Any, TypeVar, cast
+
+from .slice import Slice, StatePath
+
+__all__ = ["StoreSnapshot", "snapshot"]
+
+AnySlice = TypeVar("AnySlice", bound=Slice)
+
+
+class StoreSnapshot:
+    """Read-only view of the store as it was at the end of a dispatch, see `snapshot`."""
+
+    __slots__ = ("revision", "generation", "_slices", "_recent", "_tree")
+
+    def __init__(
+        self,
+        revision: int,
+        generation: int,
+        slices: dict[str, Slice],
+        tree: dict[str, str],
+        recent: dict[str, Slice] | None = None,
+    ) -> None:
+        self.revision = revision
+        self.generation = generation
+        # never modified once the snapshot is published, the slices committed since
+        # `slices` was copied are in `recent`, so publishing does not copy every slice
+        self._slices = slices
+        self._recent = recent if recent is not None else {}
+        self._tree = tree
+
+    def get_slice(self, slice_type: type[AnySlice]) -> AnySlice:
+        """Get the slice, or the root slice inheriting from it, as of the snapshot."""
+        if slice_type.__name__ not in self._tree:
+            raise KeyError(f"Slice '{slice_type.__name__}' not found in snapshot")
+        return cast(AnySlice, self._get_root_slice(self._tree[slice_type.__name__]))
+
+    def get_state(self, path: StatePath | Any) -> Any:
+        """Get the value of a state as of the snapshot."""
+        if path.slice_name not in self._tree:
+            raise KeyError(f"Slice '{path.slice_name}' not found in snapshot")
+        root_slice = self._get_root_slice(self._tree[path.slice_name])
+        if not root_slice.has_state(path.state):
+            raise KeyError(f"State '{path.state}' not found in slice '{path.slice_name}'")
+        return getattr(root_slice, path.state)
+
+    def _get_root_slice(self, root_slice_name: str) -> Slice:
+        if root_slice_name in self._recent:
+            return self._recent[root_slice_name]
+        try:
+            return self._slices[root_slice_name]
+        except KeyError:
+            raise KeyError(
+                f"Lazy slice '{root_slice_name}' was not loaded when the snapshot was taken"
+            ) from None
+
+    def _with_changes(self, revision: int, changed: dict[str, Slice]) -> StoreSnapshot:
+        """Get a new snapshot with the root slices committed since this one."""
+        recent = {**self._recent, **changed}
+        if len(recent) <= _MAX_RECENT:
+            return StoreSnapshot(revision, self.generation, self._slices, self._tree, recent)
+        return StoreSnapshot(revision, self.generation, {**self._slices, **recent}, self._tree)
+
+
+# latest snapshot published, replaced as a whole at the end of each dispatch, so that
+# taking it is a single read and publishing never waits for readers
+_SNAPSHOT: StoreSnapshot | None = None
+# root slices committed since the last publication
+_UNPUBLISHED: set[str] = set()
+# root slices a snapshot keeps apart from the others before copying them all together
+_MAX_RECENT = 64
+
+
+def _clear_snapshots() -> None:
+    global _SNAPSHOT  # pylint: disable=W0603
+    _UNPUBLISHED.clear()
+    _SNAPSHOT = None
+
+
+def _publish_snapshot(
+    store: dict[str, Slice], tree: dict[str, str], revision: int, generation: int
+) -> None:
+    """Publish a copy of all the slices of the store, after slices were added or removed."""
+    global _SNAPSHOT  # pylint: disable=W0603
+    _SNAPSHOT = StoreSnapshot(revision, generation, dict(store), dict(tree))
+    _UNPUBLISHED.clear()
+
+
+def _publish_changes(store: dict[str, Slice], revision: int) -> None:
+    """Publish the root slices committed since the last publication."""
+    global _SNAPSHOT  # pylint: disable=W0603
+    if _SNAPSHOT is not None:
+        changed: dict[str, Slice] = {}
+        for root_slice_name in _UNPUBLISHED:
+            # `dict.get` does not load lazy slices
+            one_slice = dict.get(store, root_slice_name)
+            if one_slice is not None:
+                changed[root_slice_name] = one_slice
+        _SNAPSHOT = _SNAPSHOT._with_changes(revision, changed)  # pylint: disable=W0212
+    _UNPUBLISHED.clear()
+
+
+def snapshot() -> StoreSnapshot:
+    """Get a consistent read-only view of the store, for reading it from other threads.
+
+    A new snapshot is published at the end of each dispatch, including the dispatches made
+    by its subscribers and extra reducers. Reading from a snapshot never sees a dispatch in
+    progress, and neither taking nor reading one takes a lock or makes the dispatching
+    thread wait. Take a new snapshot to see later dispatches. Lazy slices are in snapshots
+    published once they are loaded.
+
+    Example:
+
+    ```python
+        import redux as rd
+
+    def render() -> None:
+        view = rd.snapshot()
+        black_level = view.get_state(ImgConfigSlice.black_level)
+        white_level = view.get_state(ImgConfigSlice.white_level)  # same dispatch
+
+    threading.Thread(target=render).start()
+    ```
+    """
+    view = _SNAPSHOT
+    if view is None:
+        raise RuntimeError("Store not initialized")
+    return view
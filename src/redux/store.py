@@ -2,9 +2,14 @@
 
 from __future__ import annotations
 
-from collections import defaultdict
-from collections.abc import Callable, Sequence
+import importlib
+import threading
+import time
+from collections import defaultdict, deque
+from collections.abc import Callable, Container, Iterable
+from functools import cache
 from typing import (
+    TYPE_CHECKING,
     Any,
     NamedTuple,
     TypeVar,
@@ -16,7 +21,23 @@ from typing import (
 
 from pydantic import BaseModel, ConfigDict
 
-from .slice import Slice, StatePath
+from .changes import _clear_change_log, _log_changes, _resize_change_log
+from .draft import _take_change_hint
+from .fast_slice import FastSlice
+from .lazy import LazySlice, _LazyEntry, _LazyStore
+from .priority import _CRITICAL_ENTRIES, _clear_lanes
+from .slice import Slice, StatePath, _complete_slice, _get_computed_states
+from .snapshots import (
+    _UNPUBLISHED,
+    _clear_snapshots,
+    _publish_changes,
+    _publish_snapshot,
+)
+
+if TYPE_CHECKING:
+    from .reducers import dispatch, extra_reduce, reduce
+    from .subscriptions import force_notify, subscribe
+    from .tracing import Tracer
 
 __all__ = [
     "Store",
@@ -26,9 +47,14 @@ __all__ = [
     "get_slice",
     "dispatch",
     "dispatch_state",
-    "dispatch_slice",
+    "reduce",
+    "extra_reduce",
     "subscribe",
     "force_notify",
+    "dispatch_slice",
+    "evict_idle",
+    "get_revision",
+    "set_change_log_size",
 ]
 
 
@@ -60,59 +86,184 @@ class _ExtraReducerCacheKey(NamedTuple):
 _EXTRA_REDUCER_CACHE: defaultdict[_ExtraReducerCacheKey, list[SubscriptionEntry]] = (
     defaultdict(list)
 )
+# keys of `_EXTRA_REDUCER_CACHE` by subscriber and by notifier slice name
+_EXTRA_REDUCER_KEYS: defaultdict[str, list[_ExtraReducerCacheKey]] = defaultdict(list)
+_EXTRA_REDUCER_KEYS_BY_NOTIFIER: defaultdict[str, list[_ExtraReducerCacheKey]] = defaultdict(
+    list
+)
+# declaration order of the keys of `_EXTRA_REDUCER_CACHE`
+_EXTRA_REDUCER_ORDER: dict[_ExtraReducerCacheKey, int] = {}
 SubscriptionEntry = tuple[Callable[..., None], list[StatePath]]
+
+
+class _RegisteredExtraReducer(NamedTuple):
+    notifier_root_slice_name: str
+    notifier_state_name: str
+    subscriber_root_slice_name: str
+    entry: SubscriptionEntry
+
+
+_REGISTERED_EXTRA_REDUCERS: list[_RegisteredExtraReducer] = []
+# recent results of the reducers declared with `memo=True`, as
+# (slice id, payload types, payload) -> (slice, result)
+_REDUCER_MEMOS: dict[Callable[..., Any], dict[tuple[Any, ...], tuple[Slice, Slice]]] = {}
+_REDUCER_MEMO_SIZE = 16
 SUBSCRIPTIONS: defaultdict[str, defaultdict[str, list[SubscriptionEntry]]] = defaultdict(
     lambda: defaultdict(list)
 )
+# subscriptions called once per commit of a root slice, as (callback, states, paths): the
+# callback gets the slice and its changed states if `paths` is None, else the values of
+# `paths`, and is only called when one of `states` changed (any state if None)
+SliceSubscriptionEntry = tuple[
+    Callable[..., None], frozenset[str] | None, list[StatePath] | None
+]
+SLICE_SUBSCRIPTIONS: defaultdict[str, list[SliceSubscriptionEntry]] = defaultdict(list)
 SLICE_TREE: dict[str, str] = {}
 SLICE_NAME_CACHE: dict[str, str] = {}
 
+# incremented every time `_dispatch` commits a slice with at least one changed state
+REVISION: int = 0
+# called after each such commit with (root slice name, new slice, changed states, revision)
+ChangeListener = Callable[[str, Slice, tuple[str, ...], int], None]
+_CHANGE_LISTENERS: list[ChangeListener] = []
+
+
+# incremented whenever the slices in the store or their root slice names change
+_STORE_GENERATION: int = 0
+
+
+# in run-to-completion mode, dispatches made while another one runs are queued
+_RUN_TO_COMPLETION: bool = False
+_DISPATCHING: bool = False
+_PENDING_DISPATCHES: deque[tuple[Callable[..., None], tuple[Any, ...]]] = deque()
+
+# slices declared with `redux.lazy`, by root slice name
+_LAZY_SLICES: dict[str, _LazyEntry] = {}
+
+# slices replaced, states notified and slice subscribers called by the dispatches in
+# progress, as (root slice name, replaced slice), (root slice name, state name, notified
+# value) and (root slice name, subscription entry)
+_JOURNAL_COMMITS: list[tuple[str, Slice]] = []
+_JOURNAL_NOTIFIED: list[tuple[str, str, Any]] = []
+_JOURNAL_SLICE_NOTIFIED: list[tuple[str, SliceSubscriptionEntry]] = []
+# number of dispatches in progress, the journal is only kept while one is
+_TRANSACTION_DEPTH: int = 0
+# held by the thread dispatching, dispatches from other threads wait for it to finish
+_DISPATCH_LOCK = threading.RLock()
+
+# records dispatches as spans while `redux.trace` is active
+_TRACER: Tracer | None = None
+
 
 def _get_slice_name_fm_reducer(reducer: Callable) -> str:
     return reducer.__qualname__.split(".")[0]
 
 
+@cache
+def _get_slice_bases(one_slice: type[Slice]) -> tuple[str, ...]:
+    """Get the names of the slice and of every slice it inherits from."""
+    return tuple(
+        base.__name__
+        for base in one_slice.__mro__
+        if issubclass(base, (Slice, FastSlice)) and base not in (Slice, FastSlice)
+    )
+
+
 def _register_bases(one_slice: type[Slice], root: str) -> None:
     """Register the base classes of the slice."""
-    slice_name = one_slice.__name__
-    is_leaf = len(one_slice.__bases__) == 1 and one_slice.__bases__[0] is Slice
-    if is_leaf:
+    for slice_name in _get_slice_bases(one_slice):
         SLICE_TREE[slice_name] = root
-    else:
-        SLICE_TREE[slice_name] = root
-        for base in one_slice.__bases__:
-            _register_bases(base, root)
+
+
+def _register_extra_reducers(
+    keys: Iterable[_ExtraReducerCacheKey], involving: frozenset[str] | None = None
+) -> list[_RegisteredExtraReducer]:
+    """Subscribe the extra reducers whose subscriber and notifier slices are in the store.
+
+    Args:
+        keys: The keys of `_EXTRA_REDUCER_CACHE` to register.
+        involving: If given, only register extra reducers declared by or notified by one
+            of these slices.
+    """
+    registered: list[_RegisteredExtraReducer] = []
+    for key in sorted(set(keys), key=_EXTRA_REDUCER_ORDER.__getitem__):
+        if key.subscriber_slice_name not in SLICE_TREE:
+            continue  # the slice that declares an extra reducer is not in the store
+        if key.notifier_slice_name not in SLICE_TREE:
+            continue  # no slice in the store inherit from the notifier slice
+        root_slice_name = SLICE_TREE[key.notifier_slice_name]
+        for reducer, args in _EXTRA_REDUCER_CACHE[key]:
+            if any(arg.slice_name not in SLICE_TREE for arg in args):
+                continue  # some notifier states are not in the store
+            if (
+                involving is not None
+                and key.subscriber_slice_name not in involving
+                and all(arg.slice_name not in involving for arg in args)
+            ):
+                continue
+            entry: SubscriptionEntry = (
+                reducer,
+                [StatePath(_get_root_slice_name(arg.slice_name), arg.state) for arg in args],
+            )
+            SUBSCRIPTIONS[root_slice_name][key.notifier_state_name].append(entry)
+            registered.append(
+                _RegisteredExtraReducer(
+                    root_slice_name,
+                    key.notifier_state_name,
+                    SLICE_TREE[key.subscriber_slice_name],
+                    entry,
+                )
+            )
+    _REGISTERED_EXTRA_REDUCERS.extend(registered)
+    return registered
 
 
 def _clear_store() -> None:
-    global STORE, STORE_CLS  # pylint: disable=W0603
-    for (
-        subscriber,
-        slice_name,
-        state_name,
-    ), extra_reducers in _EXTRA_REDUCER_CACHE.items():
-        if slice_name in SLICE_TREE and subscriber in SLICE_TREE:
-            root_slice_name = SLICE_TREE[slice_name]
-            SUBSCRIPTIONS[root_slice_name][state_name] = [
-                reducer
-                for reducer in SUBSCRIPTIONS[root_slice_name][state_name]
-                if reducer not in extra_reducers
-            ]
+    global STORE, STORE_CLS, _STORE_GENERATION  # pylint: disable=W0603
+    _STORE_GENERATION += 1
+    # subscriptions to the slices of the old store, extra reducers are registered again
+    SUBSCRIPTIONS.clear()
+    SLICE_SUBSCRIPTIONS.clear()
+    _clear_lanes()
+    _REGISTERED_EXTRA_REDUCERS.clear()
+    _PENDING_DISPATCHES.clear()
+    _LAZY_SLICES.clear()
+    for memo in _REDUCER_MEMOS.values():
+        memo.clear()
+    _clear_change_log(REVISION)
     STORE = None
     STORE_CLS = None
     SLICE_NAME_CACHE.clear()
     SLICE_TREE.clear()
+    _clear_snapshots()
 
 
-def create_store(store: Store, recreate: bool = False) -> None:
+def create_store(
+    store: Store, recreate: bool = False, notify: bool = True, run_to_completion: bool = False
+) -> None:
     """Create a store with the given slices.
 
     Args:
         store: The store to create. Must be a subclass of `Store`.
         recreate: If True, recreate the store even if it already exists.
             This will clear the existing store and create a new one.
+        notify: If True, notify subscribers and run extra reducers with the initial state
+            of every slice. Skipping this speeds up creating large stores, but states
+            derived by extra reducers keep their initial values until their notifier
+            changes.
+        run_to_completion: If True, dispatches made by subscribers and extra reducers are
+            queued and run in order once the current dispatch completes, instead of
+            running inside it. Subscribers then read the state they are notified of, and
+            long cascades of dispatches do not grow the stack. A dispatch and the ones it
+            queued succeed or fail together: if one of them raises, all of them are
+            rolled back, those still queued are dropped, and the error is raised by the
+            dispatch that started the cascade.
+
+    Slices whose value is a placeholder returned by `redux.lazy` are registered without
+    being loaded, see `redux.lazy`.
     """
-    global STORE_CLS, STORE, SLICE_NAME_CACHE  # pylint: disable=W0603
+    global STORE_CLS, STORE, SLICE_NAME_CACHE, _STORE_GENERATION  # pylint: disable=W0603
+    global _RUN_TO_COMPLETION  # pylint: disable=W0603
     if recreate:
         _clear_store()
 
@@ -121,54 +272,47 @@ def create_store(store: Store, recreate: bool = False) -> None:
     if not isinstance(store, Store):
         raise TypeError(f"Expected a Store, got {type(store)}")
     STORE_CLS = store.__class__
-    STORE = {
-        getattr(store, name).slice_name: getattr(store, name)
-        for name in type(store).model_fields.keys()
-    }
-    SLICE_NAME_CACHE = {
-        getattr(store, name).slice_name: name for name in type(store).model_fields.keys()
-    }
-
-    for one_slice in STORE.values():
-        if not isinstance(one_slice, Slice):
+    STORE = {}
+    _RUN_TO_COMPLETION = run_to_completion
+    _STORE_GENERATION += 1
+    SLICE_NAME_CACHE = {}
+    slice_types: list[type[Slice]] = []
+    for name, field in type(store).model_fields.items():
+        one_slice = getattr(store, name)
+        if isinstance(one_slice, LazySlice):
+            slice_type = field.annotation
+            if not isinstance(slice_type, type) or not issubclass(
+                slice_type, (Slice, FastSlice)
+            ):
+                raise TypeError(f"Expected a Slice type for lazy slice '{name}'")
+            _LAZY_SLICES[slice_type.__name__] = _LazyEntry(slice_type, one_slice)
+        elif isinstance(one_slice, (Slice, FastSlice)):
+            slice_type = one_slice.__class__
+            STORE[one_slice.slice_name] = one_slice
+        else:
             raise TypeError(f"Expected a Slice, got {type(one_slice)}")
-        slice_name = one_slice.__class__.__name__
-        _register_bases(one_slice.__class__, slice_name)
-
-    # map args in extra_reducers to the root slice name
-    for key, extra_reducers in _EXTRA_REDUCER_CACHE.items():
-        try:
-            extra_reducers = [
-                (
-                    reducer,
-                    [
-                        StatePath(_get_root_slice_name(arg.slice_name), arg.state)
-                        for arg in args
-                    ],
-                )
-                for reducer, args in extra_reducers
-            ]
-            _EXTRA_REDUCER_CACHE[key] = extra_reducers
-        except KeyError:
-            pass  # the slice that declares an extra reducer is not in the store
-
-    # register extra reducers
-    for (
-        subscriber,
-        slice_name,
-        state_name,
-    ), extra_reducers in _EXTRA_REDUCER_CACHE.items():
-        if subscriber not in SLICE_TREE:
-            # the slice that declares an extra reducer is not in the store
-            continue
-        if slice_name not in SLICE_TREE:
-            # no slice in the store inherit from the slice that declares the extra reducer
-            continue
-        root_slice_name = SLICE_TREE[slice_name]
-        SUBSCRIPTIONS[root_slice_name][state_name].extend(extra_reducers)
-
-    for one_slice in STORE.values():
-        _dispatch(one_slice.slice_name, one_slice, force=True)
+        if issubclass(slice_type, Slice):
+            _complete_slice(slice_type)
+        slice_types.append(slice_type)
+        SLICE_NAME_CACHE[slice_type.__name__] = name
+        _register_bases(slice_type, slice_type.__name__)
+    if _LAZY_SLICES:
+        lazy_store = _LazyStore(_LAZY_SLICES, _publish_loaded)
+        lazy_store.update(STORE)
+        STORE = lazy_store
+
+    # register extra reducers of the slices in the store
+    _register_extra_reducers(
+        key
+        for slice_type in slice_types
+        for slice_name in _get_slice_bases(slice_type)
+        for key in _EXTRA_REDUCER_KEYS.get(slice_name, ())
+    )
+
+    if notify:
+        for one_slice in STORE.values():
+            _run_to_completion(_dispatch, one_slice.slice_name, one_slice, True)
+    _publish_snapshot(STORE, SLICE_TREE, REVISION, _STORE_GENERATION)
 
 
 @overload
@@ -185,11 +329,19 @@ def get_store(store_type=None):
         raise RuntimeError("Store not initialized")
     if store_type is not None and not issubclass(store_type, STORE_CLS):
         raise TypeError(f"Expected a {STORE_CLS}, got {store_type}")
+    # loads the lazy slices
     return STORE_CLS.model_validate(
-        {SLICE_NAME_CACHE[name]: one_slice for name, one_slice in STORE.items()}
+        {name: STORE[root_slice_name] for root_slice_name, name in SLICE_NAME_CACHE.items()}
     )  # type: ignore[return-value]
 
 
+def _get_slice_type(root_slice_name: str) -> type[Slice]:
+    """Get the class of a root slice without loading it if it is lazy."""
+    if root_slice_name in _LAZY_SLICES:
+        return _LAZY_SLICES[root_slice_name].slice_type
+    return STORE[root_slice_name].__class__  # type: ignore[index]
+
+
 def _get_root_slice_name(slice_name: str) -> str:
     """Get the root slice name."""
     if slice_name not in SLICE_TREE:
@@ -221,6 +373,8 @@ def _get_slice_from_name(slice_name: str) -> Slice:
     root_slice_name = _get_root_slice_name(slice_name)
     if root_slice_name not in STORE:
         raise KeyError(f"Slice '{root_slice_name}' not found in store")
+    if _LAZY_SLICES and root_slice_name in _LAZY_SLICES:
+        _LAZY_SLICES[root_slice_name].last_used = time.monotonic()
     return STORE[root_slice_name]
 
 
@@ -250,7 +404,9 @@ def get_state(path) -> Any:
     state_name = path.state
     if root_slice_name not in STORE:
         raise KeyError(f"Slice '{path.slice_name}' not found in store")
-    if state_name not in STORE[root_slice_name].model_fields_set:
+    if _LAZY_SLICES and root_slice_name in _LAZY_SLICES:
+        _LAZY_SLICES[root_slice_name].last_used = time.monotonic()
+    if not STORE[root_slice_name].has_state(state_name):
         raise KeyError(f"State '{state_name}' not found in slice '{path.slice_name}'")
     return STORE[root_slice_name].get_state(state_name)
 
@@ -259,126 +415,418 @@ Reducer = Callable[[Slice], Slice]
 ReducerWithPayload = Callable[[Slice, AnyState], Slice]
 
 
-def _dispatch(slice_name: str, new_slice: Slice, force: bool = False) -> None:
-    _check_store_init()
-    assert STORE is not None, "Store not initialized"
-    slice_state_names = new_slice.model_fields_set
-    root_slice_name = _get_root_slice_name(slice_name)
-    for state_name in slice_state_names:
-        new_state = new_slice.get_state(state_name)
-        if (
-            # state changed or force
-            (STORE[root_slice_name].get_state(state_name) != new_state or force)
-            and slice_name in SUBSCRIPTIONS  # has subscribers for this slice
-            and state_name in SUBSCRIPTIONS[root_slice_name]  # has subscribers for this state
-        ):
-            for callback, paths in SUBSCRIPTIONS[root_slice_name][state_name]:
-                callback(
-                    *tuple(
-                        get_state(path) if path.state != state_name else new_state
-                        for path in paths
-                    )
-                )
+def _notify_state(
+    root_slice_name: str, state_name: str, new_state: Any, critical: bool | None = None
+) -> None:
+    """Call the subscribers of a state with its new value.
 
-    STORE[root_slice_name] = new_slice
+    `critical` only calls the critical subscribers if True, the others if False.
+    """
+    if (
+        root_slice_name in SUBSCRIPTIONS  # has subscribers for this slice
+        and state_name in SUBSCRIPTIONS[root_slice_name]  # has subscribers for this state
+    ):
+        for entry in SUBSCRIPTIONS[root_slice_name][state_name]:
+            if critical is not None and (id(entry) in _CRITICAL_ENTRIES) is not critical:
+                continue
+            callback, paths = entry
+            states = tuple(
+                get_state(path) if path.state != state_name else new_state for path in paths
+            )
+            if _TRACER is None:
+                callback(*states)
+            else:
+                with _TRACER.span(
+                    getattr(callback, "__qualname__", repr(callback)),
+                    "subscriber",
+                    state=f"{root_slice_name}.{state_name}",
+                ):
+                    callback(*states)
+
+
+def _notify_slice(
+    root_slice_name: str,
+    new_slice: Slice,
+    changed_states: list[str],
+    critical: bool | None = None,
+    notified: Container[int] | None = None,
+) -> None:
+    """Call the subscribers of a slice once for all its changed states.
+
+    `critical` only calls the critical subscribers if True, the others if False. The
+    subscribers called are journaled, unless `notified` is given: then only the subscribers
+    whose entry id is in it are called, as a rollback does.
+    """
+    changed = frozenset(changed_states)
+    for entry in tuple(SLICE_SUBSCRIPTIONS[root_slice_name]):
+        if critical is not None and (id(entry) in _CRITICAL_ENTRIES) is not critical:
+            continue
+        if notified is not None and id(entry) not in notified:
+            continue
+        callback, states, paths = entry
+        if states is not None and changed.isdisjoint(states):
+            continue
+        if _TRANSACTION_DEPTH and notified is None:
+            _JOURNAL_SLICE_NOTIFIED.append((root_slice_name, entry))
+        if paths is None:
+            args: tuple[Any, ...] = (
+                new_slice,
+                changed if states is None else changed & states,
+            )
+        else:
+            args = tuple(
+                getattr(new_slice, path.state)
+                if path.slice_name == root_slice_name
+                else get_state(path)
+                for path in paths
+            )
+        if _TRACER is None:
+            callback(*args)
+        else:
+            with _TRACER.span(
+                getattr(callback, "__qualname__", repr(callback)),
+                "subscriber",
+                state=root_slice_name,
+            ):
+                callback(*args)
 
 
-def dispatch_slice(new_slice: Slice) -> None:
-    """Dispatch a new slice to the store."""
-    if not isinstance(new_slice, Slice):
-        raise TypeError(f"Expected a Slice, got {type(new_slice)}")
-    _dispatch(new_slice.slice_name, new_slice)
+def evict_idle() -> list[str]:
+    """Unload the lazy slices that have been idle for longer than their `evict_after`.
 
+    Only slices that did not change since they were loaded are unloaded, so they can be
+    loaded again from their source. A slice is idle from the time it is loaded or last
+    read with `get_state`, `get_slice` or an accessor. Call this periodically, for example
+    from a timer.
 
-# For callables that take only one argument (no payload)
-@overload
-def dispatch(reducer: Callable[[AnySlice], AnySlice]) -> None: ...
+    Returns:
+        The names of the slices that were unloaded.
+    """
+    _check_store_init()
+    assert STORE is not None, "Store not initialized"
+    if _TRANSACTION_DEPTH:
+        raise RuntimeError("Cannot evict slices during a dispatch")
+    now = time.monotonic()
+    evicted = [
+        root_slice_name
+        for root_slice_name, entry in _LAZY_SLICES.items()
+        if entry.lazy_slice.evict_after is not None
+        and entry.loaded is not None
+        and dict.get(STORE, root_slice_name) is entry.loaded
+        and now - entry.last_used >= entry.lazy_slice.evict_after
+    ]
+    for root_slice_name in evicted:
+        del STORE[root_slice_name]
+        _LAZY_SLICES[root_slice_name].loaded = None
+    return evicted
+
+
+def get_revision() -> int:
+    """Get the revision of the store, incremented by every dispatch that changes a state."""
+    return REVISION
+
+
+def set_change_log_size(size: int) -> None:
+    """Set how many state changes are kept for `changes_since`. Defaults to 1024."""
+    _resize_change_log(size, REVISION)
+
+
+def _run_to_completion(action: Callable[..., None], *args: Any) -> None:
+    """Run a dispatch, or queue it while another one runs in run-to-completion mode.
+
+    The dispatch that starts the queue runs the queued ones in order before returning, all
+    in one transaction. If one of them fails, the whole batch is rolled back, including the
+    dispatch that started it, the rest of the queue is dropped and the error is raised to
+    the caller of that first dispatch.
+    """
+    global _DISPATCHING  # pylint: disable=W0603
+    with _DISPATCH_LOCK:
+        if not _RUN_TO_COMPLETION:
+            action(*args)
+            return
+        if _DISPATCHING:
+            _PENDING_DISPATCHES.append((action, args))
+            return
+        _DISPATCHING = True
+        try:
+            _transaction(_drain_dispatches, action, args)
+        except Exception:
+            _PENDING_DISPATCHES.clear()
+            raise
+        finally:
+            _DISPATCHING = False
 
 
-# For callables that take two arguments (with payload)
-@overload
-def dispatch(
-    reducer: Callable[[AnySlice, AnyState], AnySlice],
-    payload: AnyState,
-) -> None: ...
+def _drain_dispatches(action: Callable[..., None], args: tuple[Any, ...]) -> None:
+    action(*args)
+    while _PENDING_DISPATCHES:
+        action, args = _PENDING_DISPATCHES.popleft()
+        action(*args)
 
 
-def dispatch(reducer, payload=None) -> None:
-    """Dispatch a reducer function to change the state of the store.
+def _apply_memoized_reducer(
+    reducer: Callable[..., Slice], old_slice: Slice, args: tuple[Any, ...]
+) -> Slice:
+    """Run a reducer declared with `memo=True`, or reuse its result for the same input.
 
-    Args:
-        reducer: A function that takes a slice and optionally a payload, and
-            returns a new slice.
-        payload: The new value for the state. The data type of payload must match the type
-            annotation of the state in the slice.
+    Returns `old_slice` itself when the result is equal to it, there is nothing to commit.
+    """
+    memo = _REDUCER_MEMOS[reducer]
+    key = (id(old_slice), tuple(map(type, args)), args)
+    try:
+        cached = memo.get(key)
+    except TypeError:  # unhashable payload
+        return _run_reducer(reducer, old_slice, args)
+    if cached is not None:
+        return cached[1]
+    new_slice = _run_reducer(reducer, old_slice, args)
+    if new_slice == old_slice:
+        new_slice = old_slice
+    if len(memo) >= _REDUCER_MEMO_SIZE:
+        del memo[next(iter(memo))]
+    # the input is kept alive so that its id is not reused
+    memo[key] = (old_slice, new_slice)
+    return new_slice
+
+
+def _run_reducer(
+    reducer: Callable[..., Slice], old_slice: Slice, args: tuple[Any, ...]
+) -> Slice:
+    if _TRACER is None:
+        return reducer(old_slice, *args)
+    with _TRACER.span(reducer.__qualname__, "reducer"):
+        return reducer(old_slice, *args)
 
-    ```python
-    from __future__ import annotations
-    import redux as rd
 
-    class CameraSlice(rd.Slice):
-        exposure: float = 0.0
-        gain: float = 0.0
+def _dispatch(slice_name: str, new_slice: Slice, force: bool = False) -> None:
+    _check_store_init()
+    _commit(_get_root_slice_name(slice_name), new_slice, force)
+
+
+def _detect_changes(
+    root_slice_name: str, old_slice: Slice, new_slice: Slice, force: bool
+) -> list[str]:
+    """Get the states that differ between two versions of a slice, or all of them if forced."""
+    # slices made by `produce` share the states it did not change with the old slice
+    hint = None if force else _take_change_hint(old_slice, new_slice)
+    changed_states = [
+        state_name
+        for state_name in new_slice.model_fields_set
+        if force
+        or (
+            (hint is None or state_name in hint)
+            and getattr(old_slice, state_name) != getattr(new_slice, state_name)
+        )
+    ]
+    # computed states are only evaluated if they have subscribers and their inputs changed
+    for state_name, depends_on in _get_computed_states(new_slice.__class__).items():
+        inputs_changed = force or (
+            bool(changed_states)
+            and (depends_on is None or not depends_on.isdisjoint(changed_states))
+        )
+        if (
+            inputs_changed
+            and _has_subscribers(root_slice_name, state_name)
+            and (force or getattr(old_slice, state_name) != getattr(new_slice, state_name))
+        ):
+            changed_states.append(state_name)
+    return changed_states
 
-        # reducer can take in a payload
-        @rd.reduce
-        def set_exposure_s(piece: CameraSlice, exposure: float) -> CameraSlice:
-            return piece.update([(CameraSlice.exposure, exposure)])
 
-        # reducer can take no payload
-        @rd.reduce
-        def reset_exposure_s(piece: CameraSlice) -> CameraSlice:
-            return piece.update([(CameraSlice.exposure, 0.0)])
+def _has_subscribers(root_slice_name: str, state_name: str) -> bool:
+    """Check if a state has subscribers of its own, not counting slice subscribers."""
+    if root_slice_name in SUBSCRIPTIONS and SUBSCRIPTIONS[root_slice_name].get(state_name):
+        return True
+    return any(
+        states is not None and state_name in states
+        for _, states, _ in SLICE_SUBSCRIPTIONS.get(root_slice_name, ())
+    )
 
-    class Store(rd.Store):
-        camera: CameraSlice
 
-    rd.create_store(Store(camera=CameraSlice(exposure=0.1, gain=0.2)))
+def _transaction(action: Callable[..., None], *args: Any) -> None:
+    """Run a dispatch, restoring the store to its state before it if the dispatch fails.
+
+    Transactions nest: a dispatch made by a subscriber or an extra reducer is a savepoint
+    of the dispatch that caused it. It only undoes its own changes if it fails, and is
+    undone with the rest if the outer dispatch fails.
+    """
+    global _TRANSACTION_DEPTH  # pylint: disable=W0603
+    with _DISPATCH_LOCK:
+        savepoint = (
+            len(_JOURNAL_COMMITS),
+            len(_JOURNAL_NOTIFIED),
+            len(_JOURNAL_SLICE_NOTIFIED),
+        )
+        _TRANSACTION_DEPTH += 1
+        try:
+            action(*args)
+        except Exception:
+            if _TRACER is None:
+                _rollback(*savepoint)
+            else:
+                with _TRACER.span("rollback", "rollback"):
+                    _rollback(*savepoint)
+            raise
+        finally:
+            _TRANSACTION_DEPTH -= 1
+            if not _TRANSACTION_DEPTH:
+                _JOURNAL_COMMITS.clear()
+                _JOURNAL_NOTIFIED.clear()
+                _JOURNAL_SLICE_NOTIFIED.clear()
+                if _UNPUBLISHED:
+                    assert STORE is not None, "Store not initialized"
+                    _publish_changes(STORE, REVISION)
+
+
+def _publish_loaded(root_slice_name: str) -> None:
+    """Publish a lazy slice once loaded, at the end of the dispatch loading it if any."""
+    assert STORE is not None, "Store not initialized"
+    _UNPUBLISHED.add(root_slice_name)
+    if not _TRANSACTION_DEPTH:
+        _publish_changes(STORE, REVISION)
 
-    rd.dispatch(CameraSlice.set_exposure_s, 0.5)
-    assert rd.get_state(CameraSlice.exposure) == 0.5
 
-    rd.dispatch(CameraSlice.reset_exposure_s)
-    assert rd.get_state(CameraSlice.exposure) == 0.0
-    ```
+def _rollback(
+    commits_savepoint: int, notified_savepoint: int, slice_notified_savepoint: int
+) -> None:
+    """Undo the commits and notifications journaled since a savepoint.
+
+    Slices are restored without notifying their subscribers, except for the subscribers
+    already notified of a value that is rolled back, which are notified of the restored
+    value.
     """
-    if not callable(reducer):
-        raise TypeError(f"Expected a callable, got {type(reducer)}")
-    root_slice_name: str = _get_root_slice_name(_get_slice_name_fm_reducer(reducer))
+    assert STORE is not None, "Store not initialized"
+    restored: dict[str, Slice] = {}
+    for root_slice_name, old_slice in reversed(_JOURNAL_COMMITS[commits_savepoint:]):
+        restored[root_slice_name] = old_slice
+    notified: dict[tuple[str, str], Any] = {
+        (root_slice_name, state_name): value
+        for root_slice_name, state_name, value in _JOURNAL_NOTIFIED[notified_savepoint:]
+    }
+    # by entry id, the entries are kept so that their ids are not reused
+    slice_notified: defaultdict[str, dict[int, SliceSubscriptionEntry]] = defaultdict(dict)
+    for root_slice_name, entry in _JOURNAL_SLICE_NOTIFIED[slice_notified_savepoint:]:
+        slice_notified[root_slice_name][id(entry)] = entry
+    del _JOURNAL_COMMITS[commits_savepoint:]
+    del _JOURNAL_NOTIFIED[notified_savepoint:]
+    del _JOURNAL_SLICE_NOTIFIED[slice_notified_savepoint:]
+
+    reverted = _restore(restored)
+    for (root_slice_name, state_name), value in notified.items():
+        if root_slice_name not in STORE:
+            continue
+        restored_state = getattr(STORE[root_slice_name], state_name)
+        if restored_state != value:
+            _notify_state(root_slice_name, state_name, restored_state)
+    for root_slice_name, old_slice, changed_states in reverted:
+        if root_slice_name in slice_notified and root_slice_name in SLICE_SUBSCRIPTIONS:
+            _notify_slice(
+                root_slice_name,
+                old_slice,
+                changed_states,
+                notified=slice_notified[root_slice_name],
+            )
+
+
+def _restore(restored: dict[str, Slice]) -> list[tuple[str, Slice, list[str]]]:
+    """Put slices back in the store and get the ones that changed, with their states."""
+    global REVISION  # pylint: disable=W0603
+    assert STORE is not None, "Store not initialized"
+    reverted: list[tuple[str, Slice, list[str]]] = []
+    for root_slice_name, old_slice in restored.items():
+        if root_slice_name not in STORE:  # removed by the failed dispatch
+            continue
+        failed_slice = STORE[root_slice_name]
+        STORE[root_slice_name] = old_slice
+        _UNPUBLISHED.add(root_slice_name)
+        changed_states = _detect_changes(root_slice_name, failed_slice, old_slice, False)
+        if changed_states:
+            REVISION += 1
+            _log_changes(REVISION, root_slice_name, failed_slice, old_slice, changed_states)
+            for listener in tuple(_CHANGE_LISTENERS):
+                listener(root_slice_name, old_slice, tuple(changed_states), REVISION)
+            reverted.append((root_slice_name, old_slice, changed_states))
+    return reverted
+
+
+def _commit(root_slice_name: str, new_slice: Slice, force: bool = False) -> None:
+    """Notify subscribers of the changed states and replace the slice in the store."""
+    global REVISION  # pylint: disable=W0603
     assert STORE is not None, "Store not initialized"
     old_slice = STORE[root_slice_name]
-    try:
-        if payload is None:
-            new_slice = cast(Reducer, reducer)(STORE[root_slice_name])
-        else:
-            new_slice = cast(ReducerWithPayload, reducer)(STORE[root_slice_name], payload)
-        _dispatch(root_slice_name, new_slice)
-    except Exception as e:
-        _dispatch(root_slice_name, old_slice, force=True)
-        raise e
+    _UNPUBLISHED.add(root_slice_name)
+    if _RUN_TO_COMPLETION:
+        # subscribers read the new slice, nested dispatches only run after this one
+        STORE[root_slice_name] = new_slice
+        if _TRANSACTION_DEPTH:
+            _JOURNAL_COMMITS.append((root_slice_name, old_slice))
+    if _TRACER is None:
+        changed_states = _detect_changes(root_slice_name, old_slice, new_slice, force)
+    else:
+        with _TRACER.span(f"detect changes {root_slice_name}", "commit") as span_args:
+            changed_states = _detect_changes(root_slice_name, old_slice, new_slice, force)
+            span_args["changed"] = changed_states
+    # critical subscribers of the states and of the slice are all called before the others
+    lane: bool | None = None
+    if _CRITICAL_ENTRIES and changed_states:
+        _notify_critical(root_slice_name, new_slice, changed_states)
+        lane = False
+    for state_name in changed_states:
+        new_state = getattr(new_slice, state_name)
+        if _TRANSACTION_DEPTH and lane is None:
+            _JOURNAL_NOTIFIED.append((root_slice_name, state_name, new_state))
+        _notify_state(root_slice_name, state_name, new_state, lane)
+
+    if not _RUN_TO_COMPLETION:
+        STORE[root_slice_name] = new_slice
+        if _TRANSACTION_DEPTH:
+            _JOURNAL_COMMITS.append((root_slice_name, old_slice))
+
+    if changed_states:
+        REVISION += 1
+        _log_changes(REVISION, root_slice_name, old_slice, new_slice, changed_states)
+        for listener in tuple(_CHANGE_LISTENERS):
+            listener(root_slice_name, new_slice, tuple(changed_states), REVISION)
+        if root_slice_name in SLICE_SUBSCRIPTIONS:
+            _notify_slice(root_slice_name, new_slice, changed_states, lane)
+
+
+def _notify_critical(
+    root_slice_name: str, new_slice: Slice, changed_states: list[str]
+) -> None:
+    for state_name in changed_states:
+        new_state = getattr(new_slice, state_name)
+        if _TRANSACTION_DEPTH:
+            _JOURNAL_NOTIFIED.append((root_slice_name, state_name, new_state))
+        _notify_state(root_slice_name, state_name, new_state, True)
+    if root_slice_name in SLICE_SUBSCRIPTIONS:
+        _notify_slice(root_slice_name, new_slice, changed_states, True)
 
 
-def force_notify(states: Sequence[StatePath | Any]) -> None:
-    """Notify subscribers of state value even if the state did not change."""
-    _check_store_init()
-    assert STORE is not None, "Store not initialized"
-    for state in states:
-        root_slice_name = _get_root_slice_name(state.slice_name)
-        state_name = state.state
-        if root_slice_name in STORE and state_name in STORE[root_slice_name].model_fields_set:
-            new_state = STORE[root_slice_name].get_state(state_name)
-            if (
-                root_slice_name in SUBSCRIPTIONS  # has subscribers for this slice
-                and state_name
-                in SUBSCRIPTIONS[root_slice_name]  # has subscribers for this state
-            ):
-                for callback, paths in SUBSCRIPTIONS[root_slice_name][state_name]:
-                    callback(
-                        *tuple(
-                            get_state(path) if path.state != state_name else new_state
-                            for path in paths
-                        )
-                    )
+def dispatch_slice(new_slice: Slice) -> None:
+    """Dispatch a new slice to the store."""
+    if not isinstance(new_slice, (Slice, FastSlice)):
+        raise TypeError(f"Expected a Slice, got {type(new_slice)}")
+    _run_to_completion(_transaction, _dispatch_slice, new_slice)
+
+
+def _dispatch_slice(new_slice: Slice) -> None:
+    if _TRACER is None:
+        _dispatch(new_slice.slice_name, new_slice)
+    else:
+        with _TRACER.span(f"dispatch_slice {new_slice.slice_name}", "dispatch"):
+            _dispatch(new_slice.slice_name, new_slice)
+
+
+def _apply_reducer(reducer: Callable, old_slice: Slice, payload: Any) -> Slice:
+    if payload is None:
+        return cast(Reducer, reducer)(old_slice)
+    return cast(ReducerWithPayload, reducer)(old_slice, payload)
+
+
+def _call_directly(action: Callable[[], None]) -> None:
+    """Run a commit scheduled from another thread right away, on the calling thread."""
+    action()
 
 
 @overload
@@ -427,7 +875,10 @@ def dispatch_state(state, payload) -> None:
 
     Raises:
         RuntimeError: If the store is not initialized.
-        Exception: If the dispatch fails, the store will be reverted to its previous state.
+        TypeError: If the state is a computed state.
+        Exception: If the dispatch fails, the store will be reverted to its previous state,
+            including the changes made by the extra reducers it ran. Only subscribers that
+            were already notified of a reverted value are notified again.
 
     Example:
 
@@ -456,192 +907,35 @@ def dispatch_state(state, payload) -> None:
     _check_store_init()
     assert STORE is not None, "Store not initialized"
     root_slice_name = _get_root_slice_name(state.slice_name)
-    old_slice = STORE[root_slice_name]
-    try:
-        new_slice = STORE[root_slice_name].update([(state, payload)])
-        _dispatch(root_slice_name, new_slice)
-    except Exception as e:
-        _dispatch(root_slice_name, old_slice, force=True)
-        raise e
-
-
-@overload
-def subscribe(
-    *args: StatePath,
-) -> Callable[[Callable[..., None]], Callable[[], None]]: ...
-
-
-@overload
-def subscribe(
-    *args: *ArgT,
-) -> Callable[[Callable[[*ArgT], None]], Callable[[], None]]: ...
-
+    _run_to_completion(_dispatch_state, root_slice_name, state, payload)
 
-def subscribe(*args):
-    """Subscribe to state changes.
 
-    Args:
-        *args: Any number of states can be represented as `SliceName.state_name` or
-            `redux.build_path("SliceName", "state_name")`.
-
-    Returns:
-        A decorator that takes a callback function and returns a function to unsubscribe.
-
-    Example:
-
-    ```python
-    import redux as rd
-
-    class CameraSlice(rd.Slice):
-        exposure: float = 0.0
-        gain: float = 0.0
-
-    class Store(rd.Store):
-        camera: CameraSlice
-
-    rd.create_store(Store(camera=CameraSlice(exposure=0.1, gain=0.2)))
-
-    @rd.subscribe(CameraSlice.exposure, CameraSlice.gain)
-    def print_exposure_change(
-        exposure: float,
-        gain: float,
-    ) -> None:
-        print(f"Exposure changed: {exposure}, {gain}")
-
-    def careless_subscribe(exposure: float) -> None:
-        print(f"Exposure changed: {exposure}")
-
-    unsubscribe = rd.subscribe(CameraSlice.exposure)(careless_subscribe)
-    unsubscribe()  # Unsubscribe from the callback
-
-    # Output:
-    # Exposure changed: 0.1, 0.2
-    # Exposure changed: 0.1
-    ```
-    """
-    root_args = [StatePath(_get_root_slice_name(path.slice_name), path.state) for path in args]
-
-    def register_callback(callback: Callable[..., None], /) -> Callable[[], None]:
-        callback(*tuple(get_state(arg) for arg in args))
-        for arg in root_args:
-            SUBSCRIPTIONS[arg.slice_name][arg.state].append((callback, root_args))
-
-        def unsubscribe() -> None:
-            for arg in root_args:
-                SUBSCRIPTIONS[arg.slice_name][arg.state].remove((callback, root_args))
-
-        return unsubscribe
-
-    return register_callback
-
-
-@overload
-def reduce(
-    reducer: Callable[[AnySlice, AnyState], AnySlice],
-) -> staticmethod[[AnySlice, AnyState], AnySlice]: ...
-
-
-@overload
-def reduce(reducer: Callable[[AnySlice], AnySlice]) -> staticmethod[[AnySlice], AnySlice]: ...
-
-
-def reduce(reducer):
-    """Decorator to register a reducer function for a slice.
-
-    Args:
-        reducer: A function that takes a slice and optionally a payload, and
-            returns a new slice.
-
-    Example:
-
-    ```python
-    from __future__ import annotations
-    import redux as rd
-
-    class CameraSlice(rd.Slice):
-        exposure: float = 0.0
-        gain: float = 0.0
+def _dispatch_state(root_slice_name: str, state: StatePath, payload: Any) -> None:
+    if _TRACER is None:
+        _transaction(_update_and_commit, root_slice_name, state, payload)
+    else:
+        with _TRACER.span(
+            f"dispatch_state {state.slice_name}.{state.state}", "dispatch", payload=payload
+        ):
+            _transaction(_update_and_commit, root_slice_name, state, payload)
 
-        # reducer can take in a payload
-        @rd.reduce
-        def set_exposure_s(piece: CameraSlice, exposure: float) -> CameraSlice:
-            return piece.update([(CameraSlice.exposure, exposure)])
 
-        # reducer can take no payload
-        @rd.reduce
-        def reset_exposure_s(piece: CameraSlice) -> CameraSlice:
-            return piece.update([(CameraSlice.exposure, 0.0)])
-    ```
-    """
-    return staticmethod(reducer)
-
-
-ReducerNoArgs = Callable[[AnySlice], AnySlice]
-ReducerWithArgs = Callable[[AnySlice, *ArgT], AnySlice]
-StaticReducerNoArgs = staticmethod  # [[AnySlice], AnySlice]
-# staticmethod[[AnySlice, *ArgT], AnySlice] is not supported yet
-StaticReducerWithArgs = staticmethod  # [..., AnySlice]
-
-
-def extra_reduce(
-    *args: *ArgT,
-) -> Callable[
-    [ReducerNoArgs[AnySlice] | ReducerWithArgs[AnySlice, *ArgT]],
-    StaticReducerNoArgs | StaticReducerWithArgs,
-]:
-    """Decorator to register an extra reducer function for a slice."""
-
-    @overload
-    def wrap_reducer(reducer: ReducerWithArgs[AnySlice, *ArgT]) -> StaticReducerWithArgs: ...
-
-    @overload
-    def wrap_reducer(reducer: ReducerNoArgs[AnySlice]) -> StaticReducerNoArgs: ...
-
-    def wrap_reducer(reducer, _args=args) -> staticmethod:
-        args_count: int = reducer.__code__.co_argcount
-        if args_count == 0:
-            raise ValueError("Reducer function must accept at least one argument (slice).")
-
-        subscriber_slice_name: str = _get_slice_name_fm_reducer(reducer)
-        for notifier_state in args:
-            assert isinstance(notifier_state, StatePath)
-            notifier_slice_name = notifier_state.slice_name
-            notifier_state_name = notifier_state.state
-
-            def reducer_in_dispatch_with_args(
-                *states: *ArgT,
-                _reducer: Callable[[Slice, *ArgT], Slice] = reducer,
-                _subscriber_slice_name: str = subscriber_slice_name,
-            ) -> None:
-                _dispatch(
-                    _subscriber_slice_name,
-                    _reducer(_get_slice_from_name(_subscriber_slice_name), *states),
-                )
+def _update_and_commit(root_slice_name: str, state: StatePath, payload: Any) -> None:
+    assert STORE is not None, "Store not initialized"
+    _commit(root_slice_name, STORE[root_slice_name].update([(state, payload)]))
 
-            def reducer_in_dispatch_no_args(
-                *_: *ArgT,
-                _reducer: Callable[[Slice], Slice] = reducer,
-                _subscriber_slice_name: str = subscriber_slice_name,
-            ) -> None:
-                _dispatch(
-                    _subscriber_slice_name,
-                    _reducer(_get_slice_from_name(_subscriber_slice_name)),
-                )
 
-            if args_count >= 2:
-                entry: SubscriptionEntry = (
-                    reducer_in_dispatch_with_args,
-                    cast(list[StatePath], list(args)),
-                )
-            else:
-                assert args_count == 1
-                entry = (reducer_in_dispatch_no_args, cast(list[StatePath], list(args)))
-            _EXTRA_REDUCER_CACHE[
-                _ExtraReducerCacheKey(
-                    subscriber_slice_name, notifier_slice_name, notifier_state_name
-                )
-            ].append(entry)
+# moved to modules importing this one, and still imported from it by `__getattr__`
+_MOVED_NAMES = {
+    "dispatch": "reducers",
+    "reduce": "reducers",
+    "extra_reduce": "reducers",
+    "subscribe": "subscriptions",
+    "force_notify": "subscriptions",
+}
 
-        return staticmethod(reducer)
 
-    return wrap_reducer  # type: ignore[return-value]
+def __getattr__(name: str) -> Any:
+    if name in _MOVED_NAMES:
+        return getattr(importlib.import_module(f".{_MOVED_NAMES[name]}", __package__), name)
+    raise AttributeError(f"module '{__name__}' has no attribute '{name}'")
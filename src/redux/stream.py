@@ -0,0 +1,121 @@
+"""Dispatch of payload streams, folded through a reducer and committed by batch."""
+
+# Access to protected members of the store module
+# pylint: disable=W0212
+
+from __future__ import annotations
+
+from collections.abc import AsyncIterable, Callable, Coroutine, Iterable
+from typing import Any, overload
+
+from . import store as _store
+from .store import AnySlice, AnyState
+
+__all__ = ["dispatch_stream"]
+
+
+@overload
+def dispatch_stream(
+    reducer: Callable[[AnySlice, AnyState], AnySlice],
+    payloads: AsyncIterable[AnyState],
+    flush_every: int | None = None,
+) -> Coroutine[Any, Any, None]: ...
+
+
+@overload
+def dispatch_stream(
+    reducer: Callable[[AnySlice, AnyState], AnySlice],
+    payloads: Iterable[AnyState],
+    flush_every: int | None = None,
+) -> None: ...
+
+
+def dispatch_stream(reducer, payloads, flush_every=None):
+    """Fold a stream of payloads through a reducer, committing once per batch.
+
+    The payloads are collected in batches of `flush_every`. Each batch is folded through
+    the reducer, starting from the slice in the store, and the last slice is committed as
+    one dispatch: subscribers are notified and extra reducers run once per batch instead
+    of once per payload. The last batch is committed when the stream ends.
+
+    Args:
+        reducer: A reducer taking a payload.
+        payloads: An iterable, or an async iterable, of payloads.
+        flush_every: The number of payloads per batch. If None, the whole stream is
+            committed at once when it ends.
+
+    Returns:
+        None for an iterable. For an async iterable, a coroutine to await, which consumes
+        the stream.
+
+    Raises:
+        Exception: If the reducer fails, the batch is not committed and the store is left
+            as it was after the previous batch.
+
+    Example:
+
+    ```python
+    import redux as rd
+
+    def read_sensor():
+        while True:
+            yield sensor.read()
+
+    rd.dispatch_stream(SensorSlice.add_sample, read_sensor(), flush_every=100)
+    ```
+    """
+    if not callable(reducer):
+        raise TypeError(f"Expected a callable, got {type(reducer)}")
+    if flush_every is not None and flush_every <= 0:
+        raise ValueError(f"flush_every must be positive, got {flush_every}")
+    root_slice_name = _store._get_root_slice_name(_store._get_slice_name_fm_reducer(reducer))
+    if isinstance(payloads, AsyncIterable):
+        return _dispatch_async_stream(root_slice_name, reducer, payloads, flush_every)
+    batch: list[Any] = []
+    for payload in payloads:
+        batch.append(payload)
+        if len(batch) == flush_every:
+            _store._run_to_completion(_dispatch_batch, root_slice_name, reducer, batch)
+            batch = []
+    if batch:
+        _store._run_to_completion(_dispatch_batch, root_slice_name, reducer, batch)
+    return None
+
+
+async def _dispatch_async_stream(
+    root_slice_name: str,
+    reducer: Callable,
+    payloads: AsyncIterable[Any],
+    flush_every: int | None,
+) -> None:
+    batch: list[Any] = []
+    async for payload in payloads:
+        batch.append(payload)
+        if len(batch) == flush_every:
+            _store._run_to_completion(_dispatch_batch, root_slice_name, reducer, batch)
+            batch = []
+    if batch:
+        _store._run_to_completion(_dispatch_batch, root_slice_name, reducer, batch)
+
+
+def _dispatch_batch(root_slice_name: str, reducer: Callable, payloads: list[Any]) -> None:
+    if _store._TRACER is None:
+        _store._transaction(_fold_and_commit, root_slice_name, reducer, payloads)
+    else:
+        with _store._TRACER.span(
+            f"dispatch_stream {reducer.__qualname__}", "dispatch", payload=len(payloads)
+        ):
+            _store._transaction(_fold_and_commit, root_slice_name, reducer, payloads)
+
+
+def _fold_and_commit(root_slice_name: str, reducer: Callable, payloads: list[Any]) -> None:
+    assert _store.STORE is not None, "Store not initialized"
+    old_slice = new_slice = _store.STORE[root_slice_name]
+    if reducer in _store._REDUCER_MEMOS:
+        for payload in payloads:
+            new_slice = _store._apply_memoized_reducer(reducer, new_slice, (payload,))
+    else:
+        for payload in payloads:
+            new_slice = reducer(new_slice, payload)
+    if new_slice is not old_slice:
+        _store._commit(root_slice_name, new_slice)
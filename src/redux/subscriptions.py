@@ -0,0 +1,238 @@
+"""Subscriptions to states and slices of the store."""
+
+# Access to protected members of the store module
+# pylint: disable=W0212
+
+from __future__ import annotations
+
+from collections import defaultdict
+from collections.abc import Callable, Sequence
+from functools import partial
+from typing import Any, overload
+
+from . import store as _store
+from .priority import (
+    Priority,
+    _add_entry,
+    _check_priority,
+    _defer_to_idle,
+    _forget_entry,
+    _merge_changed_states,
+)
+from .slice import StatePath
+from .store import (
+    SLICE_SUBSCRIPTIONS,
+    SUBSCRIPTIONS,
+    AnySlice,
+    ArgT,
+    SliceSubscriptionEntry,
+    SubscriptionEntry,
+    _check_store_init,
+    _get_root_slice_name,
+    _get_slice_from_name,
+    _notify_state,
+    get_state,
+)
+
+__all__ = ["subscribe", "subscribe_slice", "force_notify"]
+
+
+@overload
+def subscribe(
+    *args: StatePath,
+    once_per_dispatch: bool = False,
+    priority: Priority = "normal",
+) -> Callable[[Callable[..., None]], Callable[[], None]]: ...
+
+
+@overload
+def subscribe(
+    *args: *ArgT,
+    once_per_dispatch: bool = False,
+    priority: Priority = "normal",
+) -> Callable[[Callable[[*ArgT], None]], Callable[[], None]]: ...
+
+
+def subscribe(*args, once_per_dispatch=False, priority="normal"):
+    """Subscribe to state changes.
+
+    Args:
+        *args: Any number of states can be represented as `SliceName.state_name` or
+            `redux.build_path("SliceName", "state_name")`.
+        once_per_dispatch: If True, the callback is called once each time a dispatch
+            changes some of the states in one slice, instead of once per changed state,
+            and it receives the new values of all of them.
+        priority: "critical" callbacks are called before all the "normal" callbacks
+            notified of a change of the same slice, whichever states they subscribe to,
+            including `subscribe_slice` ones. "idle" callbacks are not called by the
+            dispatch: the latest values they were notified of are kept until
+            `drain_notifications`.
+
+    Returns:
+        A decorator that takes a callback function and returns a function to unsubscribe.
+
+    Example:
+
+    ```python
+    import redux as rd
+
+    class CameraSlice(rd.Slice):
+        exposure: float = 0.0
+        gain: float = 0.0
+
+    class Store(rd.Store):
+        camera: CameraSlice
+
+    rd.create_store(Store(camera=CameraSlice(exposure=0.1, gain=0.2)))
+
+    @rd.subscribe(CameraSlice.exposure, CameraSlice.gain)
+    def print_exposure_change(
+        exposure: float,
+        gain: float,
+    ) -> None:
+        print(f"Exposure changed: {exposure}, {gain}")
+
+    def careless_subscribe(exposure: float) -> None:
+        print(f"Exposure changed: {exposure}")
+
+    unsubscribe = rd.subscribe(CameraSlice.exposure)(careless_subscribe)
+    unsubscribe()  # Unsubscribe from the callback
+
+    # Output:
+    # Exposure changed: 0.1, 0.2
+    # Exposure changed: 0.1
+    ```
+    """
+    _check_priority(priority)
+    root_args = [StatePath(_get_root_slice_name(path.slice_name), path.state) for path in args]
+    if once_per_dispatch:
+        return _subscribe_once_per_dispatch(root_args, priority)
+
+    def register_callback(callback: Callable[..., None], /) -> Callable[[], None]:
+        callback(*tuple(get_state(arg) for arg in args))
+        if priority == "idle":
+            callback = _defer_to_idle(callback)
+        entry: SubscriptionEntry = (callback, root_args)
+        for arg in root_args:
+            _add_entry(SUBSCRIPTIONS[arg.slice_name][arg.state], entry, priority)
+
+        def unsubscribe() -> None:
+            _forget_entry(entry)
+            for arg in root_args:
+                states = SUBSCRIPTIONS.get(arg.slice_name)
+                entries = states.get(arg.state) if states is not None else None
+                # may be gone with `remove_slice` or `create_store(recreate=True)`
+                if entries is None or entry not in entries:
+                    continue
+                entries.remove(entry)
+                if not entries:
+                    del states[arg.state]  # type: ignore[union-attr]
+                    if not states:
+                        del SUBSCRIPTIONS[arg.slice_name]
+
+        return unsubscribe
+
+    return register_callback
+
+
+def _subscribe_once_per_dispatch(
+    root_args: list[StatePath], priority: Priority
+) -> Callable[[Callable[..., None]], Callable[[], None]]:
+    def register_callback(callback: Callable[..., None], /) -> Callable[[], None]:
+        callback(*tuple(get_state(arg) for arg in root_args))
+        if priority == "idle":
+            callback = _defer_to_idle(callback)
+        states: defaultdict[str, set[str]] = defaultdict(set)
+        for arg in root_args:
+            states[arg.slice_name].add(arg.state)
+        entries = {
+            root_slice_name: (callback, frozenset(root_states), root_args)
+            for root_slice_name, root_states in states.items()
+        }
+        for root_slice_name, entry in entries.items():
+            _add_entry(SLICE_SUBSCRIPTIONS[root_slice_name], entry, priority)
+        return partial(_unsubscribe_slice, entries)
+
+    return register_callback
+
+
+def subscribe_slice(
+    slice_type: type[AnySlice], priority: Priority = "normal"
+) -> Callable[[Callable[[AnySlice, frozenset[str]], None]], Callable[[], None]]:
+    """Subscribe to a slice, to be called once per dispatch that changes it.
+
+    The callback receives the new slice and the names of its states that changed, and is
+    called once with the current slice and all its states when it subscribes. Computed
+    states are only reported as changed when they have other subscribers.
+
+    Args:
+        slice_type: The class of the slice. For a slice the root slice inherits from, the
+            callback receives the root slice and is only called when a state declared by
+            `slice_type` changed.
+        priority: The lane of the callback, see `subscribe`. An idle callback receives
+            the latest slice and every state changed since it was last called.
+
+    Returns:
+        A decorator that takes a callback function and returns a function to unsubscribe.
+
+    Example:
+
+    ```python
+    import redux as rd
+
+    @rd.subscribe_slice(ImgConfigSlice)
+    def render(img_config: ImgConfigSlice, changed: frozenset[str]) -> None:
+        print(f"Render {sorted(changed)}")
+
+    rd.dispatch(ImgConfigSlice.set_black_level, 0.2)
+
+    # Output:
+    # Render [...all states...]
+    # Render ['black_level', 'white_level']
+    ```
+    """
+    _check_priority(priority)
+    root_slice_name = _get_root_slice_name(slice_type.__name__)
+    states: frozenset[str] | None = None
+    if slice_type.__name__ != root_slice_name:
+        states = frozenset(slice_type.model_fields)  # type: ignore[attr-defined]
+
+    def register_callback(callback: Callable[..., None], /) -> Callable[[], None]:
+        current_slice = _get_slice_from_name(root_slice_name)
+        callback(
+            current_slice,
+            frozenset(type(current_slice).model_fields) if states is None else states,
+        )
+        if priority == "idle":
+            callback = _defer_to_idle(callback, merge=_merge_changed_states)
+        entry: SliceSubscriptionEntry = (callback, states, None)
+        _add_entry(SLICE_SUBSCRIPTIONS[root_slice_name], entry, priority)
+        return partial(_unsubscribe_slice, {root_slice_name: entry})
+
+    return register_callback
+
+
+def _unsubscribe_slice(entries: dict[str, SliceSubscriptionEntry]) -> None:
+    for root_slice_name, entry in entries.items():
+        _forget_entry(entry)
+        slice_entries = SLICE_SUBSCRIPTIONS.get(root_slice_name)
+        # may be gone with `remove_slice` or `create_store(recreate=True)`
+        if slice_entries is None or entry not in slice_entries:
+            continue
+        slice_entries.remove(entry)
+        if not slice_entries:
+            del SLICE_SUBSCRIPTIONS[root_slice_name]
+
+
+def force_notify(states: Sequence[StatePath | Any]) -> None:
+    """Notify subscribers of state value even if the state did not change."""
+    _check_store_init()
+    store = _store.STORE
+    assert store is not None, "Store not initialized"
+    for state in states:
+        root_slice_name = _get_root_slice_name(state.slice_name)
+        state_name = state.state
+        if root_slice_name in store and store[root_slice_name].has_state(state_name):
+            _notify_state(
+                root_slice_name, state_name, store[root_slice_name].get_state(state_name)
+            )
@@ -0,0 +1,502 @@
+"""Synchronize a store with other processes over a local Unix socket.
+
+The server streams one delta message per committed dispatch, containing only the states
+that changed, and applies dispatches forwarded by its clients. Messages are
+newline-delimited JSON objects:
+
+- server -> client `{"type": "snapshot", "revision": int, "tree": {...}, "slices": {...}}`,
+    sent once when the client connects. Lazy slices not loaded yet are left out.
+- server -> client `{"type": "delta", "revision": int, "slice": str, "states": {...}}`,
+    where `slice` is the root slice name and `states` maps each changed state to its
+    serialized value. Computed states are sent with the states they depend on. Every state
+    is sent for a slice the client does not have yet.
+- server -> client `{"type": "error", "message": str}`, when a forwarded dispatch fails.
+- client -> server `{"type": "dispatch_state", "slice": str, "state": str, "value": ...}`
+- client -> server `{"type": "dispatch", "slice": str, "reducer": str, "payload": ...}`
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import queue
+import socket
+import stat
+import threading
+from collections.abc import Callable
+from functools import cache
+from typing import Annotated, Any, get_type_hints
+
+from pydantic import TypeAdapter
+from pydantic_core import to_jsonable_python
+
+from . import store as _store
+from .reducers import dispatch
+from .slice import Slice, StatePath, _get_computed_states
+
+__all__ = ["StoreServer", "StoreClient", "serve", "connect"]
+
+_ENCODING = "utf-8"
+# messages queued for a client before it is disconnected as too slow to keep up
+_MAX_OUTBOX = 1024
+
+
+def _encode(message: dict[str, Any]) -> bytes:
+    return json.dumps(message, default=to_jsonable_python).encode(_ENCODING) + b"\n"
+
+
+def _read_messages(sock: socket.socket):
+    """Yield decoded messages from a socket until it is closed."""
+    with sock.makefile("rb") as stream:
+        for line in stream:
+            yield json.loads(line)
+
+
+def _find_slice_cls(slice_name: str) -> type[Slice]:
+    """Find the slice class named `slice_name` among the slices in the store."""
+    assert _store.STORE is not None, "Store not initialized"
+    root_slice_name = _store._get_root_slice_name(slice_name)  # pylint: disable=W0212
+    for cls in type(_store.STORE[root_slice_name]).__mro__:
+        if cls.__name__ == slice_name:
+            return cls
+    raise KeyError(f"Slice '{slice_name}' not found in store")
+
+
+def _dump_states(
+    one_slice: Slice, changed_states: tuple[str, ...] | None = None
+) -> dict[str, Any]:
+    """Serialize the states of a slice, or those changed, with its computed states.
+
+    Computed states are sent whenever a state they depend on changed, as they are only
+    reported as changed when they have subscribers in this process.
+    """
+    if changed_states is None:
+        states = one_slice.model_dump(mode="json")
+    else:
+        states = one_slice.model_dump(mode="json", include=set(changed_states))
+    for name, depends_on in _get_computed_states(type(one_slice)).items():
+        if (
+            changed_states is None
+            or depends_on is None
+            or name in changed_states
+            or not depends_on.isdisjoint(changed_states)
+        ):
+            states[name] = to_jsonable_python(getattr(one_slice, name))
+    return states
+
+
+@cache
+def _state_adapter(slice_cls: type[Slice], state_name: str) -> TypeAdapter:
+    field = slice_cls.model_fields[state_name]
+    if field.metadata:
+        return TypeAdapter(Annotated[(field.annotation, *field.metadata)])  # type: ignore
+    return TypeAdapter(field.annotation)
+
+
+@cache
+def _payload_adapter(reducer: Callable) -> TypeAdapter | None:
+    try:
+        hints = get_type_hints(reducer)
+    except NameError:
+        return None
+    hints.pop("return", None)
+    params = reducer.__code__.co_varnames[: reducer.__code__.co_argcount]
+    if len(params) < 2 or params[1] not in hints:
+        return None
+    return TypeAdapter(hints[params[1]])
+
+
+class _Connection:
+    """A client connected to a `StoreServer`."""
+
+    def __init__(self, server: StoreServer, sock: socket.socket) -> None:
+        self.server = server
+        self.sock = sock
+        self.outbox: queue.Queue[bytes | None] = queue.Queue(_MAX_OUTBOX)
+        # root slices sent to the client, the others are sent whole when they change
+        self.slices: set[str] = set()
+        self.closed = False
+        self.writer = threading.Thread(target=self._write_loop, daemon=True)
+        self.reader = threading.Thread(target=self._read_loop, daemon=True)
+
+    def start(self) -> None:
+        """Start reading the messages of the client and writing the ones sent to it."""
+        self.writer.start()
+        self.reader.start()
+
+    def send(self, data: bytes) -> None:
+        """Queue a message to write to the client, disconnecting it if too far behind."""
+        if self.closed:
+            return
+        try:
+            self.outbox.put_nowait(data)
+        except queue.Full:
+            self.close()
+
+    def close(self) -> None:
+        """Stop writing to the client and shut its socket down."""
+        self.closed = True
+        try:
+            self.outbox.put_nowait(None)
+        except queue.Full:  # the writer stops once the socket is shut down
+            pass
+        try:
+            self.sock.shutdown(socket.SHUT_RDWR)
+        except OSError:
+            pass
+
+    def _write_loop(self) -> None:
+        while not self.closed and (data := self.outbox.get()) is not None:
+            try:
+                self.sock.sendall(data)
+            except OSError:
+                break
+        self.sock.close()
+
+    def _read_loop(self) -> None:
+        try:
+            for message in _read_messages(self.sock):
+                self.server._handle(self, message)  # pylint: disable=W0212
+        except (OSError, ValueError):
+            pass
+        finally:
+            self.server._drop(self)  # pylint: disable=W0212
+
+
+class StoreServer:
+    """Serve the store to `StoreClient`s connected to a Unix socket.
+
+    Use `redux.serve` to create one. Dispatches forwarded by clients are handed to `call`.
+    By default they are queued and run one at a time, in the order they are received, by a
+    thread of the server, so that clients never dispatch concurrently. That thread does not
+    synchronize with the rest of the application: if the store is dispatched from elsewhere
+    as well, pass a function that schedules the callable on the thread owning the store,
+    e.g. `loop.call_soon_threadsafe`.
+
+    Clients reading their messages too slowly to keep up are disconnected.
+    """
+
+    def __init__(
+        self,
+        path: str | os.PathLike[str],
+        call: Callable[[Callable[[], None]], None] | None = None,
+    ) -> None:
+        _store._check_store_init()  # pylint: disable=W0212
+        self.path = os.fspath(path)
+        self._inbox: queue.SimpleQueue[Callable[[], None] | None] | None = None
+        if call is None:
+            self._inbox = queue.SimpleQueue()
+            call = self._inbox.put
+            threading.Thread(target=self._dispatch_loop, daemon=True).start()
+        self._call = call
+        self._lock = threading.Lock()
+        self._connections: list[_Connection] = []
+        if os.path.exists(self.path) and stat.S_ISSOCK(os.stat(self.path).st_mode):
+            os.unlink(self.path)  # stale socket left by a previous server
+        self._sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)  # pylint: disable=E1101
+        self._sock.bind(self.path)
+        self._sock.listen()
+        _store._CHANGE_LISTENERS.append(self._on_change)  # pylint: disable=W0212
+        self._thread = threading.Thread(target=self._accept_loop, daemon=True)
+        self._thread.start()
+
+    def __enter__(self) -> StoreServer:
+        return self
+
+    def __exit__(self, *_: object) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Stop serving, disconnect every client and remove the socket file."""
+        if self._on_change in _store._CHANGE_LISTENERS:  # pylint: disable=W0212
+            _store._CHANGE_LISTENERS.remove(self._on_change)  # pylint: disable=W0212
+        try:
+            self._sock.shutdown(socket.SHUT_RDWR)
+        except OSError:
+            pass
+        self._sock.close()
+        with self._lock:
+            connections, self._connections = self._connections, []
+        for connection in connections:
+            connection.close()
+        if os.path.exists(self.path):
+            os.unlink(self.path)
+        if self._inbox is not None:
+            self._inbox.put(None)
+
+    def _dispatch_loop(self) -> None:
+        assert self._inbox is not None
+        while (run := self._inbox.get()) is not None:
+            run()
+
+    def _accept_loop(self) -> None:
+        while True:
+            try:
+                sock, _ = self._sock.accept()
+            except OSError:
+                return
+            connection = _Connection(self, sock)
+            # no dispatch commits while the snapshot is taken, so the deltas of the
+            # dispatches after it are sent to the connection and the others are not
+            with _store._DISPATCH_LOCK, self._lock:  # pylint: disable=W0212
+                connection.send(_encode(self._snapshot(connection)))
+                self._connections.append(connection)
+            connection.start()
+
+    @staticmethod
+    def _snapshot(connection: _Connection) -> dict[str, Any]:
+        assert _store.STORE is not None, "Store not initialized"
+        slices = {}
+        for name in tuple(_store.SLICE_NAME_CACHE):
+            # `dict.get` does not load lazy slices
+            one_slice = dict.get(_store.STORE, name)
+            if one_slice is not None:
+                slices[name] = _dump_states(one_slice)
+        connection.slices.update(slices)
+        return {
+            "type": "snapshot",
+            "revision": _store.REVISION,
+            "tree": dict(_store.SLICE_TREE),
+            "slices": slices,
+        }
+
+    def _on_change(
+        self,
+        root_slice_name: str,
+        new_slice: Slice,
+        changed_states: tuple[str, ...],
+        revision: int,
+    ) -> None:
+        with self._lock:
+            if not self._connections:
+                return
+            # by whether every state is sent, for clients that do not have the slice yet
+            data: dict[bool, bytes] = {}
+            for connection in self._connections:
+                whole = root_slice_name not in connection.slices
+                if whole not in data:
+                    states = _dump_states(new_slice, None if whole else changed_states)
+                    data[whole] = _encode(
+                        {
+                            "type": "delta",
+                            "revision": revision,
+                            "slice": root_slice_name,
+                            "states": states,
+                        }
+                    )
+                connection.slices.add(root_slice_name)
+                connection.send(data[whole])
+
+    def _drop(self, connection: _Connection) -> None:
+        with self._lock:
+            if connection in self._connections:
+                self._connections.remove(connection)
+        connection.close()
+
+    def _handle(self, connection: _Connection, message: dict[str, Any]) -> None:
+        try:
+            action = self._parse(message)
+        except (KeyError, TypeError, ValueError) as e:
+            connection.send(_encode({"type": "error", "message": str(e)}))
+            return
+
+        def run() -> None:
+            try:
+                action()
+            except Exception as e:  # pylint: disable=W0718
+                connection.send(_encode({"type": "error", "message": str(e)}))
+
+        self._call(run)
+
+    @staticmethod
+    def _parse(message: dict[str, Any]) -> Callable[[], None]:
+        slice_cls = _find_slice_cls(message["slice"])
+        if message["type"] == "dispatch_state":
+            path = StatePath(message["slice"], message["state"])
+            value = _state_adapter(slice_cls, path.state).validate_python(message["value"])
+            return lambda: _store.dispatch_state(path, value)
+        if message["type"] == "dispatch":
+            reducer = next(
+                (
+                    cls.__dict__[message["reducer"]]
+                    for cls in slice_cls.__mro__
+                    if message["reducer"] in cls.__dict__
+                ),
+                None,
+            )
+            if not isinstance(reducer, staticmethod):
+                raise KeyError(
+                    f"Reducer '{message['reducer']}' not found in slice '{message['slice']}'"
+                )
+            func = reducer.__func__
+            if func.__code__.co_argcount < 2:
+                return lambda: dispatch(func)
+            payload = message.get("payload")
+            adapter = _payload_adapter(func)
+            if adapter is not None:
+                payload = adapter.validate_python(payload)
+            return lambda: dispatch(func, payload)
+        raise ValueError(f"Unknown message type '{message['type']}'")
+
+
+class StoreClient:  # pylint: disable=R0902
+    """Local mirror of a store served by `StoreServer`.
+
+    Use `redux.connect` to create one. States in the mirror hold their JSON form (e.g. a
+    `NamedTuple` state is mirrored as a list).
+    """
+
+    def __init__(self, path: str | os.PathLike[str], timeout: float | None = 5.0) -> None:
+        self.path = os.fspath(path)
+        self.revision: int = 0
+        self.errors: list[str] = []
+        self._tree: dict[str, str] = {}
+        self._slices: dict[str, dict[str, Any]] = {}
+        self._listeners: list[Callable[[str, dict[str, Any], int], None]] = []
+        self._condition = threading.Condition()
+        self._connected = False
+        self._sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)  # pylint: disable=E1101
+        self._sock.connect(self.path)
+        self._send_lock = threading.Lock()
+        self._thread = threading.Thread(target=self._read_loop, daemon=True)
+        self._thread.start()
+        with self._condition:
+            if not self._condition.wait_for(lambda: self._connected, timeout):
+                self.close()
+                raise TimeoutError(f"No snapshot received from '{self.path}'")
+
+    def __enter__(self) -> StoreClient:
+        return self
+
+    def __exit__(self, *_: object) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Disconnect from the server."""
+        try:
+            self._sock.shutdown(socket.SHUT_RDWR)
+        except OSError:
+            pass
+        self._sock.close()
+
+    def get_state(self, path: StatePath) -> Any:
+        """Get the mirrored value of a state."""
+        with self._condition:
+            if path.slice_name not in self._tree:
+                raise KeyError(f"Slice '{path.slice_name}' not found in store")
+            states = self._slices[self._tree[path.slice_name]]
+            if path.state not in states:
+                raise KeyError(f"State '{path.state}' not found in slice '{path.slice_name}'")
+            return states[path.state]
+
+    def subscribe(
+        self, callback: Callable[[str, dict[str, Any], int], None], /
+    ) -> Callable[[], None]:
+        """Call `callback(root_slice_name, changed_states, revision)` on every delta.
+
+        The callback runs on the client's reader thread.
+        """
+        self._listeners.append(callback)
+        return lambda: self._listeners.remove(callback)
+
+    def wait_for_revision(self, revision: int, timeout: float | None = None) -> bool:
+        """Block until the mirror reaches `revision`. Return False on timeout."""
+        with self._condition:
+            return self._condition.wait_for(lambda: self.revision >= revision, timeout)
+
+    def dispatch_state(self, state: StatePath, payload: Any) -> None:
+        """Forward `redux.dispatch_state(state, payload)` to the server."""
+        self._send(
+            {
+                "type": "dispatch_state",
+                "slice": state.slice_name,
+                "state": state.state,
+                "value": payload,
+            }
+        )
+
+    def dispatch(self, reducer: Callable | str, payload: Any = None) -> None:
+        """Forward `redux.dispatch(reducer, payload)` to the server.
+
+        `reducer` is either the reducer itself or its qualified name, e.g.
+        `"CameraSlice.set_exposure"`.
+        """
+        qualname = reducer if isinstance(reducer, str) else reducer.__qualname__
+        slice_name, _, reducer_name = qualname.rpartition(".")
+        self._send(
+            {
+                "type": "dispatch",
+                "slice": slice_name,
+                "reducer": reducer_name,
+                "payload": payload,
+            }
+        )
+
+    def _send(self, message: dict[str, Any]) -> None:
+        with self._send_lock:
+            self._sock.sendall(_encode(message))
+
+    def _read_loop(self) -> None:
+        try:
+            for message in _read_messages(self._sock):
+                self._receive(message)
+        except (OSError, ValueError):
+            pass
+
+    def _receive(self, message: dict[str, Any]) -> None:
+        if message["type"] == "error":
+            self.errors.append(message["message"])
+            return
+        with self._condition:
+            if message["type"] == "snapshot":
+                self._tree = message["tree"]
+                self._slices = message["slices"]
+                self.revision = message["revision"]
+                self._connected = True
+            elif message["type"] == "delta":
+                self._slices.setdefault(message["slice"], {}).update(message["states"])
+                self.revision = max(self.revision, message["revision"])
+            self._condition.notify_all()
+        if message["type"] == "delta":
+            for listener in tuple(self._listeners):
+                listener(message["slice"], message["states"], message["revision"])
+
+
+def serve(
+    path: str | os.PathLike[str],
+    call: Callable[[Callable[[], None]], None] | None = None,
+) -> StoreServer:
+    """Serve the store on a Unix socket, streaming state deltas to connected clients.
+
+    Args:
+        path: Path of the Unix socket to listen on.
+        call: Runs dispatches forwarded by clients. Defaults to running them one at a time
+            on a thread of the server, see `StoreServer`.
+
+    Returns:
+        The running server. Call `close()` or use it as a context manager to stop it.
+
+    Example:
+
+    ```python
+    import redux as rd
+
+    server = rd.serve("/tmp/camera.sock")
+
+    # in another process
+    client = rd.connect("/tmp/camera.sock")
+    client.get_state(CameraSlice.exposure)
+    client.dispatch_state(CameraSlice.exposure, 0.5)
+    ```
+    """
+    return StoreServer(path, call)
+
+
+def connect(path: str | os.PathLike[str], timeout: float | None = 5.0) -> StoreClient:
+    """Connect to a store served by `redux.serve` and mirror its states locally.
+
+    Args:
+        path: Path of the Unix socket the server listens on.
+        timeout: Seconds to wait for the initial snapshot.
+    """
+    return StoreClient(path, timeout)
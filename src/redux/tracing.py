@@ -0,0 +1,99 @@
+"""Record dispatches as spans and export them in the Chrome trace event format."""
+
+# Access to protected members of the store module
+# pylint: disable=W0212
+
+from __future__ import annotations
+
+import json
+import os
+import threading
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any
+
+from . import store as _store
+
+__all__ = ["Tracer", "trace"]
+
+
+class Tracer:
+    """Collect spans as Chrome trace events.
+
+    Use `redux.trace` to record the dispatches made in a block of code.
+    """
+
+    def __init__(self) -> None:
+        self.events: list[dict[str, Any]] = []
+        self._start = time.perf_counter_ns()
+        self._pid = os.getpid()
+
+    @contextmanager
+    def span(self, name: str, category: str, **args: Any) -> Iterator[dict[str, Any]]:
+        """Record the duration of the block as a span.
+
+        Spans recorded inside the block are nested under it by the trace viewer. The
+        yielded dictionary is stored as the arguments of the span and can be filled in by
+        the block.
+        """
+        start = time.perf_counter_ns()
+        try:
+            yield args
+        except BaseException as e:
+            args["error"] = repr(e)
+            raise
+        finally:
+            end = time.perf_counter_ns()
+            self.events.append(
+                {
+                    "name": name,
+                    "cat": category,
+                    "ph": "X",
+                    "ts": (start - self._start) / 1e3,
+                    "dur": (end - start) / 1e3,
+                    "pid": self._pid,
+                    "tid": threading.get_ident(),
+                    "args": args,
+                }
+            )
+
+    def write(self, path: str | os.PathLike[str]) -> None:
+        """Write the recorded spans to a JSON file."""
+        trace_events = sorted(self.events, key=lambda event: (event["ts"], -event["dur"]))
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump({"traceEvents": trace_events, "displayTimeUnit": "ms"}, f, default=repr)
+
+
+@contextmanager
+def trace(path: str | os.PathLike[str] | None = None) -> Iterator[Tracer]:
+    """Record every dispatch made in the block as a tree of spans.
+
+    Each dispatch records spans for the reducer, the change detection, every subscriber
+    and extra reducer it notifies, the dispatches those make, and the rollback if one of
+    them fails. Open the written file in `chrome://tracing` or https://ui.perfetto.dev.
+
+    Args:
+        path: The JSON file to write the trace to when the block exits. If None, the spans
+            are only kept in the returned tracer.
+
+    Example:
+
+    ```python
+    import redux as rd
+
+    with rd.trace("dispatch_trace.json"):
+        rd.dispatch_state(CameraSlice.exposure, 0.5)
+    ```
+    """
+    if _store._TRACER is not None:
+        raise RuntimeError("A trace is already being recorded")
+    tracer = Tracer()
+    _store._TRACER = tracer
+    try:
+        yield tracer
+    finally:
+        _store._TRACER = None
+        if path is not None:
+            tracer.write(Path(path))
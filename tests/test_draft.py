@@ -0,0 +1,135 @@
+"""This module contains tests for redux.draft, reducers written as mutations of drafts."""
+
+# Unused argument fixtures
+# pylint: disable=W0613
+
+from __future__ import annotations
+
+from typing import Any
+
+import pytest
+
+import redux as rd
+from redux.draft import Patch
+
+
+class _CountingEq:  # pylint: disable=R0903
+    comparisons = 0
+
+    def __eq__(self, other: object) -> bool:
+        _CountingEq.comparisons += 1
+        return self is other
+
+    __hash__ = object.__hash__
+
+
+class _PlaylistSlice(rd.Slice):
+    tracks: list[dict[str, str]] = []
+    position: int = 0
+    tags: dict[str, list[str]] = {}
+    marker: Any = None
+
+    @rd.reduce
+    def rename_track(piece: _PlaylistSlice, track: tuple[int, str]) -> _PlaylistSlice:
+        """rename a track and move to it"""
+        index, title = track
+
+        def recipe(draft: Any) -> None:
+            draft.tracks[index]["title"] = title
+            draft.position = index
+
+        return rd.produce(piece, recipe)[0]
+
+
+class _PlaylistStore(rd.Store):
+    playlist: _PlaylistSlice
+
+
+@pytest.fixture()
+def _store_with_playlist() -> None:
+    rd.create_store(
+        _PlaylistStore(
+            playlist=_PlaylistSlice(
+                tracks=[{"title": "a"}, {"title": "b"}],
+                position=0,
+                tags={"rock": ["a"], "jazz": ["b"]},
+                marker=_CountingEq(),
+            )
+        ),
+        recreate=True,
+    )
+
+
+def test_produce() -> None:
+    """Test that produce copies only what changed and returns the patches in order."""
+    playlist = _PlaylistSlice(
+        tracks=[{"title": "a"}, {"title": "b"}],
+        position=0,
+        tags={"rock": ["a"], "jazz": ["b"]},
+        marker=None,
+    )
+
+    def recipe(draft: Any) -> None:
+        draft.tracks[1]["title"] = "B"
+        draft.position += 1
+        draft.tags["rock"].append("c")
+        draft.tracks.insert(0, {"title": "z"})
+        draft.tracks[2]["title"] = "BB"
+        del draft.tracks[0]
+        draft.tags["pop"] = draft.tags["jazz"]
+
+    new_playlist, patches = rd.produce(playlist, recipe)
+    assert new_playlist == _PlaylistSlice(
+        tracks=[{"title": "a"}, {"title": "BB"}],
+        position=1,
+        tags={"rock": ["a", "c"], "jazz": ["b"], "pop": ["b"]},
+        marker=None,
+    )
+    assert playlist.tracks == [{"title": "a"}, {"title": "b"}]
+    assert playlist.tags == {"rock": ["a"], "jazz": ["b"]}
+    assert new_playlist.tracks[0] is playlist.tracks[0]
+    assert new_playlist.tags["jazz"] is playlist.tags["jazz"]
+    assert patches == [
+        Patch("replace", ("tracks", 1, "title"), "B"),
+        Patch("replace", ("position",), 1),
+        Patch("add", ("tags", "rock", 1), "c"),
+        Patch("add", ("tracks", 0), {"title": "z"}),
+        Patch("replace", ("tracks", 2, "title"), "BB"),
+        Patch("remove", ("tracks", 0)),
+        Patch("add", ("tags", "pop"), ["b"]),
+    ]
+
+    sorted_playlist, patches = rd.produce(
+        playlist,
+        lambda draft: draft.tracks.sort(key=lambda track: track["title"], reverse=True),
+    )
+    assert sorted_playlist.tracks == [{"title": "b"}, {"title": "a"}]
+    assert patches == [Patch("replace", ("tracks",), [{"title": "b"}, {"title": "a"}])]
+    assert rd.produce(playlist, lambda draft: draft.tracks[0]) == (playlist, [])
+
+
+def test_invalid_draft() -> None:
+    """Test that drafts reject unknown states and cannot be used after produce returns."""
+    playlist = _PlaylistSlice(tracks=[], position=0, tags={}, marker=None)
+    drafts: list[Any] = []
+    with pytest.raises(AttributeError):
+        rd.produce(playlist, lambda draft: draft.wrong_state)
+    rd.produce(playlist, drafts.append)
+    with pytest.raises(RuntimeError):
+        drafts[0].position = 1
+
+
+def test_produce_in_store(_store_with_playlist) -> None:
+    """Test that committing a produced slice only compares the states it changed."""
+    positions: list[int] = []
+    titles: list[str] = []
+    rd.subscribe(_PlaylistSlice.position)(positions.append)
+    rd.subscribe(_PlaylistSlice.tracks)(lambda tracks: titles.append(tracks[1]["title"]))
+    _CountingEq.comparisons = 0
+
+    rd.dispatch(_PlaylistSlice.rename_track, (1, "B"))
+    assert positions == [0, 1]
+    assert titles == ["b", "B"]
+    assert _CountingEq.comparisons == 0
+    rd.dispatch_state(_PlaylistSlice.position, 0)
+    assert _CountingEq.comparisons == 1
@@ -0,0 +1,154 @@
+"""This module contains tests for redux.entity, normalized collections of entities."""
+
+# Access to protected members of entity states
+# pylint: disable=W0212
+# Unused argument fixtures
+# pylint: disable=W0613
+
+from __future__ import annotations
+
+import pytest
+from pydantic import BaseModel, ConfigDict
+
+import redux as rd
+
+
+class _Detection(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
+    id: int
+    label: str
+    score: float
+
+
+_DETECTIONS = rd.EntityAdapter[_Detection](
+    sort_key=lambda detection: -detection.score,
+    indexes={"label": lambda detection: detection.label},
+)
+
+
+class _DetectionsSlice(rd.Slice):
+    objects: rd.EntityState[_Detection]
+
+    @rd.reduce
+    def add_detections(piece: _DetectionsSlice, found: list[_Detection]) -> _DetectionsSlice:
+        """add or replace detections"""
+        objects = _DETECTIONS.upsert_many(piece.objects, found)
+        return piece.update([(_DetectionsSlice.objects, objects)])
+
+
+class _DetectionsStore(rd.Store):
+    detections: _DetectionsSlice
+
+
+@pytest.fixture()
+def _store_with_detections() -> None:
+    rd.create_store(
+        _DetectionsStore(detections=_DetectionsSlice(objects=_DETECTIONS.get_initial_state())),
+        recreate=True,
+    )
+
+
+def test_entity_adapter() -> None:
+    """Test that the reducers keep the order and indexes and copy only what changed."""
+    adapter = rd.EntityAdapter[dict](indexes={"parity": lambda entity: entity["id"] % 2})
+    state = adapter.add_many(
+        adapter.get_initial_state(), [{"id": i, "value": i} for i in range(100)]
+    )
+    assert adapter.add_one(state, {"id": 3, "value": -1}) is state
+    assert adapter.select_all(state)[:3] == (
+        {"id": 0, "value": 0},
+        {"id": 1, "value": 1},
+        {"id": 2, "value": 2},
+    )
+
+    updated = adapter.update_one(state, 3, {"value": 30})
+    assert adapter.select_by_id(updated, 3) == {"id": 3, "value": 30}
+    assert adapter.select_by_id(state, 3) == {"id": 3, "value": 3}
+    assert updated.ids is state.ids
+    assert adapter.select_all(updated)[3] == {"id": 3, "value": 30}
+    # only the bucket holding the entity was copied
+    assert sum(new is not old for new, old in zip(updated._buckets, state._buckets)) == 1
+    assert updated != state
+    assert adapter.update_one(updated, 3, {"value": 3}) == state
+
+    removed = adapter.remove_many(updated, [1, 3, 500])
+    assert adapter.select_total(removed) == 98
+    assert 3 not in removed and 3 in updated
+    odd = adapter.select_by_index(removed, "parity", 1)
+    assert [entity["id"] for entity in odd[:2]] == [5, 7]
+    assert removed == adapter.get_initial_state(adapter.select_all(removed))
+    with pytest.raises(ValueError):
+        adapter.update_one(state, 3, {"id": 4})
+    assert adapter.update_one(state, 500, {"value": 0}) is state
+
+
+def test_none_entities() -> None:
+    """Test that entities stored as None are found like any other."""
+    adapter = rd.EntityAdapter[str | None](select_id=lambda name: name or "")
+    state = adapter.add_many(adapter.get_initial_state(), [None, "a"])
+    assert adapter.add_one(state, None) is state
+    assert adapter.upsert_many(state, [None]) is state
+    assert adapter.select_ids(adapter.remove_many(state, [""])) == ("a",)
+    assert adapter.select_total(state) == 2
+
+
+def test_sorted_entity_adapter() -> None:
+    """Test that sorted views and indexes follow upserts and updates."""
+    state = _DETECTIONS.get_initial_state(
+        [
+            _Detection(id=i, label="car" if i % 3 else "person", score=i / 100)
+            for i in range(30)
+        ]
+    )
+    assert state.ids == tuple(range(29, -1, -1))
+    state = _DETECTIONS.update_one(state, 0, {"score": 0.5})
+    assert state.ids[:2] == (0, 29)
+    state = _DETECTIONS.upsert_many(
+        state,
+        [
+            _Detection(id=40, label="person", score=0.25),
+            _Detection(id=29, label="person", score=0.275),
+        ],
+    )
+    assert state.ids[:3] == (0, 28, 29)
+    assert state.ids.index(40) == state.ids.index(25) + 1
+    assert [
+        detection.id for detection in _DETECTIONS.select_by_index(state, "label", "person")
+    ] == [27, 24, 21, 18, 15, 12, 9, 6, 3, 0, 29, 40]
+    assert not _DETECTIONS.select_by_index(state, "label", "bus")
+    # many moves are merged in one sort
+    state = _DETECTIONS.upsert_many(
+        state, [_Detection(id=i, label="car", score=1 - i / 100) for i in range(20)]
+    )
+    assert state.ids[:20] == tuple(range(20))
+    assert [detection.id for detection in _DETECTIONS.select_all(state)] == list(state.ids)
+    assert state == _DETECTIONS.get_initial_state(_DETECTIONS.select_all(state))
+
+
+def test_entity_state_in_store(_store_with_detections) -> None:
+    """Test that entity states are held by slices, notified and serialized."""
+    totals: list[int] = []
+    rd.subscribe(_DetectionsSlice.objects)(lambda objects: totals.append(len(objects)))
+    rd.dispatch(
+        _DetectionsSlice.add_detections,
+        [_Detection(id=1, label="car", score=0.4), _Detection(id=2, label="bus", score=0.9)],
+    )
+    objects = rd.get_state(_DetectionsSlice.objects)
+    assert objects.ids == (2, 1)
+    assert objects.entities[1] == _Detection(id=1, label="car", score=0.4)
+    assert totals == [0, 2]
+
+    data = rd.get_slice(_DetectionsSlice).model_dump(mode="json")
+    assert data == {
+        "objects": {
+            "ids": [2, 1],
+            "entities": [
+                {"id": 2, "label": "bus", "score": 0.9},
+                {"id": 1, "label": "car", "score": 0.4},
+            ],
+        }
+    }
+    restored = _DetectionsSlice.model_validate(data).objects
+    assert restored == objects
+    assert _DETECTIONS.select_by_index(restored, "label", "car")[0].id == 1
@@ -0,0 +1,71 @@
+"""This module contains tests for redux.export, cached serialization of the store."""
+
+# Access to protected members of the export module
+# pylint: disable=W0212
+# Unused argument fixtures
+# pylint: disable=W0613
+
+from __future__ import annotations
+
+import json
+
+import pytest
+
+import redux as rd
+from redux import export
+
+
+class _ExportCameraSlice(rd.Slice):
+    exposure: float
+    roi: tuple[int, int, int, int]
+
+
+class _ExportCountersSlice(rd.FastSlice):
+    frames: int = 0
+
+
+class _ExportPluginSlice(rd.Slice):
+    level: int
+
+
+class _ExportStore(rd.Store):
+    camera: _ExportCameraSlice
+    counters: _ExportCountersSlice
+
+
+@pytest.fixture()
+def _store_to_export() -> None:
+    rd.create_store(
+        _ExportStore(
+            camera=_ExportCameraSlice(exposure=0.1, roi=(0, 0, 10, 10)),
+            counters=_ExportCountersSlice(),
+        ),
+        recreate=True,
+    )
+
+
+def test_dump_json(_store_to_export) -> None:
+    """Test that the store is serialized like the store model, slices added or removed."""
+    assert json.loads(rd.dump_json()) == rd.get_store().model_dump(mode="json")
+    assert (
+        rd.dump_bytes()
+        == b'{"camera":{"exposure":0.1,"roi":[0,0,10,10]},"counters":{"frames":0}}'
+    )
+
+    rd.inject_slice(_ExportPluginSlice(level=2), name="plugin")
+    assert json.loads(rd.dump_json())["plugin"] == {"level": 2}
+    rd.remove_slice(_ExportPluginSlice)
+    assert "plugin" not in json.loads(rd.dump_json())
+    assert set(export._FRAGMENTS) == {"_ExportCameraSlice", "_ExportCountersSlice"}
+
+
+def test_dump_reuses_unchanged_slices(_store_to_export) -> None:
+    """Test that only the slices replaced since the last dump are serialized again."""
+    rd.dump_bytes()
+    camera = export._FRAGMENTS["_ExportCameraSlice"][2]
+    counters = export._FRAGMENTS["_ExportCountersSlice"][2]
+
+    rd.dispatch_state(_ExportCountersSlice.frames, 5)
+    assert json.loads(rd.dump_bytes())["counters"] == {"frames": 5}
+    assert export._FRAGMENTS["_ExportCameraSlice"][2] is camera
+    assert export._FRAGMENTS["_ExportCountersSlice"][2] is not counters
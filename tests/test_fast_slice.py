@@ -0,0 +1,124 @@
+"""This module contains tests for redux.fast_slice, tuple-backed slices."""
+
+# Unused argument fixtures
+# pylint: disable=W0613
+
+from __future__ import annotations
+
+import pickle
+from typing import Annotated
+
+import pytest
+from annotated_types import Ge
+from pydantic import ValidationError
+
+import redux as rd
+
+
+class _FastBaseSlice(rd.FastSlice):
+    name: str = "counters"
+
+
+class _FastCountersSlice(_FastBaseSlice):
+    frames: Annotated[int, Ge(0)] = 0
+    exposure: float
+
+    @rd.reduce
+    def add_frames(piece: _FastCountersSlice, count: int) -> _FastCountersSlice:
+        """add frames"""
+        return piece.update([(_FastCountersSlice.frames, piece.frames + count)])
+
+
+class _FastFollowerSlice(rd.Slice):
+    exposure_copy: float = 0.0
+
+    @rd.extra_reduce(_FastCountersSlice.exposure)
+    def follow_exposure(piece: _FastFollowerSlice, exposure: float) -> _FastFollowerSlice:
+        """copy the exposure of the counters"""
+        return piece.update([(_FastFollowerSlice.exposure_copy, exposure)])
+
+
+class _FastStore(rd.Store):
+    counters: _FastCountersSlice
+    follower: _FastFollowerSlice
+
+
+@pytest.fixture()
+def _store_with_fast_slice() -> None:
+    rd.create_store(
+        _FastStore(
+            counters=_FastCountersSlice(exposure=1.0),
+            follower=_FastFollowerSlice(exposure_copy=0.0),
+        ),
+        recreate=True,
+    )
+
+
+def test_fast_slice_declaration() -> None:
+    """Test that fast slices are declared and validated like slices."""
+    assert _FastCountersSlice.frames == rd.build_path("_FastCountersSlice", "frames")
+    assert _FastCountersSlice.name == rd.build_path("_FastCountersSlice", "name")
+    assert _FastCountersSlice.slice_name == "_FastCountersSlice"  # pylint: disable=W0143
+
+    counters = _FastCountersSlice(exposure=2)
+    assert counters == _FastCountersSlice(name="counters", frames=0, exposure=2.0)
+    assert counters.exposure == 2.0 and isinstance(counters.exposure, float)
+    assert counters.get_state("name") == "counters"
+    assert counters.model_dump() == {"name": "counters", "frames": 0, "exposure": 2.0}
+    assert pickle.loads(pickle.dumps(counters)) == counters
+    with pytest.raises(KeyError):
+        counters.get_state("wrong_state")
+    with pytest.raises(AttributeError):
+        counters.frames = 1  # type: ignore[misc]
+    with pytest.raises(ValidationError):
+        _FastCountersSlice(frames=-1, exposure=1.0)
+    with pytest.raises(ValidationError):
+        _FastCountersSlice()
+
+    updated = counters.update([(_FastCountersSlice.frames, 3)])
+    assert updated.frames == 3 and counters.frames == 0
+    with pytest.raises(KeyError):
+        counters.update([(rd.build_path("_FastCountersSlice", "wrong_state"), 3)])
+
+
+def test_invalid_fast_slice() -> None:
+    """Test that fast slices reject computed states and reused names."""
+    with pytest.raises(TypeError):
+
+        class _FastComputedSlice(rd.FastSlice):  # pylint: disable=W0612
+            frames: int = 0
+
+            @rd.computed
+            def double(self) -> int:
+                """double"""
+                return self.frames * 2
+
+    with pytest.raises(TypeError):
+
+        class _FastCountersSlice(rd.FastSlice):  # pylint: disable=W0612,W0621
+            frames: int = 0
+
+
+def test_fast_slice_in_store(_store_with_fast_slice) -> None:
+    """Test that fast slices dispatch and notify alongside pydantic slices."""
+    frames: list[int] = []
+    rd.subscribe(_FastCountersSlice.frames)(frames.append)
+    assert rd.get_state(_FastFollowerSlice.exposure_copy) == 1.0
+
+    rd.dispatch(_FastCountersSlice.add_frames, 2)
+    rd.dispatch_state(_FastCountersSlice.exposure, 5.0)
+    rd.setter(_FastCountersSlice.frames)(10)
+    assert frames == [0, 2, 10]
+    assert rd.accessor(_FastBaseSlice.name)() == "counters"
+    assert rd.get_state(_FastFollowerSlice.exposure_copy) == 5.0
+
+    store = rd.get_store(_FastStore)
+    assert store.counters == _FastCountersSlice(frames=10, exposure=5.0)
+    assert store.model_dump()["counters"] == {
+        "name": "counters",
+        "frames": 10,
+        "exposure": 5.0,
+    }
+    assert rd.changes_since(rd.get_revision() - 1) == [
+        rd.StateChange("_FastCountersSlice", "frames", 2, 10)
+    ]
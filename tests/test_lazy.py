@@ -0,0 +1,148 @@
+"""This module contains tests for redux.lazy, slices loaded on first use."""
+
+# Unused argument fixtures
+# pylint: disable=W0613
+
+from __future__ import annotations
+
+import json
+import time
+from pathlib import Path
+
+import pytest
+
+import redux as rd
+
+
+class _LazyCameraSlice(rd.Slice):
+    exposure: float = 1.0
+
+
+class _LazyCalibrationSlice(rd.Slice):
+    offsets: list[float] = []
+
+    @rd.extra_reduce(_LazyCameraSlice.exposure)
+    def scale_offsets(piece: _LazyCalibrationSlice, exposure: float) -> _LazyCalibrationSlice:
+        """scale the offsets with the exposure"""
+        return piece.update(
+            [(_LazyCalibrationSlice.offsets, [offset * exposure for offset in piece.offsets])]
+        )
+
+
+class _LazyHistorySlice(rd.Slice):
+    frames: int = 0
+
+
+_LOADS: list[str] = []
+
+
+def _load_history() -> _LazyHistorySlice:
+    _LOADS.append("history")
+    return _LazyHistorySlice(frames=10)
+
+
+class _LazyStatsSlice(rd.Slice):
+    frames_dropped: int = 0
+
+
+def _load_stats() -> _LazyStatsSlice:
+    _LOADS.append("stats")
+    return _LazyStatsSlice(frames_dropped=0)
+
+
+class _LazyStore(rd.Store):
+    camera: _LazyCameraSlice
+    calibration: _LazyCalibrationSlice = rd.lazy("calibration.json")
+    history: _LazyHistorySlice = rd.lazy(_load_history, evict_after=0)
+    stats: _LazyStatsSlice = rd.lazy(_load_stats, evict_after=10)
+
+
+@pytest.fixture()
+def _store_with_lazy_slices(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    (tmp_path / "calibration.json").write_text(json.dumps({"offsets": [1.0, 2.0]}))
+    monkeypatch.chdir(tmp_path)
+    _LOADS.clear()
+    rd.create_store(_LazyStore(camera=_LazyCameraSlice()), recreate=True)
+
+
+def test_lazy_slice_loads_on_first_use(_store_with_lazy_slices) -> None:
+    """Test that lazy slices are loaded by the first read, dispatch or subscription."""
+    assert set(rd.store.STORE) == {"_LazyCameraSlice"}
+    assert not _LOADS
+
+    assert rd.get_state(_LazyHistorySlice.frames) == 10
+    assert rd.get_state(_LazyHistorySlice.frames) == 10
+    assert _LOADS == ["history"]
+
+    offsets: list[list[float]] = []
+    rd.subscribe(_LazyCalibrationSlice.offsets)(offsets.append)
+    rd.dispatch_state(_LazyCameraSlice.exposure, 2.0)
+    assert offsets == [[1.0, 2.0], [2.0, 4.0]]
+    assert rd.get_store(_LazyStore).calibration == _LazyCalibrationSlice(offsets=[2.0, 4.0])
+
+
+def test_evict_idle(_store_with_lazy_slices) -> None:
+    """Test that idle lazy slices are unloaded only while unchanged."""
+    assert not rd.evict_idle()
+    rd.get_slice(_LazyHistorySlice)
+    rd.get_slice(_LazyCalibrationSlice)
+    assert rd.evict_idle() == ["_LazyHistorySlice"]
+    assert "_LazyHistorySlice" in rd.store.STORE
+    assert rd.get_state(_LazyHistorySlice.frames) == 10
+    assert _LOADS == ["history", "history"]
+
+    rd.dispatch_state(_LazyHistorySlice.frames, 11)
+    assert not rd.evict_idle()
+    assert rd.get_state(_LazyHistorySlice.frames) == 11
+
+
+def test_evict_idle_after_accessor_reads(
+    _store_with_lazy_slices, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test that reading a lazy slice through an accessor keeps it from being evicted."""
+    now = 1000.0
+    monkeypatch.setattr(time, "monotonic", lambda: now)
+    frames_dropped = rd.accessor(_LazyStatsSlice.frames_dropped)
+    for _ in range(5):
+        now += 6
+        assert frames_dropped() == 0
+        assert not rd.evict_idle()
+    now += 10
+    assert rd.evict_idle() == ["_LazyStatsSlice"]
+    assert _LOADS == ["stats"]
+
+
+def test_lazy_slice_snapshot(_store_with_lazy_slices) -> None:
+    """Test that snapshots hold lazy slices as loaded by the store, and never load them."""
+    before = rd.snapshot()
+    with pytest.raises(KeyError):
+        before.get_state(_LazyHistorySlice.frames)
+    assert not _LOADS
+
+    rd.get_state(_LazyHistorySlice.frames)
+    loaded = rd.snapshot()
+    assert loaded.get_state(_LazyHistorySlice.frames) == 10
+    with pytest.raises(KeyError):
+        before.get_state(_LazyHistorySlice.frames)
+    assert _LOADS == ["history"]
+
+    rd.create_store(_LazyStore(camera=_LazyCameraSlice()), recreate=True)
+    assert loaded.get_state(_LazyHistorySlice.frames) == 10
+    with pytest.raises(KeyError):
+        rd.snapshot().get_state(_LazyHistorySlice.frames)
+
+
+def test_invalid_lazy_slice(tmp_path: Path) -> None:
+    """Test that lazy slices check their source and what it loads."""
+    with pytest.raises(TypeError):
+        rd.lazy(42)  # type: ignore[arg-type]
+    with pytest.raises(ValueError):
+        rd.lazy(_load_history, evict_after=-1)
+
+    class _WrongLazyStore(rd.Store):
+        camera: _LazyCameraSlice
+        history: _LazyHistorySlice = rd.lazy(_LazyCameraSlice)
+
+    rd.create_store(_WrongLazyStore(camera=_LazyCameraSlice()), recreate=True)
+    with pytest.raises(TypeError):
+        rd.get_slice(_LazyHistorySlice)
@@ -0,0 +1,127 @@
+"""This module contains tests for redux.listener, async effects of state changes."""
+
+# Unused argument fixtures
+# pylint: disable=W0613
+
+from __future__ import annotations
+
+import asyncio
+import threading
+
+import pytest
+
+import redux as rd
+
+
+class _ListenRoiSlice(rd.Slice):
+    roi: int
+    label: str = ""
+
+
+class _ListenStore(rd.Store):
+    roi: _ListenRoiSlice
+
+
+@pytest.fixture()
+def _store_with_roi() -> None:
+    rd.create_store(_ListenStore(roi=_ListenRoiSlice(roi=0)), recreate=True)
+
+
+class _FakeClockLoop(asyncio.SelectorEventLoop):
+    """Event loop whose clock only moves forward when the test advances it."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.now = 0.0
+
+    def time(self) -> float:
+        """Get the time set by the test."""
+        return self.now
+
+
+async def _idle() -> None:
+    """Let the loop run the callbacks and task steps ready to run, without waiting."""
+    for _ in range(10):
+        await asyncio.sleep(0)
+
+
+def _run_effects(policy: rd.listener.Policy, wait: float = 0.0) -> tuple[list, list]:
+    """Change the roi three times, half a second apart, and get the effects run.
+
+    Each effect takes a second. The clock of the loop is advanced by the test, so the
+    results do not depend on how fast the machine runs.
+    """
+    started: list[int] = []
+    finished: list[int] = []
+
+    async def main() -> None:
+        loop = asyncio.get_running_loop()
+        assert isinstance(loop, _FakeClockLoop)
+
+        async def reprocess(roi: int) -> None:
+            started.append(roi)
+            await asyncio.sleep(1)
+            finished.append(roi)
+
+        stop = rd.listen(_ListenRoiSlice.roi, policy=policy, wait=wait)(reprocess)
+        for roi in (1, 2, 3):
+            rd.dispatch_state(_ListenRoiSlice.roi, roi)
+            await _idle()
+            loop.now += 0.5
+            await _idle()
+        # a debounced effect starts once the wait is over, then takes its second
+        for step in (wait, 1):
+            loop.now += step
+            await _idle()
+        stop()
+
+    with asyncio.Runner(loop_factory=_FakeClockLoop) as runner:
+        runner.run(main())
+    return started, finished
+
+
+def test_listen_policies(_store_with_roi) -> None:
+    """Test that stale effects are cancelled, or not started when debounced."""
+    assert _run_effects("take_latest") == ([1, 2, 3], [3])
+    assert _run_effects("take_every") == ([1, 2, 3], [1, 2, 3])
+    assert _run_effects("debounce", wait=2) == ([3], [3])
+    with pytest.raises(ValueError):
+        rd.listen(_ListenRoiSlice.roi, policy="take_first")  # type: ignore[arg-type]
+
+
+def test_listen_predicate(_store_with_roi) -> None:
+    """Test predicates, dispatches from other threads and stopping to listen."""
+    labels: list[str] = []
+    cancelled = []
+
+    async def main() -> None:
+        @rd.listen(lambda piece, changed: "label" in changed and piece.label != "")
+        async def log_label(piece: _ListenRoiSlice) -> None:
+            labels.append(piece.label)
+
+        async def wait_forever(_: int) -> None:
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled.append(True)
+                raise
+
+        stop = rd.listen(_ListenRoiSlice.roi)(wait_forever)
+        worker = threading.Thread(
+            target=lambda: rd.dispatch_state(_ListenRoiSlice.label, "from thread")
+        )
+        worker.start()
+        worker.join()
+        rd.dispatch_state(_ListenRoiSlice.roi, 5)
+        rd.dispatch_state(_ListenRoiSlice.label, "")
+        await _idle()
+        stop()
+        await _idle()
+
+    asyncio.run(main())
+    assert labels == ["from thread"]
+    assert cancelled == [True]
+    loop = asyncio.new_event_loop()
+    with pytest.raises(TypeError):
+        rd.listen(_ListenRoiSlice.roi, loop=loop)(print)
+    loop.close()
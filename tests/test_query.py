@@ -0,0 +1,241 @@
+"""This module contains tests for redux.query, cached data fetching."""
+
+# Redefining name from outer scope (fixtures)
+# pylint: disable=W0621
+
+from __future__ import annotations
+
+import asyncio
+import threading
+from collections.abc import Iterator
+from concurrent.futures import TimeoutError as FuturesTimeoutError
+
+import pytest
+
+import redux as rd
+
+
+class _QueryCameraSlice(rd.Slice):
+    exposure: float
+
+
+class _QueryStore(rd.Store):
+    camera: _QueryCameraSlice
+
+
+class _FakeBackend:
+    """Device metadata server counting requests, which can hold them until released."""
+
+    def __init__(self) -> None:
+        self.requests: list[str] = []
+        self.requested = threading.Event()
+        self.release = threading.Event()
+        self.release.set()
+        self.offline = False
+
+    def get(self, serial: str) -> dict[str, str]:
+        """get the metadata of a device once the request is released"""
+        self.requests.append(serial)
+        self.requested.set()
+        self.release.wait(5)
+        if self.offline:
+            raise ConnectionError(f"device {serial} is offline")
+        return {"serial": serial, "model": f"model-{len(self.requests)}"}
+
+    async def get_async(self, serial: str) -> dict[str, str]:
+        """get the metadata of a device without blocking"""
+        self.requests.append(serial)
+        await asyncio.sleep(0.01)
+        return {"serial": serial, "model": f"model-{len(self.requests)}"}
+
+    async def get_forever(self, serial: str) -> dict[str, str]:
+        """get the metadata of a device that never answers"""
+        self.requests.append(serial)
+        await asyncio.Event().wait()
+        raise AssertionError("unreachable")
+
+
+@pytest.fixture()
+def backend() -> Iterator[_FakeBackend]:
+    """Create the store and a backend serving every request by default."""
+    rd.create_store(_QueryStore(camera=_QueryCameraSlice(exposure=0.1)), recreate=True)
+    fake_backend = _FakeBackend()
+    yield fake_backend
+    fake_backend.release.set()
+
+
+def test_query_deduplicates(backend: _FakeBackend) -> None:
+    """Test that widgets asking at once share one fetch and then reuse its result."""
+    queries = rd.QueryCache(ttl=60)
+    metadata = queries.endpoint(backend.get, name="metadata")
+    backend.release.clear()
+    results: list[dict[str, str]] = []
+    widgets = [
+        threading.Thread(target=lambda: results.append(metadata.query("SN1")))
+        for _ in range(5)
+    ]
+    for widget in widgets:
+        widget.start()
+    assert backend.requested.wait(5)
+    assert metadata.result("SN1") == rd.QueryResult("pending")
+    backend.release.set()
+    for widget in widgets:
+        widget.join()
+
+    assert backend.requests == ["SN1"]
+    assert results == [{"serial": "SN1", "model": "model-1"}] * 5
+    assert metadata.query("SN1") is results[0]
+    result = rd.get_state(rd.QuerySlice.results)["metadata('SN1')"]
+    assert result.status == "fulfilled" and result.data is results[0]
+    assert backend.requests == ["SN1"]
+
+
+def _finish(queries: rd.QueryCache, backend: _FakeBackend, key: str) -> BaseException | None:
+    """Let the fetch of a query held by the backend finish, and get its exception."""
+    future = queries._in_flight[key]  # pylint: disable=W0212
+    backend.release.set()
+    error = future.exception(5)
+    backend.release.clear()
+    return error
+
+
+def test_query_expiry_and_eviction(backend: _FakeBackend) -> None:
+    """Test refetching expired or invalidated data, failures and evicting unused queries."""
+    queries = rd.QueryCache(ttl=60, keep_unused_for=0)
+    metadata = queries.endpoint(backend.get, name="metadata")
+    backend.release.clear()
+
+    with metadata.subscribe("SN1") as subscription:
+        assert subscription.result == rd.QueryResult("pending")
+        assert _finish(queries, backend, subscription.key) is None
+        assert subscription.result.data == {"serial": "SN1", "model": "model-1"}
+        assert not queries.refetch_stale()
+        assert not queries.evict()
+
+        backend.offline = True
+        metadata.invalidate("SN1")
+        assert isinstance(_finish(queries, backend, subscription.key), ConnectionError)
+        # the last data is kept with the error
+        assert subscription.result == rd.QueryResult(
+            "rejected",
+            {"serial": "SN1", "model": "model-1"},
+            "device SN1 is offline",
+            subscription.result.fetched_at,
+        )
+        backend.offline = False
+        assert queries.refetch_stale() == ["metadata('SN1')"]
+        assert _finish(queries, backend, subscription.key) is None
+        assert subscription.result.data == {"serial": "SN1", "model": "model-3"}
+    assert backend.requests == ["SN1"] * 3
+
+    backend.release.set()
+    backend.offline = True
+    with pytest.raises(ConnectionError):
+        metadata.query("SN2")
+    assert metadata.result("SN2").status == "rejected"
+    backend.offline = False
+    assert sorted(queries.evict()) == ["metadata('SN1')", "metadata('SN2')"]
+    assert rd.get_state(rd.QuerySlice.results) == {}
+
+    short_lived = queries.endpoint(backend.get, name="short_lived", ttl=0)
+    first = short_lived.query("SN3")
+    backend.release.clear()
+    # expired data is returned while it is fetched again in the background
+    assert short_lived.query("SN3") is first
+    assert _finish(queries, backend, "short_lived('SN3')") is None
+    assert short_lived.result("SN3").data == {"serial": "SN3", "model": "model-6"}
+
+
+def test_background_fetch_waits_for_dispatch(backend: _FakeBackend) -> None:
+    """Test that a background fetch commits once the dispatch in progress is done."""
+    queries = rd.QueryCache()
+    metadata = queries.endpoint(backend.get, name="metadata", ttl=0)
+    metadata.query("SN1")
+    backend.release.clear()
+    metadata.query("SN1")
+    fetch = queries._in_flight["metadata('SN1')"]  # pylint: disable=W0212
+    waited: list[bool] = []
+
+    def on_exposure(exposure: float) -> None:
+        if exposure == 2.0:
+            backend.release.set()
+            try:
+                fetch.exception(0.2)
+            except FuturesTimeoutError:
+                waited.append(True)
+            raise ValueError("rejected exposure")
+
+    rd.subscribe(_QueryCameraSlice.exposure)(on_exposure)
+    with pytest.raises(ValueError):
+        rd.dispatch_state(_QueryCameraSlice.exposure, 2.0)
+    assert fetch.exception(5) is None
+    assert waited == [True]
+    assert metadata.result("SN1") == rd.QueryResult(
+        "fulfilled",
+        {"serial": "SN1", "model": "model-2"},
+        None,
+        metadata.result("SN1").fetched_at,
+    )
+
+
+def test_async_endpoint_from_other_threads(backend: _FakeBackend) -> None:
+    """Test that async endpoints are fetched on the loop of the cache from any thread."""
+    with pytest.raises(RuntimeError):
+        rd.QueryCache().endpoint(backend.get_async).subscribe("SN1")
+
+    loop = asyncio.new_event_loop()
+    runner = threading.Thread(target=loop.run_forever)
+    runner.start()
+    try:
+        queries = rd.QueryCache(loop=loop)
+        metadata = queries.endpoint(backend.get_async, name="metadata")
+        with metadata.subscribe("SN1") as subscription:
+            fetch = queries._in_flight[subscription.key]  # pylint: disable=W0212
+            assert fetch.result(5) == {"serial": "SN1", "model": "model-1"}
+            metadata.invalidate("SN1")
+            fetch = queries._in_flight[subscription.key]  # pylint: disable=W0212
+            assert fetch.result(5) == {"serial": "SN1", "model": "model-2"}
+    finally:
+        loop.call_soon_threadsafe(loop.stop)
+        runner.join()
+        loop.close()
+
+
+def test_cancelled_async_fetch(backend: _FakeBackend) -> None:
+    """Test that cancelling an async fetch puts back the result it replaced."""
+    queries = rd.QueryCache()
+    metadata = queries.endpoint(backend.get_forever, name="metadata")
+
+    async def main() -> None:
+        waiter = asyncio.ensure_future(metadata.query_async("SN1"))
+        while not queries._tasks:  # pylint: disable=W0212
+            await asyncio.sleep(0)
+        assert metadata.result("SN1") == rd.QueryResult("pending")
+        for task in tuple(queries._tasks):  # pylint: disable=W0212
+            task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await waiter
+
+    asyncio.run(main())
+    assert metadata.result("SN1") is None
+    assert not queries._in_flight  # pylint: disable=W0212
+
+
+def test_query_async(backend: _FakeBackend) -> None:
+    """Test that async and sync endpoints are deduplicated from an event loop."""
+    queries = rd.QueryCache()
+    metadata = queries.endpoint(backend.get_async, name="metadata")
+    blocking_metadata = queries.endpoint(backend.get, name="blocking_metadata")
+
+    async def main() -> None:
+        results = await asyncio.gather(*(metadata.query_async("SN1") for _ in range(3)))
+        assert results == [{"serial": "SN1", "model": "model-1"}] * 3
+        results = await asyncio.gather(
+            *(blocking_metadata.query_async("SN1") for _ in range(3))
+        )
+        assert results == [{"serial": "SN1", "model": "model-2"}] * 3
+
+    asyncio.run(main())
+    assert backend.requests == ["SN1", "SN1"]
+    with pytest.raises(TypeError):
+        metadata.query("SN1")
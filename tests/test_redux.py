@@ -11,6 +11,10 @@
 
 from __future__ import annotations
 
+import asyncio
+import threading
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FuturesTimeoutError
 from typing import Annotated, Any, NamedTuple
 
 import pytest
@@ -108,6 +112,12 @@ class _ImgConfigSlice(rd.Slice):
     bg_enabled: bool
     roi: _Roi
 
+    @rd.computed("black_level", "white_level", "bit_depth")
+    def display_range(self) -> tuple[int, int]:
+        """pixel values displayed as black and white"""
+        max_value = 2**self.bit_depth - 1
+        return round(self.black_level * max_value), round(self.white_level * max_value)
+
     @rd.reduce
     def set_black_level(piece: _ImgConfigSlice, level: float) -> _ImgConfigSlice:
         """Reducer to update black level of display an image comm"""
@@ -277,6 +287,94 @@ class _Slice7(_Slice4, _Slice5, _Slice6):
 # endregion Slices
 
 
+# region PluginSlices
+
+
+class _PluginSlice(rd.Slice):
+    exposure_copy: float = 0.0
+    level: int = 0
+
+    @rd.extra_reduce(_ExposureSlice.exposure_in_s)
+    def follow_exposure(piece: _PluginSlice, exposure: float) -> _PluginSlice:
+        """extra reducer to copy the exposure of the camera"""
+        return piece.update([(_PluginSlice.exposure_copy, exposure)])
+
+
+class _PluginHostSlice(rd.Slice):
+    plugin_level: int = 0
+
+    @rd.extra_reduce(_PluginSlice.level)
+    def follow_plugin(piece: _PluginHostSlice, level: int) -> _PluginHostSlice:
+        """extra reducer to copy the level of the plugin"""
+        return piece.update([(_PluginHostSlice.plugin_level, level)])
+
+
+class _PluginGuardSlice(rd.Slice):
+    checked_level: int = 0
+
+    @rd.extra_reduce(_PluginSlice.level)
+    def check_level(piece: _PluginGuardSlice, level: int) -> _PluginGuardSlice:
+        """extra reducer that rejects levels above 12"""
+        if level > 12:
+            raise ValueError(f"level {level} above 12")
+        return piece.update([(_PluginGuardSlice.checked_level, level)])
+
+
+_MEMO_CALLS: list[str] = []
+
+
+class _MemoSlice(rd.Slice):
+    level: int = 0
+    exposure_copy: float = 0.0
+    tags: list[str] = []
+
+    @rd.reduce(memo=True)
+    def set_level(piece: _MemoSlice, level: int) -> _MemoSlice:
+        """set the level"""
+        _MEMO_CALLS.append("set_level")
+        return piece.update([(_MemoSlice.level, level)])
+
+    @rd.reduce(memo=True)
+    def set_tags(piece: _MemoSlice, tags: list[str]) -> _MemoSlice:
+        """set the tags"""
+        _MEMO_CALLS.append("set_tags")
+        return piece.update([(_MemoSlice.tags, tags)])
+
+    @rd.extra_reduce(_ExposureSlice.exposure_in_s, memo=True)
+    def follow_exposure(piece: _MemoSlice, exposure: float) -> _MemoSlice:
+        """extra reducer to copy the exposure of the camera"""
+        _MEMO_CALLS.append("follow_exposure")
+        return piece.update([(_MemoSlice.exposure_copy, exposure)])
+
+
+_OFFLOAD_GATE = threading.Event()
+
+
+class _HistogramSlice(rd.Slice):
+    bins: tuple[int, ...]
+
+    @rd.reduce(offload="process")
+    def add_samples(piece: _HistogramSlice, samples: list[int]) -> _HistogramSlice:
+        """offloaded reducer counting samples, once the gate is open"""
+        _OFFLOAD_GATE.wait(5)
+        bins = list(piece.bins)
+        for sample in samples:
+            bins[sample] += 1
+        return piece.update([(_HistogramSlice.bins, tuple(bins))])
+
+    @rd.reduce
+    def clear(piece: _HistogramSlice) -> _HistogramSlice:
+        """reset the counts"""
+        return piece.update([(_HistogramSlice.bins, (0,) * len(piece.bins))])
+
+
+class _HistogramStore(rd.Store):
+    histogram: _HistogramSlice
+
+
+# endregion PluginSlices
+
+
 # region Tests
 
 
@@ -359,6 +457,643 @@ def test_extra_reducer_init(_store_with_camera_img) -> None:
     assert rd.get_state(_ImgConfigSlice.bit_depth) == default_camera.bit_depth
 
 
+def test_create_store_without_notify() -> None:
+    """Test that create_store can skip notifying the initial state."""
+
+    class _CameraImgStore(rd.Store):
+        camera: _CameraSlice
+        img_config: _ImgConfigSlice
+
+    camera = _CameraSlice.get_default_slice()
+    img_config = _ImgConfigSlice.get_default_slice()
+    rd.create_store(
+        _CameraImgStore(camera=camera, img_config=img_config), recreate=True, notify=False
+    )
+    assert camera.bit_depth != img_config.bit_depth
+    assert rd.get_state(_ImgConfigSlice.bit_depth) == img_config.bit_depth
+
+    rd.dispatch_state(_CameraSlice.bit_depth, 12)
+    assert rd.get_state(_ImgConfigSlice.bit_depth) == 12
+
+
+def test_recreate_store_keeps_extra_reducers() -> None:
+    """Test that extra reducers are registered once after recreating the store."""
+
+    class _CameraImgStore(rd.Store):
+        camera: _CameraSlice
+        img_config: _ImgConfigExtra
+
+    for _ in range(3):
+        rd.create_store(
+            _CameraImgStore(
+                camera=_CameraSlice.get_default_slice(),
+                img_config=_ImgConfigExtra.get_default_slice(),
+            ),
+            recreate=True,
+        )
+    bit_depths: list[int] = []
+    rd.subscribe(_ImgConfigSlice.bit_depth)(bit_depths.append)
+    rd.dispatch_state(_CameraSlice.bit_depth, 12)
+    assert rd.get_state(_ImgConfigSlice.bit_depth) == 12
+    assert bit_depths == [16, 12]
+
+
+@pytest.fixture()
+def _store_with_plugin_host() -> None:
+    class _PluginHostStore(rd.Store):
+        camera: _CameraSlice
+        host: _PluginHostSlice
+
+    store = _PluginHostStore(
+        camera=_CameraSlice.get_default_slice(), host=_PluginHostSlice(plugin_level=0)
+    )
+    rd.create_store(store, recreate=True)
+
+
+def test_inject_slice(_store_with_plugin_host) -> None:
+    """Test that an injected slice is wired to the extra reducers of the store."""
+    levels: list[int] = []
+    rd.subscribe(_PluginHostSlice.plugin_level)(levels.append)
+
+    rd.inject_slice(_PluginSlice(exposure_copy=0.0, level=3), name="plugin")
+    assert rd.get_state(_PluginSlice.exposure_copy) == 1.0
+    assert rd.get_state(_PluginHostSlice.plugin_level) == 3
+    assert levels == [0, 3]
+
+    rd.dispatch_state(_CameraSlice.exposure_in_s, 2.0)
+    assert rd.get_state(_PluginSlice.exposure_copy) == 2.0
+    rd.dispatch_state(_PluginSlice.level, 4)
+    assert levels == [0, 3, 4]
+
+    with pytest.raises(ValueError):
+        rd.inject_slice(_PluginSlice(exposure_copy=0.0, level=0))
+    assert "plugin" not in type(rd.get_store()).model_fields
+
+
+def test_remove_slice(_store_with_plugin_host) -> None:
+    """Test that a removed slice is unwired from the store."""
+    rd.inject_slice(_PluginSlice(exposure_copy=0.0, level=3))
+    exposures: list[float] = []
+    unsubscribe = rd.subscribe(_PluginSlice.exposure_copy)(exposures.append)
+    rd.subscribe(_PluginSlice.level, priority="critical")(lambda _: None)
+    rd.subscribe_slice(_PluginSlice, priority="critical")(lambda *_: None)
+
+    rd.remove_slice(_PluginSlice)
+    assert not rd.priority._CRITICAL_ENTRIES  # pylint: disable=W0212
+    with pytest.raises(KeyError):
+        rd.get_state(_PluginSlice.level)
+    rd.dispatch_state(_CameraSlice.exposure_in_s, 2.0)
+    assert exposures == [1.0]
+    unsubscribe()
+
+    rd.inject_slice(_PluginSlice(exposure_copy=0.0, level=5))
+    assert rd.get_state(_PluginSlice.exposure_copy) == 2.0
+    assert rd.get_state(_PluginHostSlice.plugin_level) == 5
+
+    with pytest.raises(ValueError):
+        rd.remove_slice(_CameraSlice)
+    with pytest.raises(KeyError):
+        rd.remove_slice(_ImgConfigSlice)
+
+
+def test_computed_state_cache() -> None:
+    """Test that computed states are cached and carried over by update."""
+    img_config = _ImgConfigSlice.get_default_slice()
+    display_range = img_config.display_range
+    assert display_range == (0, 255)
+    assert img_config.display_range is display_range
+    assert _ImgConfigSlice.display_range == rd.build_path("_ImgConfigSlice", "display_range")
+    assert "display_range" not in img_config.model_dump()
+
+    moved = img_config.update([(_ImgConfigSlice.x, 10.0)])
+    assert moved.display_range is display_range
+    unchanged = img_config.update([(_ImgConfigSlice.bit_depth, 8)])
+    assert unchanged.display_range is display_range
+    deeper = img_config.update([(_ImgConfigSlice.bit_depth, 16)])
+    assert deeper.display_range == (0, 65535)
+    assert img_config.display_range == (0, 255)
+
+
+def test_invalid_computed_state() -> None:
+    """Test that computed states must depend on states of their slice."""
+    with pytest.raises(TypeError):
+
+        class _InvalidComputedSlice(rd.Slice):
+            value: int
+
+            @rd.computed("wrong_state")
+            def doubled(self) -> int:
+                """double of the value"""
+                return self.value * 2
+
+
+def test_update_computed_state(_store_with_camera_img) -> None:
+    """Test that computed states cannot be written like states."""
+    with pytest.raises(TypeError):
+        _ImgConfigSlice.get_default_slice().update([(_ImgConfigSlice.display_range, (0, 1))])
+    with pytest.raises(TypeError):
+        rd.dispatch_state(_ImgConfigSlice.display_range, (0, 1))
+    assert rd.get_state(_ImgConfigSlice.display_range) == (0, 32768)
+
+
+def test_subscribe_computed_state(_store_with_camera_img) -> None:
+    """Test that subscribers of a computed state are notified when its value changes."""
+    display_ranges: list[tuple[int, int]] = []
+    rd.subscribe(_ImgConfigSlice.display_range)(display_ranges.append)
+    assert rd.get_state(_ImgConfigSlice.display_range) == (0, 32768)
+
+    rd.dispatch_state(_ImgConfigSlice.x, 1.0)
+    rd.dispatch(_ImgConfigSlice.set_black_level, 0.5)
+    rd.dispatch_state(_CameraSlice.bit_depth, 8)
+    assert display_ranges == [(0, 32768), (32768, 32768), (128, 128)]
+
+
+def test_diff(_store_with_camera_img) -> None:
+    """Test that diff returns the states that changed between two snapshots."""
+    old_store = rd.get_store()
+    assert not rd.diff(old_store, rd.get_store())
+
+    rd.dispatch_state(_CameraSlice.exposure_in_s, 2.0)
+    rd.dispatch_state(_CameraSlice.owner, "owner_2")
+    rd.dispatch_state(_CameraSlice.owner, "owner_1")
+    assert rd.diff(old_store, rd.get_store()) == [
+        rd.StateChange("_CameraSlice", "exposure_in_s", 1.0, 2.0),
+        rd.StateChange("_ImgConfigSlice", "bg_enabled", True, False),
+    ]
+
+
+def test_changes_since(_store_with_camera_img) -> None:
+    """Test that changes_since merges the changes made since a revision."""
+    revision = rd.get_revision()
+    assert not rd.changes_since(revision)
+
+    rd.dispatch_state(_CameraSlice.owner, "owner_2")
+    middle_revision = rd.get_revision()
+    assert middle_revision == revision + 1
+    rd.dispatch_state(_CameraSlice.owner, "owner_3")
+    rd.dispatch_state(_ImgConfigSlice.x, 1.0)
+    rd.dispatch_state(_ImgConfigSlice.x, 0.0)
+    assert rd.changes_since(revision) == [
+        rd.StateChange("_CameraSlice", "owner", "owner_1", "owner_3"),
+    ]
+    assert rd.changes_since(middle_revision) == [
+        rd.StateChange("_CameraSlice", "owner", "owner_2", "owner_3"),
+    ]
+
+    rd.set_change_log_size(2)
+    revision = rd.get_revision()
+    rd.dispatch_state(_ImgConfigSlice.x, 1.0)
+    rd.dispatch_state(_ImgConfigSlice.y, 1.0)
+    assert len(rd.changes_since(revision)) == 2
+    rd.dispatch_state(_ImgConfigSlice.rotation, 1.0)
+    with pytest.raises(ValueError):
+        rd.changes_since(revision)
+    rd.set_change_log_size(1024)
+
+
+def test_accessor_and_setter(_store_with_camera_img) -> None:
+    """Test that accessors and setters read and dispatch like get_state and dispatch."""
+    get_bit_depth = rd.accessor(_BitDepthSlice.bit_depth)
+    get_img_bit_depth = rd.accessor(_ImgConfigSlice.bit_depth)
+    set_bit_depth = rd.setter(_CameraSlice.bit_depth)
+    set_exposure = rd.setter(_ExposureSlice.set_exposure)
+    increment_exposure = rd.setter(_CameraSlice.increment_exposure)
+
+    bit_depths: list[int] = []
+    rd.subscribe(_ImgConfigSlice.bit_depth)(bit_depths.append)
+    set_bit_depth(12)
+    assert get_bit_depth() == 12
+    assert get_img_bit_depth() == 12
+    assert bit_depths == [16, 12]
+
+    set_exposure(5.0)
+    increment_exposure()
+    assert rd.get_state(_CameraSlice.exposure_in_s) == 6.0
+
+    with pytest.raises(KeyError):
+        rd.accessor(rd.build_path("_CameraSlice", "wrong_state"))()
+
+
+def test_accessor_invalidated_by_recreate(_store_with_camera_img) -> None:
+    """Test that accessors and setters follow the store when it is recreated."""
+    get_bit_depth = rd.accessor(_ImgConfigSlice.bit_depth)
+    set_black_level = rd.setter(_ImgConfigSlice.black_level)
+    assert get_bit_depth() == 16
+
+    class _ImgStore(rd.Store):
+        img_config: _ImgConfigExtra
+
+    rd.create_store(_ImgStore(img_config=_ImgConfigExtra.get_default_slice()), recreate=True)
+    assert get_bit_depth() == 8
+    set_black_level(0.5)
+    assert rd.get_state(_ImgConfigExtra.black_level) == 0.5
+
+
+@pytest.fixture()
+def _store_run_to_completion() -> None:
+    class _RunToCompletionStore(rd.Store):
+        camera: _CameraSlice
+        host: _PluginHostSlice
+
+    store = _RunToCompletionStore(
+        camera=_CameraSlice.get_default_slice(), host=_PluginHostSlice(plugin_level=0)
+    )
+    rd.create_store(store, recreate=True, run_to_completion=True)
+
+
+def test_run_to_completion_reads(_store_run_to_completion) -> None:
+    """Test that subscribers read the state they are notified of in run-to-completion mode."""
+    reads: list[tuple[int, int]] = []
+    rd.subscribe(_CameraSlice.bit_depth)(
+        lambda bit_depth: reads.append((bit_depth, rd.get_state(_CameraSlice.bit_depth)))
+    )
+    rd.dispatch_state(_CameraSlice.bit_depth, 12)
+    assert reads == [(16, 16), (12, 12)]
+
+
+def test_run_to_completion_order(_store_run_to_completion) -> None:
+    """Test that dispatches made by subscribers run in order after the current one."""
+    events: list[str] = []
+
+    def on_level(level: int) -> None:
+        events.append(f"level {level}")
+        if level == 1:
+            rd.dispatch_state(_CameraSlice.bit_depth, 10)
+            rd.dispatch_state(_CameraSlice.exposure_in_s, 3.0)
+            events.append("dispatched")
+
+    rd.inject_slice(_PluginSlice(exposure_copy=0.0, level=0))
+    rd.subscribe(_PluginSlice.level)(on_level)
+    rd.subscribe(_CameraSlice.bit_depth)(lambda bit_depth: events.append(f"bit {bit_depth}"))
+    rd.subscribe(_PluginSlice.exposure_copy)(lambda exposure: events.append(f"exp {exposure}"))
+    events.clear()
+
+    rd.dispatch_state(_PluginSlice.level, 1)
+    assert events == ["level 1", "dispatched", "bit 10", "exp 3.0"]
+    assert rd.get_state(_PluginHostSlice.plugin_level) == 1
+
+
+def test_run_to_completion_long_cascade(_store_run_to_completion) -> None:
+    """Test that long cascades of dispatches do not grow the stack."""
+    rd.inject_slice(_PluginSlice(exposure_copy=0.0, level=0))
+
+    def on_level(level: int) -> None:
+        if 0 < level < 5000:
+            rd.dispatch_state(_PluginSlice.level, level + 1)
+
+    rd.subscribe(_PluginSlice.level)(on_level)
+    rd.dispatch_state(_PluginSlice.level, 1)
+    assert rd.get_state(_PluginSlice.level) == 5000
+    assert rd.get_state(_PluginHostSlice.plugin_level) == 5000
+
+
+def test_run_to_completion_rollback(_store_run_to_completion) -> None:
+    """Test that a failing queued dispatch rolls back the dispatch that queued it."""
+    rd.inject_slice(_PluginSlice(exposure_copy=0.0, level=0))
+    rd.inject_slice(_PluginGuardSlice(checked_level=0))
+    levels: list[int] = []
+    rd.subscribe(_PluginSlice.level)(levels.append)
+    revision = rd.get_revision()
+
+    with pytest.raises(ValueError):
+        rd.dispatch_state(_PluginSlice.level, 13)
+    assert rd.get_state(_PluginSlice.level) == 0
+    assert rd.get_state(_PluginHostSlice.plugin_level) == 0
+    assert levels == [0, 13, 0]
+    assert not rd.changes_since(revision)
+    assert rd.snapshot().get_state(_PluginSlice.level) == 0
+
+    rd.dispatch_state(_PluginSlice.level, 12)
+    assert rd.get_state(_PluginHostSlice.plugin_level) == 12
+
+
+def test_run_to_completion_rollback_slice_subscribers(_store_run_to_completion) -> None:
+    """Test that a rollback only notifies the slice subscribers told of the failed value."""
+    calls: list[tuple[int, list[str]]] = []
+    rd.subscribe(_CameraSlice.bit_depth)(_fail_on_bit_depth_12)
+    rd.subscribe_slice(_CameraSlice)(
+        lambda camera, changed: calls.append((camera.bit_depth, sorted(changed)))
+    )
+    calls.clear()
+
+    with pytest.raises(ValueError):
+        rd.dispatch_state(_CameraSlice.bit_depth, 12)
+    assert rd.get_state(_CameraSlice.bit_depth) == 16
+    assert not calls
+
+    def on_camera(camera: _CameraSlice, _changed: frozenset[str]) -> None:
+        if camera.bit_depth == 10:
+            rd.dispatch_state(_CameraSlice.bit_depth, 12)
+
+    rd.subscribe_slice(_CameraSlice)(on_camera)
+    with pytest.raises(ValueError):
+        rd.dispatch_state(_CameraSlice.bit_depth, 10)
+    assert rd.get_state(_CameraSlice.bit_depth) == 16
+    assert calls == [(10, ["bit_depth"]), (16, ["bit_depth"])]
+
+
+def test_run_to_completion_drops_queue(_store_run_to_completion) -> None:
+    """Test that the dispatches still queued when one fails are dropped, not run later."""
+    rd.inject_slice(_PluginSlice(exposure_copy=0.0, level=0))
+    rd.inject_slice(_PluginGuardSlice(checked_level=0))
+    bit_depths: list[int] = []
+    rd.subscribe(_CameraSlice.bit_depth)(bit_depths.append)
+
+    def on_level(level: int) -> None:
+        if level:
+            rd.dispatch_state(_CameraSlice.bit_depth, level)
+
+    rd.subscribe(_PluginSlice.level)(on_level)
+    with pytest.raises(ValueError):
+        rd.dispatch_state(_PluginSlice.level, 13)
+    assert bit_depths == [16]
+    assert rd.get_state(_CameraSlice.bit_depth) == 16
+
+    rd.dispatch_state(_CameraSlice.exposure_in_s, 2.0)
+    assert bit_depths == [16]
+    rd.dispatch_state(_PluginSlice.level, 12)
+    assert bit_depths == [16, 12]
+
+
+def _fail_on_bit_depth_12(bit_depth: int) -> None:
+    if bit_depth == 12:
+        raise ValueError("unsupported bit depth")
+
+
+def test_rollback_notifies_only_reverted_states(_store_with_camera_img) -> None:
+    """Test that a failed dispatch is rolled back without notifying unchanged states."""
+    exposures: list[float] = []
+    camera_bit_depths: list[int] = []
+    img_bit_depths: list[int] = []
+    rd.subscribe(_CameraSlice.exposure_in_s)(exposures.append)
+    rd.subscribe(_ImgConfigSlice.bit_depth)(img_bit_depths.append)
+    rd.subscribe(_CameraSlice.bit_depth)(camera_bit_depths.append)
+    rd.subscribe(_CameraSlice.bit_depth)(_fail_on_bit_depth_12)
+    revision = rd.get_revision()
+
+    with pytest.raises(ValueError):
+        rd.dispatch_state(_CameraSlice.bit_depth, 12)
+    assert rd.get_state(_CameraSlice.bit_depth) == 16
+    assert rd.get_state(_ImgConfigSlice.bit_depth) == 16
+    assert exposures == [1.0]
+    assert camera_bit_depths == [16, 12, 16]
+    assert img_bit_depths == [16, 12, 16]
+    # the extra reducer committed the image config and the rollback reverted it
+    assert rd.get_revision() == revision + 2
+    assert not rd.changes_since(revision)
+
+
+def test_rollback_to_savepoint(_store_with_camera_img) -> None:
+    """Test that a failed dispatch made by a subscriber only undoes its own changes."""
+    errors: list[Exception] = []
+
+    def set_bit_depth_on_exposure(exposure: float) -> None:
+        if exposure == 2.0:
+            try:
+                rd.dispatch_state(_CameraSlice.bit_depth, 12)
+            except ValueError as e:
+                errors.append(e)
+
+    rd.subscribe(_CameraSlice.bit_depth)(_fail_on_bit_depth_12)
+    rd.subscribe(_CameraSlice.exposure_in_s)(set_bit_depth_on_exposure)
+    rd.dispatch_state(_CameraSlice.exposure_in_s, 2.0)
+    assert len(errors) == 1
+    assert rd.get_state(_CameraSlice.exposure_in_s) == 2.0
+    assert rd.get_state(_CameraSlice.bit_depth) == 16
+    assert rd.get_state(_ImgConfigSlice.bit_depth) == 16
+
+
+def test_memoized_reducers(_store_with_camera) -> None:
+    """Test that memoized reducers skip repeated dispatches with the same payload."""
+    rd.inject_slice(_MemoSlice(level=0, exposure_copy=0.0, tags=[]))
+    levels: list[int] = []
+    rd.subscribe(_MemoSlice.level)(levels.append)
+    _MEMO_CALLS.clear()
+    revision = rd.get_revision()
+
+    rd.dispatch(_MemoSlice.set_level, 3)
+    # runs on the new slice and finds nothing to commit
+    rd.dispatch(_MemoSlice.set_level, 3)
+    rd.dispatch(_MemoSlice.set_level, 3)
+    rd.setter(_MemoSlice.set_level)(3)
+    assert _MEMO_CALLS == ["set_level", "set_level"]
+    assert levels == [0, 3]
+    assert rd.get_revision() == revision + 1
+
+    # equal payloads of another type are not reused
+    rd.dispatch(_MemoSlice.set_level, 3.0)
+    assert _MEMO_CALLS == ["set_level"] * 3
+
+    # unhashable payloads are not memoized
+    rd.dispatch(_MemoSlice.set_tags, ["a"])
+    rd.dispatch(_MemoSlice.set_tags, ["a"])
+    assert _MEMO_CALLS.count("set_tags") == 2
+
+    _MEMO_CALLS.clear()
+    for _ in range(3):
+        rd.force_notify([_CameraSlice.exposure_in_s])
+    assert _MEMO_CALLS == ["follow_exposure"]
+    rd.dispatch_state(_CameraSlice.exposure_in_s, 2.0)
+    assert _MEMO_CALLS == ["follow_exposure"] * 2
+    assert rd.get_state(_MemoSlice.exposure_copy) == 2.0
+
+
+def test_dispatch_stream(_store_with_camera) -> None:
+    """Test that streamed payloads are committed and notified once per batch."""
+    exposures: list[float] = []
+    rd.subscribe(_CameraSlice.exposure_in_s)(exposures.append)
+    revision = rd.get_revision()
+
+    rd.dispatch_stream(
+        _CameraSlice.set_exposure, (float(i) for i in range(2, 9)), flush_every=3
+    )
+    assert exposures == [1.0, 4.0, 7.0, 8.0]
+    assert rd.get_revision() == revision + 3
+
+    async def samples():
+        for i in range(10, 15):
+            await asyncio.sleep(0)
+            yield float(i)
+
+    asyncio.run(rd.dispatch_stream(_CameraSlice.set_exposure, samples()))
+    assert exposures == [1.0, 4.0, 7.0, 8.0, 14.0]
+
+    # a failing batch is not committed, the previous batches are kept
+    with pytest.raises(TypeError):
+        rd.dispatch_stream(_CameraSlice.set_exposure, [20.0, 21.0, "22"], flush_every=2)
+    assert rd.get_state(_CameraSlice.exposure_in_s) == 21.0
+    with pytest.raises(ValueError):
+        rd.dispatch_stream(_CameraSlice.set_exposure, [], flush_every=0)
+
+
+def test_offloaded_reducers() -> None:
+    """Test that offloaded results commit in order and stale ones are discarded."""
+    rd.create_store(_HistogramStore(histogram=_HistogramSlice(bins=(0,) * 4)), recreate=True)
+    totals: list[int] = []
+    rd.subscribe(_HistogramSlice.bins)(lambda bins: totals.append(sum(bins)))
+
+    with ThreadPoolExecutor(2) as executor:
+        rd.set_offload_executor(executor)
+        _OFFLOAD_GATE.clear()
+        first = rd.dispatch(_HistogramSlice.add_samples, [0, 1])
+        second = rd.dispatch(_HistogramSlice.add_samples, [2])
+        assert first is not None and second is not None
+        assert rd.get_state(_HistogramSlice.bins) == (0, 0, 0, 0)
+        _OFFLOAD_GATE.set()
+        assert second.result(5) and first.result(5)
+        assert rd.get_state(_HistogramSlice.bins) == (1, 1, 1, 0)
+        assert totals == [0, 2, 3]
+
+        # the slice changed while the reducer ran, so its result is discarded
+        _OFFLOAD_GATE.clear()
+        stale = rd.dispatch(_HistogramSlice.add_samples, [3])
+        assert stale is not None
+        rd.dispatch(_HistogramSlice.clear)
+        _OFFLOAD_GATE.set()
+        assert stale.result(5) is False
+        assert rd.get_state(_HistogramSlice.bins) == (0, 0, 0, 0)
+        failed = rd.dispatch(_HistogramSlice.add_samples, [4])
+        assert failed is not None and isinstance(failed.exception(5), IndexError)
+
+    with ProcessPoolExecutor(1) as executor:
+        rd.set_offload_executor(executor)
+        done = rd.dispatch(_HistogramSlice.add_samples, [3, 3])
+        assert done is not None and done.result(30)
+    rd.set_offload_executor()
+    assert rd.get_state(_HistogramSlice.bins) == (0, 0, 0, 2)
+    assert totals == [0, 2, 3, 0, 2]
+    with pytest.raises(ValueError):
+        rd.reduce(offload="thread")
+
+
+def test_offloaded_commit_waits_for_dispatch() -> None:
+    """Test that a result committed from the executor waits for the dispatch in progress."""
+    rd.create_store(_HistogramStore(histogram=_HistogramSlice(bins=(0,) * 4)), recreate=True)
+    waited: list[bool] = []
+
+    def on_bins(bins: tuple[int, ...]) -> None:
+        if bins == (9,) * 4:
+            _OFFLOAD_GATE.set()
+            try:
+                pending.result(0.2)
+            except FuturesTimeoutError:
+                waited.append(True)
+            raise ValueError("rejected bins")
+
+    with ThreadPoolExecutor(1) as executor:
+        rd.set_offload_executor(executor)
+        _OFFLOAD_GATE.clear()
+        pending = rd.dispatch(_HistogramSlice.add_samples, [1])
+        assert pending is not None
+        rd.subscribe(_HistogramSlice.bins)(on_bins)
+        with pytest.raises(ValueError):
+            rd.dispatch_state(_HistogramSlice.bins, (9,) * 4)
+        assert pending.result(5)
+    rd.set_offload_executor()
+    assert waited == [True]
+    assert rd.get_state(_HistogramSlice.bins) == (0, 1, 0, 0)
+
+
+def test_subscription_priorities(_store_with_camera_img) -> None:
+    """Test that critical subscribers are called first and idle ones are coalesced."""
+    calls: list[tuple[str, Any]] = []
+    rd.subscribe(_CameraSlice.exposure_in_s)(lambda value: calls.append(("log", value)))
+    rd.subscribe(_CameraSlice.exposure_in_s, priority="idle")(
+        lambda value: calls.append(("plot", value))
+    )
+    rd.subscribe(_CameraSlice.exposure_in_s, priority="critical")(
+        lambda value: calls.append(("safety", value))
+    )
+    rd.subscribe_slice(_ImgConfigSlice, priority="idle")(
+        lambda piece, changed: calls.append(("render", sorted(changed)))
+    )
+    scheduled: list[Any] = []
+    rd.set_idle_scheduler(scheduled.append)
+    calls.clear()
+
+    rd.dispatch_state(_CameraSlice.exposure_in_s, 2.0)
+    rd.dispatch_state(_CameraSlice.exposure_in_s, 3.0)
+    rd.dispatch(_ImgConfigSlice.set_black_level, 0.5)
+    rd.set_idle_scheduler(None)
+    assert calls == [("safety", 2.0), ("log", 2.0), ("safety", 3.0), ("log", 3.0)]
+    assert scheduled == [rd.drain_notifications]
+    calls.clear()
+
+    assert rd.drain_notifications() == 2
+    # the extra reducer following the exposure notified the render first
+    assert calls == [("render", ["bg_enabled", "black_level"]), ("plot", 3.0)]
+    assert rd.drain_notifications() == 0
+    with pytest.raises(ValueError):
+        rd.subscribe(_CameraSlice.exposure_in_s, priority="urgent")
+
+
+def test_critical_subscribers_first(_store_with_camera_img) -> None:
+    """Test that critical subscribers of any state or of the slice are called first."""
+    calls: list[str] = []
+    rd.subscribe(_CameraSlice.exposure_in_s)(lambda _: calls.append("exposure"))
+    rd.subscribe_slice(_CameraSlice)(lambda *_: calls.append("camera"))
+    rd.subscribe(_CameraSlice.bit_depth, priority="critical")(
+        lambda _: calls.append("bit_depth")
+    )
+    rd.subscribe_slice(_CameraSlice, priority="critical")(
+        lambda *_: calls.append("critical camera")
+    )
+    rd.subscribe(_CameraSlice.exposure_in_s, once_per_dispatch=True, priority="critical")(
+        lambda _: calls.append("critical exposure")
+    )
+    calls.clear()
+
+    rd.dispatch_slice(
+        rd.get_slice(_CameraSlice).update(
+            [(_CameraSlice.exposure_in_s, 2.0), (_CameraSlice.bit_depth, 12)]
+        )
+    )
+    assert calls[:3] == ["bit_depth", "critical camera", "critical exposure"]
+    assert sorted(calls[3:]) == ["camera", "exposure"]
+
+
+def test_subscribe_slice(_store_with_camera_img) -> None:
+    """Test that slice subscribers are called once per dispatch with the changed states."""
+    img_changes: list[frozenset[str]] = []
+    bit_depth_changes: list[tuple[int, frozenset[str]]] = []
+    levels: list[tuple[float, float]] = []
+
+    rd.subscribe_slice(_ImgConfigSlice)(lambda _, changed: img_changes.append(changed))
+    unsubscribe = rd.subscribe_slice(_BitDepthSlice)(
+        lambda camera, changed: bit_depth_changes.append((camera.bit_depth, changed))
+    )
+    rd.subscribe(
+        _ImgConfigSlice.black_level, _ImgConfigSlice.display_range, once_per_dispatch=True
+    )(lambda black_level, display_range: levels.append((black_level, display_range[1])))
+    assert img_changes == [frozenset(_ImgConfigSlice.model_fields)]
+    assert bit_depth_changes == [(16, frozenset({"bit_depth"}))]
+    img_changes.clear()
+
+    rd.dispatch(_ImgConfigSlice.set_black_level, 0.5)
+    rd.dispatch_state(_CameraSlice.exposure_in_s, 2.0)
+    rd.dispatch_state(_CameraSlice.bit_depth, 12)
+    # the display range is subscribed to, so it is checked for changes
+    assert img_changes == [
+        frozenset({"black_level", "display_range"}),
+        frozenset({"bg_enabled"}),
+        frozenset({"bit_depth", "display_range"}),
+    ]
+    assert bit_depth_changes == [
+        (16, frozenset({"bit_depth"})),
+        (12, frozenset({"bit_depth"})),
+    ]
+    assert levels == [(0.0, 32768), (0.5, 32768), (0.5, 2048)]
+
+    unsubscribe()
+    rd.dispatch_state(_CameraSlice.bit_depth, 8)
+    rd.subscribe(_CameraSlice.bit_depth)(_fail_on_bit_depth_12)
+    with pytest.raises(ValueError):
+        rd.dispatch_state(_CameraSlice.bit_depth, 12)
+    assert len(bit_depth_changes) == 2
+    # the image config is notified when the failed dispatch changes it and when it reverts
+    assert img_changes[3:] == [frozenset({"bit_depth", "display_range"})] * 3
+
+
 def test_slice_name_attr() -> None:
     """Test that the slice name is set correctly."""
     assert _CameraSlice.slice_name == "_CameraSlice"  # pylint: disable=W0143
@@ -366,6 +1101,33 @@ def test_slice_name_attr() -> None:
     assert camera_slice.slice_name == "_CameraSlice"
 
 
+def test_deferred_slice_schema() -> None:
+    """Test that slice schemas are built on first use, not when the class is defined."""
+
+    class _DeferredSlice(rd.Slice):
+        value: int = 0
+
+    class _UnusedSlice(_DeferredSlice):
+        other: int = 0
+
+    assert not _DeferredSlice.__pydantic_complete__
+    assert _UnusedSlice.other == rd.build_path("_UnusedSlice", "other")
+    assert _UnusedSlice.value == rd.build_path("_UnusedSlice", "value")
+
+    class _DeferredStore(rd.Store):
+        deferred: _DeferredSlice
+
+    assert not _DeferredSlice.__pydantic_complete__
+    rd.create_store(
+        _DeferredStore.model_construct(deferred=_DeferredSlice.model_construct()),
+        recreate=True,
+    )
+    assert _DeferredSlice.__pydantic_complete__
+    assert not _UnusedSlice.__pydantic_complete__
+    with pytest.raises(ValueError):
+        _UnusedSlice(other="not an int")
+
+
 @pytest.mark.parametrize(
     "attr_path, state_path, state_value",
     [
@@ -612,3 +1374,14 @@ def test_invalid_get_state() -> None:
 
     with pytest.raises(RuntimeError):
         rd.get_state(rd.build_path("WrongSlice", "wrong_state"))
+
+
+def test_store_module_names() -> None:
+    """Test that the functions moved out of the store module can still be imported from it."""
+    assert rd.store.dispatch is rd.dispatch
+    assert rd.store.reduce is rd.reduce
+    assert rd.store.extra_reduce is rd.extra_reduce
+    assert rd.store.subscribe is rd.subscribe
+    assert rd.store.force_notify is rd.force_notify
+    with pytest.raises(AttributeError):
+        rd.store.wrong_name  # pylint: disable=W0104
@@ -0,0 +1,93 @@
+"""This module contains tests for redux.ring, ring buffers of samples."""
+
+# Access to protected members of ring buffers
+# pylint: disable=W0212
+# Unused argument fixtures
+# pylint: disable=W0613
+
+from __future__ import annotations
+
+import pickle
+from array import array
+
+import pytest
+
+import redux as rd
+
+
+class _RingSensorSlice(rd.Slice):
+    temperatures: rd.RingBuffer
+    unit: str
+
+
+class _RingStore(rd.Store):
+    sensor: _RingSensorSlice
+
+
+@pytest.fixture()
+def _store_with_sensor() -> None:
+    rd.create_store(
+        _RingStore(sensor=_RingSensorSlice(temperatures=rd.RingBuffer(4), unit="C")),
+        recreate=True,
+    )
+
+
+def test_ring_buffer() -> None:
+    """Test that versions share their array and keep their samples after later appends."""
+    empty = rd.RingBuffer(4)
+    first = empty.extend([1.0, 2.0, 3.0])
+    second = first.append(4.0).append(5.0)
+    assert not list(empty)
+    assert list(first) == [1.0, 2.0, 3.0]
+    assert list(second) == [2.0, 3.0, 4.0, 5.0]
+    assert second._storage is first._storage
+    assert second[-1] == 5.0 and second[1:3] == array("d", [3.0, 4.0])
+    assert second[::-2] == array("d", [5.0, 3.0])
+    assert second.since(first) == array("d", [4.0, 5.0])
+    assert second.total == 5
+
+    # appending to an older version does not overwrite the samples of the newer one
+    branch = first.append(-1.0)
+    assert branch._storage is not first._storage
+    assert list(branch) == [1.0, 2.0, 3.0, -1.0] and list(second) == [2.0, 3.0, 4.0, 5.0]
+
+    latest = second
+    for sample in range(6, 20):
+        latest = latest.append(float(sample))
+    assert list(latest) == [16.0, 17.0, 18.0, 19.0]
+    assert list(second) == [2.0, 3.0, 4.0, 5.0]
+    refilled = latest.extend(range(100))
+    assert list(refilled) == [96.0, 97.0, 98.0, 99.0] and refilled.total == 119
+    assert latest == pickle.loads(pickle.dumps(latest))
+    assert latest != rd.RingBuffer(4, [16.0, 17.0, 18.0, 19.0])
+    assert bytes(latest.view()) == latest[:].tobytes()
+    with pytest.raises(ValueError):
+        rd.RingBuffer(0)
+
+
+def test_ring_buffer_in_store(_store_with_sensor) -> None:
+    """Test appending samples through the store and receiving only the new ones."""
+    appended: list[list[float]] = []
+    buffers: list[rd.RingBuffer] = []
+    rd.subscribe_appends(_RingSensorSlice.temperatures)(
+        lambda samples: appended.append(samples.tolist())
+    )
+    rd.subscribe(_RingSensorSlice.temperatures)(buffers.append)
+
+    rd.dispatch_append(_RingSensorSlice.temperatures, [20.0, 20.5])
+    rd.dispatch_append(_RingSensorSlice.temperatures, (value for value in [21.0, 21.5, 22.0]))
+    rd.dispatch_append(_RingSensorSlice.temperatures, [])
+    assert appended == [[], [20.0, 20.5], [21.0, 21.5, 22.0]]
+    assert list(rd.get_state(_RingSensorSlice.temperatures)) == [20.5, 21.0, 21.5, 22.0]
+    assert buffers[1]._storage is buffers[2]._storage
+    with pytest.raises(TypeError):
+        rd.dispatch_append(_RingSensorSlice.unit, [1.0])
+
+    data = rd.get_slice(_RingSensorSlice).model_dump(mode="json")
+    assert data["temperatures"] == {
+        "capacity": 4,
+        "typecode": "d",
+        "samples": [20.5, 21.0, 21.5, 22.0],
+    }
+    restored = _RingSensorSlice.model_validate(data).temperatures
+    assert list(restored) == [20.5, 21.0, 21.5, 22.0] and restored.capacity == 4
@@ -0,0 +1,174 @@
+"""This module contains scaling and memory regression tests for large stores.
+
+Unlike the benchmarks, these tests assert on behavior: stores with many slices,
+subscriptions and long extra reducer chains must keep working, and repeated work must not
+keep memory alive.
+"""
+
+from __future__ import annotations
+
+import gc
+import tracemalloc
+import types
+from typing import Any, Callable
+
+import pytest
+from pydantic import create_model
+
+import redux as rd
+
+SLICE_COUNT = 1000
+SUBSCRIPTIONS_PER_SLICE = 100
+CHAIN_DEPTH = 100
+RUN_TO_COMPLETION_CHAIN_DEPTH = 2000
+# memory that repeated work may keep, for interpreter caches and allocator noise
+MAX_GROWTH = 256 * 1024
+
+
+def _make_slice(name: str, previous: type[rd.Slice] | None = None) -> type[rd.Slice]:
+    namespace: dict[str, Any] = {
+        "__module__": __name__,
+        "__annotations__": {"value": int},
+        "value": 0,
+    }
+    if previous is not None:
+
+        def follow(piece: Any, value: int) -> Any:
+            return piece.update([(rd.build_path(name, "value"), value)])
+
+        follow.__qualname__ = f"{name}.follow"
+        namespace["follow"] = rd.extra_reduce(getattr(previous, "value"))(follow)
+    return types.new_class(name, (rd.Slice,), exec_body=lambda ns: ns.update(namespace))
+
+
+def _make_store(name: str, slices: list[type[rd.Slice]]) -> rd.Store:
+    store_cls = create_model(  # type: ignore[call-overload]
+        name,
+        __base__=rd.Store,
+        **{f"slice{index}": (one_slice, ...) for index, one_slice in enumerate(slices)},
+    )
+    return store_cls(
+        **{f"slice{index}": one_slice(value=0) for index, one_slice in enumerate(slices)}
+    )
+
+
+_SLICES = [_make_slice(f"_ScaleSlice{index}") for index in range(SLICE_COUNT)]
+_STORE = _make_store("_ScaleStore", _SLICES)
+
+_CHAIN: list[type[rd.Slice]] = []
+for _index in range(RUN_TO_COMPLETION_CHAIN_DEPTH):
+    _CHAIN.append(_make_slice(f"_ChainSlice{_index}", _CHAIN[-1] if _CHAIN else None))
+_SHORT_CHAIN_STORE = _make_store("_ShortChainStore", _CHAIN[:CHAIN_DEPTH])
+_LONG_CHAIN_STORE = _make_store("_LongChainStore", _CHAIN)
+
+
+def _memory_growth(step: Callable[[], None], repeat: int) -> int:
+    """Run `step` once to warm up, then `repeat` times, and return the memory it kept."""
+    tracemalloc.start()
+    try:
+        # objects replaced by the steps must have been allocated while tracing
+        step()
+        gc.collect()
+        before = tracemalloc.get_traced_memory()[0]
+        for _ in range(repeat):
+            step()
+        gc.collect()
+        return tracemalloc.get_traced_memory()[0] - before
+    finally:
+        tracemalloc.stop()
+
+
+@pytest.fixture()
+def _large_store() -> None:
+    rd.create_store(_STORE, recreate=True)
+
+
+def test_many_subscriptions(_large_store) -> None:
+    """Test a store with a thousand slices and a hundred thousand subscriptions."""
+    calls = [0] * SLICE_COUNT
+
+    def make_callback(index: int) -> Callable[[int], None]:
+        def callback(_: int) -> None:
+            calls[index] += 1
+
+        return callback
+
+    unsubscribes = [
+        rd.subscribe(one_slice.value)(make_callback(index))
+        for index, one_slice in enumerate(_SLICES)
+        for _ in range(SUBSCRIPTIONS_PER_SLICE)
+    ]
+    for one_slice in _SLICES:
+        rd.dispatch_state(one_slice.value, 1)
+    assert calls == [2 * SUBSCRIPTIONS_PER_SLICE] * SLICE_COUNT
+
+    for unsubscribe in unsubscribes:
+        unsubscribe()
+    assert not rd.store.SUBSCRIPTIONS
+    for one_slice in _SLICES:
+        rd.dispatch_state(one_slice.value, 2)
+    assert calls == [2 * SUBSCRIPTIONS_PER_SLICE] * SLICE_COUNT
+
+
+def test_recreate_store_does_not_leak(_large_store) -> None:
+    """Test that subscriptions to a store are released when it is recreated."""
+
+    def step() -> None:
+        rd.create_store(_STORE, recreate=True, notify=False)
+        for one_slice in _SLICES:
+            rd.subscribe(one_slice.value)(lambda _: None)
+
+    assert _memory_growth(step, repeat=10) < MAX_GROWTH
+
+
+def test_subscription_churn_does_not_leak(_large_store) -> None:
+    """Test that unsubscribing releases every subscription."""
+
+    def step() -> None:
+        unsubscribes = [
+            rd.subscribe(one_slice.value)(lambda _: None)
+            for one_slice in _SLICES
+            for _ in range(10)
+        ]
+        for unsubscribe in unsubscribes:
+            unsubscribe()
+
+    assert _memory_growth(step, repeat=3) < MAX_GROWTH
+    assert not rd.store.SUBSCRIPTIONS
+
+
+def test_sustained_dispatch_does_not_leak(_large_store) -> None:
+    """Test that dispatching keeps a bounded amount of history."""
+    setters = [rd.setter(one_slice.value) for one_slice in _SLICES]
+    for one_slice in _SLICES[::10]:
+        rd.subscribe(one_slice.value)(lambda _: None)
+    values = iter(range(10**9))
+
+    def step() -> None:
+        value = next(values)
+        for set_value in setters:
+            set_value(value)
+
+    assert _memory_growth(step, repeat=10) < MAX_GROWTH
+
+
+@pytest.mark.parametrize(
+    ("store", "depth", "run_to_completion"),
+    [
+        (_SHORT_CHAIN_STORE, CHAIN_DEPTH, False),
+        (_LONG_CHAIN_STORE, RUN_TO_COMPLETION_CHAIN_DEPTH, True),
+    ],
+)
+def test_deep_extra_reduce_chain(store: rd.Store, depth: int, run_to_completion: bool) -> None:
+    """Test that a dispatch cascades through a long chain of extra reducers."""
+    rd.create_store(store, recreate=True, run_to_completion=run_to_completion)
+    last_values: list[int] = []
+    rd.subscribe(_CHAIN[depth - 1].value)(last_values.append)
+    values = iter(range(1, 10**9))
+
+    def step() -> None:
+        rd.dispatch_state(_CHAIN[0].value, next(values))
+
+    assert _memory_growth(step, repeat=5) < MAX_GROWTH
+    assert last_values == list(range(7))
+    assert rd.get_state(_CHAIN[depth - 1].value) == 6
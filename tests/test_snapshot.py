@@ -0,0 +1,108 @@
+"""This module contains tests for `redux.snapshot`, consistent reads from other threads."""
+
+# Unused argument fixtures
+# pylint: disable=W0613
+
+from __future__ import annotations
+
+import threading
+
+import pytest
+
+import redux as rd
+
+
+class _SnapshotSourceSlice(rd.Slice):
+    value: int
+
+
+class _SnapshotMirrorSlice(rd.Slice):
+    negated: int
+
+    @rd.extra_reduce(_SnapshotSourceSlice.value)
+    def follow_value(piece: _SnapshotMirrorSlice, value: int) -> _SnapshotMirrorSlice:
+        """negate the value of the source"""
+        return piece.update([(_SnapshotMirrorSlice.negated, -value)])
+
+
+class _SnapshotStore(rd.Store):
+    source: _SnapshotSourceSlice
+    mirror: _SnapshotMirrorSlice
+
+
+@pytest.fixture()
+def _store_with_mirror() -> None:
+    rd.create_store(
+        _SnapshotStore(
+            source=_SnapshotSourceSlice(value=0), mirror=_SnapshotMirrorSlice(negated=0)
+        ),
+        recreate=True,
+    )
+
+
+def test_snapshot(_store_with_mirror) -> None:
+    """Test that snapshots are published at the end of each dispatch and never change."""
+    before = rd.snapshot()
+    during: list[tuple[int, int]] = []
+
+    def read_snapshot(_: int) -> None:
+        view = rd.snapshot()
+        during.append((view.get_state(_SnapshotSourceSlice.value), view.revision))
+
+    rd.subscribe(_SnapshotMirrorSlice.negated)(read_snapshot)
+    rd.dispatch_state(_SnapshotSourceSlice.value, 3)
+
+    after = rd.snapshot()
+    assert before.get_state(_SnapshotSourceSlice.value) == 0
+    assert after.get_state(_SnapshotSourceSlice.value) == 3
+    assert after.get_slice(_SnapshotMirrorSlice) == _SnapshotMirrorSlice(negated=-3)
+    assert after.revision == rd.get_revision()
+    # the cascade is still in progress when the mirror notifies
+    assert during == [(0, before.revision), (0, before.revision)]
+    assert rd.snapshot() is after
+    with pytest.raises(KeyError):
+        after.get_state(rd.build_path("_SnapshotSourceSlice", "wrong_state"))
+
+
+def test_snapshot_from_reader_threads(_store_with_mirror) -> None:
+    """Test that reader threads only see states from the same dispatch."""
+    stop = threading.Event()
+    mismatches: list[tuple[int, int]] = []
+
+    def read() -> None:
+        while not stop.is_set():
+            view = rd.snapshot()
+            value = view.get_state(_SnapshotSourceSlice.value)
+            negated = view.get_state(_SnapshotMirrorSlice.negated)
+            if value != -negated:
+                mismatches.append((value, negated))
+
+    readers = [threading.Thread(target=read) for _ in range(4)]
+    for reader in readers:
+        reader.start()
+    try:
+        for value in range(1, 2000):
+            rd.dispatch_state(_SnapshotSourceSlice.value, value)
+    finally:
+        stop.set()
+        for reader in readers:
+            reader.join()
+    assert not mismatches
+    assert rd.snapshot().get_state(_SnapshotMirrorSlice.negated) == -1999
+
+
+def test_snapshot_of_many_slices(_store_with_mirror) -> None:
+    """Test that snapshots stay consistent when more slices change than they keep apart."""
+    counters = [
+        type(f"_SnapshotCounter{i}Slice", (rd.Slice,), {"__annotations__": {"value": int}})
+        for i in range(150)
+    ]
+    for counter in counters:
+        rd.inject_slice(counter(value=0))
+    views = [rd.snapshot()]
+    for counter in counters:
+        rd.dispatch_state(rd.build_path(counter.__name__, "value"), 1)
+        views.append(rd.snapshot())
+    for index, view in enumerate(views):
+        values = [view.get_state(rd.build_path(c.__name__, "value")) for c in counters]
+        assert values == [1] * index + [0] * (len(counters) - index)
@@ -0,0 +1,190 @@
+"""This module contains tests for redux.sync, store synchronization over a Unix socket."""
+
+# Redefining name from outer scope (fixtures)
+# pylint: disable=W0621
+
+from __future__ import annotations
+
+import socket
+import sys
+from pathlib import Path
+from typing import Any, Iterator
+
+import pytest
+
+import redux as rd
+
+pytestmark = pytest.mark.skipif(
+    not hasattr(socket, "AF_UNIX"), reason="Unix sockets are not available"
+)
+
+
+class _SyncBaseSlice(rd.Slice):
+    name: str
+
+
+class _SyncSlice(_SyncBaseSlice):
+    exposure: float
+    roi: tuple[int, int]
+
+    @rd.reduce
+    def set_exposure(piece: _SyncSlice, exposure: float) -> _SyncSlice:
+        """set exposure"""
+        return piece.update([(_SyncSlice.exposure, exposure)])
+
+
+class _SyncCounterSlice(rd.Slice):
+    count: int
+
+    @rd.computed("count")
+    def doubled(self) -> int:
+        """double of the count"""
+        return self.count * 2
+
+    @rd.reduce
+    def increment(piece: _SyncCounterSlice) -> _SyncCounterSlice:
+        """increment the count"""
+        return piece.update([(_SyncCounterSlice.count, piece.count + 1)])
+
+
+class _SyncStore(rd.Store):
+    sync: _SyncSlice
+    counter: _SyncCounterSlice
+
+
+class _SyncLazySlice(rd.Slice):
+    frames: int
+    label: str
+
+
+class _SyncLazyStore(rd.Store):
+    counter: _SyncCounterSlice
+    history: _SyncLazySlice = rd.lazy(lambda: _SyncLazySlice(frames=0, label="history"))
+
+
+@pytest.fixture()
+def server(tmp_path: Path) -> Iterator[rd.sync.StoreServer]:
+    """Serve a freshly created store."""
+    rd.create_store(
+        _SyncStore(
+            sync=_SyncSlice(name="cam", exposure=1.0, roi=(0, 0)),
+            counter=_SyncCounterSlice(count=0),
+        ),
+        recreate=True,
+    )
+    with rd.serve(tmp_path / "store.sock") as store_server:
+        yield store_server
+
+
+def test_client_mirrors_snapshot(server: rd.sync.StoreServer) -> None:
+    """Test that a client receives the whole store on connect."""
+    with rd.connect(server.path) as client:
+        assert client.revision == rd.store.REVISION
+        assert client.get_state(_SyncSlice.exposure) == 1.0
+        assert client.get_state(_SyncBaseSlice.name) == "cam"
+        with pytest.raises(KeyError):
+            client.get_state(rd.build_path("_SyncSlice", "wrong_state"))
+
+
+def test_client_receives_deltas(server: rd.sync.StoreServer) -> None:
+    """Test that a client only receives the states that changed."""
+    deltas: list[tuple[str, dict[str, Any], int]] = []
+    with rd.connect(server.path) as client:
+        client.subscribe(lambda *delta: deltas.append(delta))
+        rd.dispatch_state(_SyncSlice.roi, (1, 2))
+        rd.dispatch_state(_SyncSlice.roi, (1, 2))  # no change, no delta
+        rd.dispatch(_SyncSlice.set_exposure, 2.0)
+
+        assert client.wait_for_revision(rd.store.REVISION, timeout=5)
+        assert client.get_state(_SyncSlice.roi) == [1, 2]
+        assert client.get_state(_SyncSlice.exposure) == 2.0
+        revision = rd.store.REVISION
+        assert deltas == [
+            ("_SyncSlice", {"roi": [1, 2]}, revision - 1),
+            ("_SyncSlice", {"exposure": 2.0}, revision),
+        ]
+
+
+def test_client_mirrors_computed_states(server: rd.sync.StoreServer) -> None:
+    """Test that computed states are mirrored, without subscribers on the server."""
+    with rd.connect(server.path) as client:
+        assert client.get_state(_SyncCounterSlice.doubled) == 0
+        rd.dispatch(_SyncCounterSlice.increment)
+        assert client.wait_for_revision(rd.store.REVISION, timeout=5)
+        assert client.get_state(_SyncCounterSlice.count) == 1
+        assert client.get_state(_SyncCounterSlice.doubled) == 2
+
+
+def test_client_forwards_dispatches(server: rd.sync.StoreServer) -> None:
+    """Test that dispatches sent by a client are applied to the served store."""
+    with rd.connect(server.path) as client:
+        revision = client.revision
+        client.dispatch_state(_SyncSlice.roi, (3, 4))
+        assert client.wait_for_revision(revision + 1, timeout=5)
+        assert rd.get_state(_SyncSlice.roi) == (3, 4)
+
+        client.dispatch(_SyncSlice.set_exposure, 5.0)
+        assert client.wait_for_revision(revision + 2, timeout=5)
+        assert rd.get_state(_SyncSlice.exposure) == 5.0
+        assert client.get_state(_SyncSlice.exposure) == 5.0
+
+
+def test_client_receives_errors(server: rd.sync.StoreServer) -> None:
+    """Test that invalid forwarded dispatches are reported back to the client."""
+    with rd.connect(server.path) as client:
+        revision = client.revision
+        client.dispatch_state(_SyncSlice.roi, "not a roi")
+        client.dispatch("_SyncSlice.not_a_reducer")
+        client.dispatch_state(_SyncSlice.exposure, 6.0)
+        assert client.wait_for_revision(revision + 1, timeout=5)
+        assert len(client.errors) == 2
+        assert rd.get_state(_SyncSlice.roi) == (0, 0)
+
+
+def test_clients_dispatch_one_at_a_time(server: rd.sync.StoreServer) -> None:
+    """Test that dispatches forwarded by several clients do not run concurrently."""
+    switch_interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-5)
+    clients = [rd.connect(server.path) for _ in range(4)]
+    try:
+        revision = rd.store.REVISION
+        for _ in range(500):
+            for client in clients:
+                client.dispatch(_SyncCounterSlice.increment)
+        assert clients[0].wait_for_revision(revision + 2000, timeout=10)
+        assert rd.get_state(_SyncCounterSlice.count) == 2000
+        assert not any(client.errors for client in clients)
+    finally:
+        sys.setswitchinterval(switch_interval)
+        for client in clients:
+            client.close()
+
+
+def test_client_mirrors_lazy_slices(tmp_path: Path) -> None:
+    """Test that connecting does not load lazy slices, which are sent whole once loaded."""
+    rd.create_store(_SyncLazyStore(counter=_SyncCounterSlice(count=0)), recreate=True)
+    with rd.serve(tmp_path / "store.sock") as store_server:
+        with rd.connect(store_server.path) as client:
+            assert set(rd.store.STORE) == {"_SyncCounterSlice"}
+            with pytest.raises(KeyError):
+                client.get_state(_SyncLazySlice.frames)
+            rd.dispatch_state(_SyncLazySlice.frames, 1)
+            assert client.wait_for_revision(rd.store.REVISION, timeout=5)
+            assert client.get_state(_SyncLazySlice.frames) == 1
+            assert client.get_state(_SyncLazySlice.label) == "history"
+
+
+def test_slow_client_is_disconnected(
+    server: rd.sync.StoreServer, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test that a client not reading its messages is disconnected instead of queuing them."""
+    monkeypatch.setattr(rd.sync, "_MAX_OUTBOX", 4)
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:  # pylint: disable=E1101
+        sock.connect(server.path)
+        with rd.connect(server.path):  # the slow client is connected once this one is
+            pass
+        connection = server._connections[0]  # pylint: disable=W0212
+        for index in range(100):
+            rd.dispatch_state(_SyncBaseSlice.name, f"{index}" * 100_000)
+        assert connection.closed
+        assert connection.outbox.qsize() <= 4
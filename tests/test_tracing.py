@@ -0,0 +1,100 @@
+"""This module contains tests for redux.tracing, dispatch traces in Chrome trace format."""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+import redux as rd
+
+
+class _TraceSourceSlice(rd.Slice):
+    value: int = 0
+
+    @rd.reduce
+    def set_value(piece: _TraceSourceSlice, value: int) -> _TraceSourceSlice:
+        """set value"""
+        if value < 0:
+            raise ValueError("negative value")
+        return piece.update([(_TraceSourceSlice.value, value)])
+
+
+class _TraceFollowerSlice(rd.Slice):
+    value_copy: int = 0
+
+    @rd.extra_reduce(_TraceSourceSlice.value)
+    def follow_value(piece: _TraceFollowerSlice, value: int) -> _TraceFollowerSlice:
+        """copy the value of the source"""
+        return piece.update([(_TraceFollowerSlice.value_copy, value)])
+
+
+class _TraceStore(rd.Store):
+    source: _TraceSourceSlice
+    follower: _TraceFollowerSlice
+
+
+def _contains(outer: dict[str, Any], inner: dict[str, Any]) -> bool:
+    return (
+        outer["ts"] <= inner["ts"]
+        and inner["ts"] + inner["dur"] <= outer["ts"] + outer["dur"] + 1e-3
+    )
+
+
+def test_trace_dispatch(tmp_path: Path) -> None:
+    """Test that a dispatch and the cascade it causes are written as nested spans."""
+    rd.create_store(
+        _TraceStore(
+            source=_TraceSourceSlice(value=0), follower=_TraceFollowerSlice(value_copy=0)
+        ),
+        recreate=True,
+    )
+
+    def on_value_copy(value_copy: int) -> None:
+        assert value_copy >= 0
+
+    rd.subscribe(_TraceFollowerSlice.value_copy)(on_value_copy)
+    with rd.trace(tmp_path / "trace.json"):
+        rd.dispatch(_TraceSourceSlice.set_value, 3)
+    rd.dispatch_state(_TraceSourceSlice.value, 4)  # not traced
+
+    events = json.loads((tmp_path / "trace.json").read_text())["traceEvents"]
+    spans = {(event["cat"], event["name"]): event for event in events}
+    assert len(events) == len(spans) == 7
+    dispatch = spans[("dispatch", "dispatch _TraceSourceSlice.set_value")]
+    assert dispatch["args"] == {"payload": 3}
+    assert spans[("commit", "detect changes _TraceSourceSlice")]["args"] == {
+        "changed": ["value"]
+    }
+    extra_reducer = spans[("subscriber", "_TraceFollowerSlice.follow_value")]
+    assert extra_reducer["args"] == {"state": "_TraceSourceSlice.value"}
+    assert _contains(dispatch, spans[("reducer", "_TraceSourceSlice.set_value")])
+    assert _contains(dispatch, extra_reducer)
+    for key in (
+        ("reducer", "_TraceFollowerSlice.follow_value"),
+        ("commit", "detect changes _TraceFollowerSlice"),
+        ("subscriber", "test_trace_dispatch.<locals>.on_value_copy"),
+    ):
+        assert _contains(extra_reducer, spans[key])
+
+
+def test_trace_rollback() -> None:
+    """Test that failed dispatches record the error and the rollback."""
+    rd.create_store(
+        _TraceStore(
+            source=_TraceSourceSlice(value=0), follower=_TraceFollowerSlice(value_copy=0)
+        ),
+        recreate=True,
+    )
+    with rd.trace() as tracer:
+        with pytest.raises(ValueError):
+            rd.dispatch(_TraceSourceSlice.set_value, -1)
+        with pytest.raises(RuntimeError):
+            with rd.trace():
+                pass
+    spans = {event["name"]: event for event in tracer.events if event["cat"] != "reducer"}
+    assert "negative value" in spans["dispatch _TraceSourceSlice.set_value"]["args"]["error"]
+    assert spans["rollback"]["cat"] == "rollback"
+    assert rd.store._TRACER is None  # pylint: disable=W0212